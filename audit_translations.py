@@ -2,20 +2,204 @@
 """
 Comprehensive Language Translation Audit Script
 Analyzes translations in languages.json for completeness, consistency, and quality
+
+Every language is flattened once into a key -> {lang: value} table; each
+language is then audited in a single pass over that table. Placeholders,
+HTML tags and problem characters are extracted by precompiled scanners,
+memoized per string since many values repeat across languages.
+
+With --json the audit is also written as a machine-readable report. With
+--incremental the previous report is read back first: only keys whose
+English or target value changed since then are re-audited, the rest keep
+their recorded issues, and the output focuses on new and resolved issues.
+
+Usage:
+    python audit_translations.py
+    python audit_translations.py path/to/languages.json
+    python audit_translations.py --json translation_audit.json
+    python audit_translations.py --json translation_audit.json --incremental
 """
 
+import argparse
+import hashlib
 import json
+import os
 import re
-from typing import Dict, List, Set, Tuple
-from collections import defaultdict
+import sys
+from collections import defaultdict, deque
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).parent
+DEFAULT_CONFIG = ROOT_DIR / '_config' / 'languages.json'
+
+# Bump when a check changes, so incremental runs don't reuse stale results
+AUDIT_VERSION = '1'
+
+ISSUE_CATEGORIES = [
+    'missing_keys', 'extra_keys', 'empty_translations', 'identical_to_english',
+    'placeholder_mismatch', 'html_tag_mismatch', 'special_characters',
+]
+
+# Each scanner runs over the whole value, so tokens nest: a placeholder
+# inside a tag (<a href="{url}">) and a control character inside a tag or
+# placeholder are still found. Within a scanner ${...} wins over {...}.
+TAG_RE = re.compile(r"(?P<tag><[^>]+>)")
+
+PLACEHOLDER_RE = re.compile(r"""
+    (?P<template>\$\{[^}]*\})     # ${placeholder}
+  | (?P<brace>\{[^}]*\})          # {placeholder}
+  | (?P<printf>%[a-z])            # %s, %d, ...
+""", re.VERBOSE)
+
+SPECIAL_RE = re.compile(r"(?P<control>[\u0000-\u001F])|(?P<separator>[\u2028\u2029])")
+
+TOKEN_SCANNERS = (TAG_RE, PLACEHOLDER_RE, SPECIAL_RE)
+
+PLACEHOLDER_KINDS = ('printf', 'brace', 'template')
+
+SPECIAL_CHARACTERS = {
+    'control': 'control characters',
+    'separator': 'line/paragraph separators',
+}
+
+# Values that should remain in English
+SKIP_RE = re.compile(
+    r'https?://'         # URLs
+    r'|@'                # Email addresses
+    r'|\+?\d'            # Phone numbers
+    r'|TVMaster VIP$'    # Brand name
+    r'|24/7'             # Time format
+    r'|\d{4}$'           # Years
+    r'|[A-Z]{2,}$'       # Acronyms like FAQ, IPTV, 4K
+)
+
+# Common English phrases that might indicate untranslated content
+ENGLISH_INDICATORS = [
+    'Premium IPTV Service', 'Start Streaming', 'All rights reserved',
+    'Live Hub', 'TV Guide', 'Setup Guides', 'Global Support',
+]
+
+
+@lru_cache(maxsize=None)
+def scan_tokens(text: str) -> Dict[str, Tuple[str, ...]]:
+    """All tokens of text by kind ({'tag': ('<b>', '</b>'), ...}), memoized"""
+    tokens = defaultdict(list)
+    for scanner in TOKEN_SCANNERS:
+        for match in scanner.finditer(text):
+            tokens[match.lastgroup].append(match.group())
+    return {kind: tuple(values) for kind, values in tokens.items()}
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over lowercased phrases: finds whether any phrase
+    occurs in a text in one scan, however many phrases there are.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [False]
+
+        for phrase in phrases:
+            state = 0
+            for char in phrase.lower():
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(False)
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state] = True
+
+        # Breadth-first failure links
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] = self.output[next_state] or self.output[self.fail[next_state]]
+
+    def search(self, text: str) -> bool:
+        """True if any phrase occurs in text (case-insensitive)"""
+        state = 0
+        for char in text.lower():
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            if self.output[state]:
+                return True
+        return False
+
+
+ENGLISH_MATCHER = PhraseMatcher(ENGLISH_INDICATORS)
+
+
+def value_digest(value) -> str:
+    """Short digest of a table cell (nested objects only matter for structure)"""
+    if isinstance(value, dict):
+        return 'object'
+    encoded = json.dumps(value, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def issue_key(item) -> str:
+    """The config key an issue entry is about"""
+    return item if isinstance(item, str) else item['key']
+
+
+def load_report(path: str) -> Optional[Dict]:
+    """Load a previous JSON report; None if missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def contains_english_phrase(text: str) -> bool:
+    """Memoized: does text contain a common English phrase?"""
+    return not SKIP_RE.match(text) and ENGLISH_MATCHER.search(text)
+
 
 class TranslationAuditor:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, previous_report: Optional[Dict] = None):
         self.file_path = file_path
         self.data = None
         self.reference_lang = 'en'
         self.issues = defaultdict(lambda: defaultdict(list))
         self.stats = defaultdict(dict)
+        self.table = {}
+        self.digests = defaultdict(dict)
+        self.previous_digests = {}
+        self.previous_issues = {}
+        self.incremental = False
+
+        if previous_report:
+            self.load_previous(previous_report)
+
+    def load_previous(self, report: Dict):
+        """Index a previous report's issues by language and key, if still compatible"""
+        if (report.get('audit_version') != AUDIT_VERSION or
+                report.get('reference_language') != self.reference_lang):
+            return
+
+        self.incremental = True
+        self.previous_digests = report.get('digests', {})
+        for lang_code, lang_report in report.get('languages', {}).items():
+            by_key = defaultdict(list)
+            for category, items in lang_report.get('issues', {}).items():
+                for item in items:
+                    by_key[issue_key(item)].append((category, item))
+            self.previous_issues[lang_code] = by_key
 
     def load_data(self):
         """Load and validate JSON syntax"""
@@ -28,207 +212,167 @@ class TranslationAuditor:
             print(f"✗ JSON syntax error: {e}")
             return False
 
-    def get_all_keys(self, obj, prefix=''):
-        """Recursively get all keys in a nested dictionary"""
-        keys = set()
+    def flatten(self, obj, prefix='', out=None) -> Dict[str, object]:
+        """Flatten a nested dictionary into {dotted.key: value}, in document order"""
+        if out is None:
+            out = {}
         if isinstance(obj, dict):
             for key, value in obj.items():
                 full_key = f"{prefix}.{key}" if prefix else key
-                keys.add(full_key)
+                out[full_key] = value
                 if isinstance(value, dict):
-                    keys.update(self.get_all_keys(value, full_key))
-        return keys
-
-    def get_nested_value(self, obj, path):
-        """Get value from nested dictionary using dot notation"""
-        keys = path.split('.')
-        value = obj
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return None
-        return value
-
-    def check_structure(self, lang_code: str, lang_data: Dict) -> Tuple[Set, Set]:
-        """Check if language has all required keys from reference language"""
-        ref_data = self.data['languages'][self.reference_lang]
-
-        ref_keys = self.get_all_keys(ref_data)
-        lang_keys = self.get_all_keys(lang_data)
+                    self.flatten(value, full_key, out)
+        return out
+
+    def build_table(self):
+        """
+        Flatten every language once into a key -> {lang: value} table.
+        Reference keys come first, so checks walk keys in English order.
+        """
+        self.table = {}
+        languages = self.data['languages']
+        order = [self.reference_lang] + [k for k in languages if k != self.reference_lang]
+        for lang_code in order:
+            for key, value in self.flatten(languages[lang_code]).items():
+                self.table.setdefault(key, {})[lang_code] = value
+                self.digests[lang_code][key] = value_digest(value)
+        return self.table
+
+    def key_changed(self, lang_code: str, key: str) -> bool:
+        """Did the reference or target value of key change since the previous report?"""
+        for lang in (self.reference_lang, lang_code):
+            previous = self.previous_digests.get(lang, {}).get(key)
+            if previous != self.digests[lang].get(key):
+                return True
+        return False
 
-        missing_keys = ref_keys - lang_keys
-        extra_keys = lang_keys - ref_keys
+    def check_structure(self, lang_code: str, key: str, row: Dict):
+        """Check if language has all required keys from reference language"""
+        in_ref = self.reference_lang in row
+        in_lang = lang_code in row
 
-        return missing_keys, extra_keys
+        if in_ref and not in_lang:
+            self.issues[lang_code]['missing_keys'].append(key)
+        elif in_lang and not in_ref:
+            self.issues[lang_code]['extra_keys'].append(key)
 
     def is_likely_untranslated(self, text: str, lang_code: str) -> bool:
         """Check if text appears to be untranslated (still in English)"""
-        if not isinstance(text, str) or not text:
+        if not isinstance(text, str) or not text or lang_code == self.reference_lang:
             return False
 
-        # Skip certain fields that should remain in English
-        skip_patterns = [
-            r'^https?://',  # URLs
-            r'@',  # Email addresses
-            r'^\+?\d',  # Phone numbers
-            r'^TVMaster VIP$',  # Brand name
-            r'^24/7',  # Time format
-            r'^\d{4}$',  # Years
-            r'^[A-Z]{2,}$',  # Acronyms like FAQ, IPTV, 4K
-        ]
-
-        for pattern in skip_patterns:
-            if re.match(pattern, text):
-                return False
-
-        # Common English phrases that might indicate untranslated content
-        english_indicators = [
-            'Premium IPTV Service', 'Start Streaming', 'All rights reserved',
-            'Live Hub', 'TV Guide', 'Setup Guides', 'Global Support',
-        ]
-
-        # Check for exact matches of common English phrases (only for suspicious cases)
-        for indicator in english_indicators:
-            if indicator.lower() in text.lower() and lang_code != 'en':
-                # Additional check: if the text is exactly the English version
-                return True
+        return contains_english_phrase(text)
 
-        return False
-
-    def check_translations(self, lang_code: str, lang_data: Dict):
+    def check_translations(self, lang_code: str, key: str, ref_value, lang_value):
         """Check for missing, empty, or suspicious translations"""
-        ref_data = self.data['languages'][self.reference_lang]
-        ref_keys = self.get_all_keys(ref_data)
-
-        for key in ref_keys:
-            ref_value = self.get_nested_value(ref_data, key)
-            lang_value = self.get_nested_value(lang_data, key)
-
-            # Skip non-string values
-            if not isinstance(ref_value, str):
-                continue
-
-            # Check for empty strings
-            if lang_value is not None and isinstance(lang_value, str):
-                if lang_value.strip() == '':
-                    self.issues[lang_code]['empty_translations'].append(key)
-
-                # Check if value is identical to English (suspicious for content fields)
-                elif lang_value == ref_value and lang_code != self.reference_lang:
-                    # Some fields should be identical (URLs, emails, etc.)
-                    if not any(x in key for x in ['url', 'email', 'phone', 'author', 'name', 'hreflang', 'locale', 'path', 'dir']):
-                        self.issues[lang_code]['identical_to_english'].append({
-                            'key': key,
-                            'value': lang_value[:100] + ('...' if len(lang_value) > 100 else '')
-                        })
-
-    def check_placeholders(self, lang_code: str, lang_data: Dict):
-        """Check for placeholder consistency"""
-        ref_data = self.data['languages'][self.reference_lang]
-        ref_keys = self.get_all_keys(ref_data)
-
-        placeholder_patterns = [
-            r'%s', r'%d', r'%[a-z]',  # printf-style
-            r'\{[^}]*\}',  # {placeholder}
-            r'\$\{[^}]*\}',  # ${placeholder}
-        ]
-
-        for key in ref_keys:
-            ref_value = self.get_nested_value(ref_data, key)
-            lang_value = self.get_nested_value(lang_data, key)
-
-            if not isinstance(ref_value, str) or not isinstance(lang_value, str):
-                continue
+        # Skip non-string values
+        if not isinstance(ref_value, str):
+            return
 
-            for pattern in placeholder_patterns:
-                ref_placeholders = re.findall(pattern, ref_value)
-                lang_placeholders = re.findall(pattern, lang_value) if lang_value else []
+        # Check for empty strings
+        if lang_value is not None and isinstance(lang_value, str):
+            if lang_value.strip() == '':
+                self.issues[lang_code]['empty_translations'].append(key)
 
-                if ref_placeholders and ref_placeholders != lang_placeholders:
-                    self.issues[lang_code]['placeholder_mismatch'].append({
+            # Check if value is identical to English (suspicious for content fields)
+            elif lang_value == ref_value and lang_code != self.reference_lang:
+                # Some fields should be identical (URLs, emails, etc.)
+                if not any(x in key for x in ['url', 'email', 'phone', 'author', 'name', 'hreflang', 'locale', 'path', 'dir']):
+                    self.issues[lang_code]['identical_to_english'].append({
                         'key': key,
-                        'expected': ref_placeholders,
-                        'found': lang_placeholders
+                        'value': lang_value[:100] + ('...' if len(lang_value) > 100 else '')
                     })
 
-    def check_html_tags(self, lang_code: str, lang_data: Dict):
-        """Check for HTML tag consistency"""
-        ref_data = self.data['languages'][self.reference_lang]
-        ref_keys = self.get_all_keys(ref_data)
+    def check_placeholders(self, lang_code: str, key: str, ref_tokens: Dict, lang_tokens: Dict):
+        """Check for placeholder consistency"""
+        for kind in PLACEHOLDER_KINDS:
+            ref_placeholders = ref_tokens.get(kind, ())
+            lang_placeholders = lang_tokens.get(kind, ())
 
-        for key in ref_keys:
-            ref_value = self.get_nested_value(ref_data, key)
-            lang_value = self.get_nested_value(lang_data, key)
+            if ref_placeholders and ref_placeholders != lang_placeholders:
+                self.issues[lang_code]['placeholder_mismatch'].append({
+                    'key': key,
+                    'expected': list(ref_placeholders),
+                    'found': list(lang_placeholders)
+                })
 
-            if not isinstance(ref_value, str) or not isinstance(lang_value, str):
-                continue
+    def check_html_tags(self, lang_code: str, key: str, ref_tokens: Dict, lang_tokens: Dict):
+        """Check for HTML tag consistency"""
+        ref_tags = sorted(ref_tokens.get('tag', ()))
+        lang_tags = sorted(lang_tokens.get('tag', ()))
 
-            # Find HTML tags
-            ref_tags = sorted(re.findall(r'<[^>]+>', ref_value))
-            lang_tags = sorted(re.findall(r'<[^>]+>', lang_value)) if lang_value else []
+        if ref_tags and ref_tags != lang_tags:
+            self.issues[lang_code]['html_tag_mismatch'].append({
+                'key': key,
+                'expected': ref_tags,
+                'found': lang_tags
+            })
 
-            if ref_tags and ref_tags != lang_tags:
-                self.issues[lang_code]['html_tag_mismatch'].append({
+    def check_special_characters(self, lang_code: str, key: str, lang_tokens: Dict):
+        """Check for special characters that might cause issues"""
+        for kind, desc in SPECIAL_CHARACTERS.items():
+            if kind in lang_tokens:
+                self.issues[lang_code]['special_characters'].append({
                     'key': key,
-                    'expected': ref_tags,
-                    'found': lang_tags
+                    'issue': desc
                 })
 
-    def check_special_characters(self, lang_code: str, lang_data: Dict):
-        """Check for special characters that might cause issues"""
-        ref_keys = self.get_all_keys(lang_data)
+    def audit_key(self, lang_code: str, key: str, row: Dict):
+        """Run every check for one key of one language"""
+        ref_value = row.get(self.reference_lang)
+        lang_value = row.get(lang_code)
 
-        problematic_chars = [
-            (r'[\u0000-\u001F]', 'control characters'),
-            (r'[\u2028\u2029]', 'line/paragraph separators'),
-        ]
+        # Check structure
+        self.check_structure(lang_code, key, row)
 
-        for key in ref_keys:
-            value = self.get_nested_value(lang_data, key)
+        if not isinstance(lang_value, str):
+            return
+        lang_tokens = scan_tokens(lang_value)
 
-            if not isinstance(value, str):
-                continue
+        if isinstance(ref_value, str):
+            # Check translations, placeholders and HTML tags
+            ref_tokens = scan_tokens(ref_value)
+            self.check_translations(lang_code, key, ref_value, lang_value)
+            self.check_placeholders(lang_code, key, ref_tokens, lang_tokens)
+            self.check_html_tags(lang_code, key, ref_tokens, lang_tokens)
 
-            for pattern, desc in problematic_chars:
-                if re.search(pattern, value):
-                    self.issues[lang_code]['special_characters'].append({
-                        'key': key,
-                        'issue': desc
-                    })
+        # Check special characters
+        self.check_special_characters(lang_code, key, lang_tokens)
 
     def audit_language(self, lang_code: str):
-        """Perform complete audit of a single language"""
+        """
+        Perform complete audit of a single language in one pass over the key table.
+        In incremental mode, unchanged keys keep their issues from the previous report.
+        """
         if lang_code == self.reference_lang:
             return
 
-        lang_data = self.data['languages'][lang_code]
+        previous = self.previous_issues.get(lang_code) if self.incremental else None
+        total_keys = 0
+        audited_keys = 0
+        for key, row in self.table.items():
+            if lang_code in row:
+                total_keys += 1
 
-        # Check structure
-        missing_keys, extra_keys = self.check_structure(lang_code, lang_data)
-        if missing_keys:
-            self.issues[lang_code]['missing_keys'] = sorted(list(missing_keys))
-        if extra_keys:
-            self.issues[lang_code]['extra_keys'] = sorted(list(extra_keys))
-
-        # Check translations
-        self.check_translations(lang_code, lang_data)
-
-        # Check placeholders
-        self.check_placeholders(lang_code, lang_data)
+            if previous is not None and not self.key_changed(lang_code, key):
+                for category, item in previous.get(key, ()):
+                    self.issues[lang_code][category].append(item)
+                continue
 
-        # Check HTML tags
-        self.check_html_tags(lang_code, lang_data)
+            audited_keys += 1
+            self.audit_key(lang_code, key, row)
 
-        # Check special characters
-        self.check_special_characters(lang_code, lang_data)
+        # Key lists are reported alphabetically
+        for category in ('missing_keys', 'extra_keys'):
+            if category in self.issues[lang_code]:
+                self.issues[lang_code][category].sort()
 
         # Calculate stats
-        total_keys = len(self.get_all_keys(lang_data))
         issue_count = sum(len(v) if isinstance(v, list) else 1 for v in self.issues[lang_code].values())
 
         self.stats[lang_code] = {
             'total_keys': total_keys,
+            'audited_keys': audited_keys,
             'issue_count': issue_count,
             'has_issues': issue_count > 0
         }
@@ -236,7 +380,8 @@ class TranslationAuditor:
     def run_audit(self):
         """Run complete audit on all languages"""
         if not self.load_data():
-            return
+            return False
+        self.build_table()
 
         languages = self.data['languages']
         print(f"Reference Language: {self.reference_lang} (English)")
@@ -249,11 +394,93 @@ class TranslationAuditor:
             if lang_code != self.reference_lang:
                 print(f"\nAuditing {lang_code} ({languages[lang_code]['name']})...")
                 self.audit_language(lang_code)
+                if self.incremental:
+                    stats = self.stats[lang_code]
+                    print(f"  Re-audited {stats['audited_keys']} of {len(self.table)} keys (others unchanged)")
+
+        if self.incremental:
+            self.print_changes()
+            self.print_report(details=False)
+        else:
+            self.print_report()
+        return True
+
+    def diff_issues(self, lang_code: str) -> Dict[str, List[Dict]]:
+        """New and resolved issues of a language compared to the previous report"""
+        def entries(pairs):
+            return {json.dumps([category, item], sort_keys=True, ensure_ascii=False): (category, item)
+                    for category, item in pairs}
+
+        before = entries(pair for pairs in self.previous_issues.get(lang_code, {}).values() for pair in pairs)
+        after = entries((category, item) for category, items in self.issues[lang_code].items() for item in items)
+
+        return {
+            'new': [{'category': c, 'issue': i} for k, (c, i) in after.items() if k not in before],
+            'resolved': [{'category': c, 'issue': i} for k, (c, i) in before.items() if k not in after],
+        }
+
+    def print_changes(self):
+        """Print issues that appeared or were resolved since the previous report"""
+        print("\n\n")
+        print("="*80)
+        print("CHANGES SINCE LAST REPORT")
+        print("="*80)
 
-        self.print_report()
+        changed = False
+        for lang_code in self.stats:
+            diff = self.diff_issues(lang_code)
+            if not diff['new'] and not diff['resolved']:
+                continue
+            changed = True
+            print(f"\n{lang_code.upper()}: {len(diff['new'])} new, {len(diff['resolved'])} resolved")
+            for sign, entries in (('+', diff['new']), ('-', diff['resolved'])):
+                for entry in entries:
+                    print(f"  {sign} {entry['category']}: {issue_key(entry['issue'])}")
+
+        if not changed:
+            print("\nNo new or resolved issues.")
+
+    def to_report(self) -> Dict:
+        """Machine-readable audit results (also the input of the next incremental run)"""
+        languages = {}
+        for lang_code, stats in self.stats.items():
+            issues = self.issues[lang_code]
+            languages[lang_code] = {
+                'language_name': self.data['languages'][lang_code]['name'],
+                'total_keys': stats['total_keys'],
+                'issue_count': stats['issue_count'],
+                'issues': {category: issues[category] for category in ISSUE_CATEGORIES if issues.get(category)},
+            }
+            if self.incremental:
+                languages[lang_code]['changes'] = self.diff_issues(lang_code)
+
+        failed = sum(1 for stats in self.stats.values() if stats['has_issues'])
+        return {
+            'audit_date': datetime.now().strftime('%Y-%m-%d'),
+            'audit_version': AUDIT_VERSION,
+            'config': str(self.file_path),
+            'reference_language': self.reference_lang,
+            'incremental': self.incremental,
+            'summary': {
+                'total_languages': len(self.stats),
+                'passed': len(self.stats) - failed,
+                'failed': failed,
+                'total_issues': sum(stats['issue_count'] for stats in self.stats.values()),
+            },
+            'languages': languages,
+            'digests': self.digests,
+        }
+
+    def write_report(self, path: str):
+        """Write the JSON report atomically"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_report(), f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        os.replace(tmp_path, path)
 
-    def print_report(self):
-        """Print comprehensive audit report"""
+    def print_report(self, details: bool = True):
+        """Print comprehensive audit report (details=False: summary only)"""
         print("\n\n")
         print("="*80)
         print("AUDIT REPORT")
@@ -282,7 +509,7 @@ class TranslationAuditor:
             print(f"\nLanguages with issues: {', '.join(languages_with_issues)}")
 
         # Detailed reports for each language with issues
-        for lang_code in sorted(languages_with_issues):
+        for lang_code in sorted(languages_with_issues if details else []):
             lang_name = self.data['languages'][lang_code]['name']
             print(f"\n\n{'='*80}")
             print(f"DETAILED REPORT: {lang_code.upper()} ({lang_name})")
@@ -362,6 +589,48 @@ class TranslationAuditor:
             print(f"✓ {passed} language(s) have no issues.")
 
 
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description="Audit translations in languages.json for completeness and consistency"
+    )
+    parser.add_argument(
+        'config',
+        nargs='?',
+        default=str(DEFAULT_CONFIG),
+        help=f"Path to languages.json (default: {DEFAULT_CONFIG.relative_to(ROOT_DIR)})"
+    )
+    parser.add_argument(
+        '--json',
+        metavar='PATH',
+        help="Write a machine-readable report (e.g. translation_audit.json)"
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help="Re-audit only keys changed since the previous --json report"
+    )
+    args = parser.parse_args()
+
+    if args.incremental and not args.json:
+        parser.error("--incremental needs --json PATH (the previous report)")
+
+    previous = None
+    if args.incremental:
+        previous = load_report(args.json)
+        if previous is None:
+            print(f"No previous report at {args.json}, running a full audit\n")
+
+    auditor = TranslationAuditor(args.config, previous_report=previous)
+    if not auditor.run_audit():
+        return 1
+
+    if args.json:
+        auditor.write_report(args.json)
+        print(f"\n📄 JSON report: {args.json}")
+
+    return 0
+
+
 if __name__ == '__main__':
-    auditor = TranslationAuditor('/home/user/thesitez2/_config/languages.json')
-    auditor.run_audit()
+    sys.exit(main())
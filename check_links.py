@@ -1,4 +1,14 @@
+import argparse
+import asyncio
+import json
+import os
+import posixpath
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 
@@ -6,64 +16,317 @@ BASE_URL = "https://eleven11zz.github.io/thesitez2/"
 visited_pages = set()
 broken_links = []
 
+# Crawler limits: number of page workers, total open connections and
+# connections per host (kept small to stay polite to GitHub Pages)
+MAX_WORKERS = 8
+MAX_CONNECTIONS = 32
+PER_HOST_LIMIT = 8
+REQUEST_TIMEOUT = 10
+
+# Link result cache: entries younger than CACHE_MAX_AGE are trusted without a
+# request, older ones are revalidated with a conditional request, and entries
+# older than CACHE_TTL are evicted
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".link-cache.json")
+CACHE_MAX_AGE = 60 * 60
+CACHE_TTL = 7 * 24 * 60 * 60
+
 # Headers to avoid 403 errors
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
-def is_internal_link(href):
+SKIP_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".svg", ".gif", ".ico", ".pdf", ".zip", ".txt", ".json")
+PAGE_EXTENSIONS = ("", ".html", ".htm")
+
+
+def is_internal_link(href, base_url=BASE_URL):
     if not href:
         return False
     parsed = urlparse(href)
-    # Internal if no netloc OR same host & path starts with /thesitez2
+    # Internal if no netloc OR same host as the site being crawled
     if not parsed.netloc:
         return True
-    return parsed.netloc == "eleven11zz.github.io"
+    return parsed.netloc == urlparse(base_url).netloc
+
+
+def make_session(pool_size):
+    """Create a keep-alive session whose connection pool fits the crawler."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class LinkCache:
+    """
+    On-disk cache of link check results.
+
+    Each entry records the status, ETag/Last-Modified validators, the time it
+    was checked and, for crawled pages, the links found on the page, so a
+    304 Not Modified answer lets the crawl continue without the body.
+    """
+
+    def __init__(self, path=CACHE_FILE, max_age=CACHE_MAX_AGE, ttl=CACHE_TTL):
+        self.path = path
+        self.max_age = max_age
+        self.ttl = ttl
+        self.entries = {}
 
-def crawl(url):
-    if url in visited_pages:
-        return
-    visited_pages.add(url)
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return self
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f).get("entries", {})
+        except (OSError, ValueError) as e:
+            print(f"[CACHE] Ignoring unreadable cache {self.path}: {e}")
+            return self
 
-    try:
-        r = requests.get(url, headers=HEADERS, timeout=10)
-    except Exception as e:
-        print(f"[ERROR] {url} -> {e}")
-        return
+        now = time.time()
+        self.entries = {
+            url: entry for url, entry in entries.items()
+            if now - entry.get("checked_at", 0) <= self.ttl
+        }
+        return self
 
-    if r.status_code != 200:
-        print(f"[PAGE ERROR] {url} -> {r.status_code}")
-        return
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "entries": self.entries}, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
 
-    soup = BeautifulSoup(r.text, "html.parser")
+    def get(self, url):
+        return self.entries.get(url)
 
-    for a in soup.find_all("a"):
-        href = a.get("href")
-        if not href or href.startswith("mailto:") or href.startswith("tel:") or href.startswith("javascript:"):
-            continue
+    def is_fresh(self, entry):
+        return time.time() - entry["checked_at"] <= self.max_age
 
-        if is_internal_link(href):
-            target = urljoin(url, href)
-            # Strip fragments
-            target = target.split("#")[0]
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
 
-            # Skip non-html assets
-            if any(target.endswith(ext) for ext in (".png", ".jpg", ".jpeg", ".webp", ".svg", ".gif", ".ico", ".pdf", ".zip", ".txt", ".json")):
+    def touch(self, url):
+        self.entries[url]["checked_at"] = time.time()
+
+    def store(self, url, response, links):
+        # Only successful results are cached; broken links are always rechecked
+        if response.status_code >= 400:
+            self.entries.pop(url, None)
+            return
+        self.entries[url] = {
+            "status": response.status_code,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "checked_at": time.time(),
+            "links": links,
+        }
+
+
+class Crawler:
+    """
+    Breadth-first site crawler.
+
+    A fixed pool of asyncio workers pulls pages from a queue, so crawl depth
+    no longer grows the Python stack. Blocking requests run on a thread pool
+    sharing one pooled session (HTTP keep-alive), and each host is capped by
+    its own semaphore.
+
+    Every URL is validated at most once per run no matter how many pages link
+    to it. Pages that will be crawled are fetched with GET; everything else is
+    checked with HEAD, falling back to GET when the server rejects HEAD.
+    """
+
+    def __init__(self, base_url=BASE_URL, workers=MAX_WORKERS,
+                 max_connections=MAX_CONNECTIONS, per_host=PER_HOST_LIMIT, cache=None):
+        self.base_url = base_url
+        self.workers = workers
+        self.max_connections = max_connections
+        self.per_host = per_host
+        self.cache = cache or LinkCache(path=None)
+        self.session = make_session(max_connections)
+        self.executor = ThreadPoolExecutor(max_workers=max_connections)
+        self.host_limits = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+        self.checks = {}
+        self.stats = defaultdict(int)
+        self.queue = None
+
+    async def fetch(self, url, method="GET", headers=None):
+        """Send a request on the thread pool, respecting the per-host limit."""
+        loop = asyncio.get_running_loop()
+        self.stats[method] += 1
+        async with self.host_limits[urlparse(url).netloc]:
+            return await loop.run_in_executor(
+                self.executor,
+                lambda: self.session.request(method, url, headers=headers,
+                                             timeout=REQUEST_TIMEOUT, allow_redirects=True)
+            )
+
+    def is_crawlable(self, url):
+        """Whether url is a page under the base URL that should be crawled."""
+        if not url.startswith(self.base_url):
+            return False
+        return posixpath.splitext(urlparse(url).path)[1].lower() in PAGE_EXTENSIONS
+
+    def extract_links(self, page_url, html):
+        """Return [href, target] pairs for internal links on a page."""
+        soup = BeautifulSoup(html, "html.parser")
+        links = []
+
+        for a in soup.find_all("a"):
+            href = a.get("href")
+            if not href or href.startswith("mailto:") or href.startswith("tel:") or href.startswith("javascript:"):
                 continue
 
+            if is_internal_link(href, self.base_url):
+                target = urljoin(page_url, href)
+                # Strip fragments
+                target = target.split("#")[0]
+
+                # Skip non-html assets
+                if target.endswith(SKIP_EXTENSIONS):
+                    continue
+
+                links.append([href, target])
+
+        return links
+
+    def validate(self, url):
+        """Return a shared task resolving to (status, links) for url."""
+        if url not in self.checks:
+            self.checks[url] = asyncio.ensure_future(self._validate(url))
+        return self.checks[url]
+
+    async def _validate(self, url):
+        crawlable = self.is_crawlable(url)
+        entry = self.cache.get(url)
+
+        if entry and self.cache.is_fresh(entry) and (entry["links"] is not None or not crawlable):
+            self.stats["cached"] += 1
+            return entry["status"], entry["links"]
+
+        headers = self.cache.conditional_headers(entry)
+        if crawlable:
+            res = await self.fetch(url, "GET", headers)
+        else:
+            res = await self.fetch(url, "HEAD", headers)
+            if res.status_code in (405, 501):
+                res = await self.fetch(url, "GET", headers)
+
+        if res.status_code == 304 and entry:
+            self.stats["not_modified"] += 1
+            self.cache.touch(url)
+            return entry["status"], entry["links"]
+
+        links = None
+        is_html = "html" in res.headers.get("Content-Type", "")
+        if res.status_code == 200 and crawlable and is_html:
+            links = self.extract_links(url, res.text)
+
+        self.cache.store(url, res, links)
+        return res.status_code, links
+
+    async def check_link(self, page_url, href, target):
+        try:
+            status, links = await self.validate(target)
+        except Exception as e:
+            broken_links.append((page_url, href, target, str(e)))
+            return
+
+        if status == 404:
+            broken_links.append((page_url, href, target, status))
+
+        # Crawl deeper only for html pages under the base URL; their links
+        # were already extracted when the page was validated
+        if status == 200 and links is not None and target not in visited_pages:
+            visited_pages.add(target)
+            self.queue.put_nowait(target)
+
+    async def process_page(self, url):
+        try:
+            status, links = await self.validate(url)
+        except Exception as e:
+            print(f"[ERROR] {url} -> {e}")
+            return
+
+        if status != 200:
+            print(f"[PAGE ERROR] {url} -> {status}")
+            return
+
+        await asyncio.gather(*(self.check_link(url, href, target) for href, target in links or []))
+
+    async def worker(self):
+        while True:
+            url = await self.queue.get()
             try:
-                res = requests.get(target, headers=HEADERS, timeout=10)
-                if res.status_code == 404:
-                    broken_links.append((url, href, target, res.status_code))
-                # Crawl deeper only for html pages under /thesitez2/
-                if res.status_code == 200 and "/thesitez2/" in target and target not in visited_pages:
-                    crawl(target)
-            except Exception as e:
-                broken_links.append((url, href, target, str(e)))
+                await self.process_page(url)
+            finally:
+                self.queue.task_done()
+
+    async def run(self, start_url=None):
+        start_url = start_url or self.base_url
+        self.queue = asyncio.Queue()
+        visited_pages.add(start_url)
+        self.queue.put_nowait(start_url)
+
+        workers = [asyncio.create_task(self.worker()) for _ in range(self.workers)]
+        try:
+            await self.queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.executor.shutdown(wait=False)
+            self.session.close()
+
+
+def crawl(url, workers=MAX_WORKERS, max_connections=MAX_CONNECTIONS, per_host=PER_HOST_LIMIT, cache=None):
+    """Crawl the site starting at url and collect broken links."""
+    crawler = Crawler(url, workers, max_connections, per_host, cache)
+    asyncio.run(crawler.run())
+    if cache:
+        cache.save()
+    return crawler.stats
 
 
 if __name__ == "__main__":
-    crawl(BASE_URL)
+    parser = argparse.ArgumentParser(description="Check internal links across the site")
+    parser.add_argument("--base-url", default=BASE_URL,
+                        help="Site root to crawl, e.g. http://localhost:8000/ for a local http.server")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Concurrent page workers")
+    parser.add_argument("--max-connections", type=int, default=MAX_CONNECTIONS, help="Total open connections")
+    parser.add_argument("--per-host", type=int, default=PER_HOST_LIMIT, help="Concurrent requests per host")
+    parser.add_argument("--offline", action="store_true",
+                        help="Resolve links against the files on disk instead of crawling over HTTP")
+    parser.add_argument("--cache", default=CACHE_FILE, help="Link result cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Check every link without the result cache")
+    parser.add_argument("--cache-max-age", type=int, default=CACHE_MAX_AGE,
+                        help="Seconds a cached result is trusted without revalidation")
+    parser.add_argument("--cache-ttl", type=int, default=CACHE_TTL,
+                        help="Seconds after which a cached result is evicted")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.offline:
+        from offline_links import check_site
+        broken_links = check_site()
+        elapsed = time.perf_counter() - started
+        print(f"\nChecked site offline in {elapsed:.2f}s")
+    else:
+        cache = None if args.no_cache else LinkCache(args.cache, args.cache_max_age, args.cache_ttl).load()
+        stats = crawl(args.base_url, args.workers, args.max_connections, args.per_host, cache)
+        elapsed = time.perf_counter() - started
+        print(f"\nCrawled {len(visited_pages)} pages in {elapsed:.1f}s "
+              f"({stats['GET']} GET, {stats['HEAD']} HEAD, "
+              f"{stats['not_modified']} not modified, {stats['cached']} from cache)")
 
     print("\n=== Broken / suspicious internal links ===")
     if not broken_links:
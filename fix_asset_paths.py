@@ -4,8 +4,10 @@ Fix asset paths in language subdirectories.
 Changes ./assets/ to ../assets/ in all HTML files within language folders.
 """
 
+import argparse
 import os
 import re
+import sys
 from pathlib import Path
 
 # Language directories to process
@@ -14,35 +16,45 @@ LANG_DIRS = ['de', 'fr', 'it', 'nl', 'no', 'sv', 'th']
 # Root directory
 ROOT_DIR = Path(__file__).parent
 
+sys.path.insert(0, str(ROOT_DIR / 'scripts'))
+from html_document import HtmlDocument
+from parallel_jobs import add_jobs_argument, map_files
+
+# href="./assets/, src="./assets/, content="./assets/, url('./assets/ and url("./assets/
+ASSET_PATH_RE = re.compile(r'''((?:href|src|content)="|url\(['"])\./assets/''')
+
+def is_language_page(filepath):
+    """Check if a path (relative to ROOT_DIR) is inside a language directory."""
+    return Path(filepath).parts[0] in LANG_DIRS
+
 def fix_asset_paths(html_content):
     """
     Replace ./assets/ with ../assets/ in HTML content.
     Handles href, src, and other attributes.
     """
-    # Replace ./assets/ with ../assets/ for:
-    # - href="./assets/...
-    # - src="./assets/...
-    # - content="./assets/...
-    # - url('./assets/...
-
-    patterns = [
-        (r'(href=")(\./assets/)', r'\1../assets/'),
-        (r'(src=")(\./assets/)', r'\1../assets/'),
-        (r'(content=")(\./assets/)', r'\1../assets/'),
-        (r"(url\(')(\./assets/)", r"\1../assets/"),
-        (r'(url\(")(\./assets/)', r'\1../assets/'),
-    ]
-
-    modified = html_content
-    for pattern, replacement in patterns:
-        modified = re.sub(pattern, replacement, modified)
-
-    return modified
-
-def process_html_files():
+    # All five attribute/url() forms are rewritten in a single pass
+    return ASSET_PATH_RE.sub(r'\1../assets/', html_content)
+
+def fix_file(html_file):
+    """Fix one file. Returns (modified, message) without printing."""
+    try:
+        # Read file
+        doc = HtmlDocument.load(html_file)
+
+        # Fix paths
+        doc.content = fix_asset_paths(doc.content)
+
+        # Only write if changed
+        if doc.save():
+            return True, f"✓ Fixed: {html_file.relative_to(ROOT_DIR)}"
+        return False, f"  Skipped (no changes): {html_file.relative_to(ROOT_DIR)}"
+
+    except Exception as e:
+        return False, f"✗ Error processing {html_file}: {e}"
+
+def process_html_files(jobs=1):
     """Process all HTML files in language directories."""
-    files_processed = 0
-    files_modified = 0
+    html_files = []
 
     for lang_dir in LANG_DIRS:
         lang_path = ROOT_DIR / lang_dir
@@ -51,35 +63,24 @@ def process_html_files():
             continue
 
         # Find all HTML files in the language directory
-        for html_file in lang_path.rglob('*.html'):
-            files_processed += 1
-
-            try:
-                # Read file
-                with open(html_file, 'r', encoding='utf-8') as f:
-                    original_content = f.read()
-
-                # Fix paths
-                fixed_content = fix_asset_paths(original_content)
+        html_files.extend(sorted(lang_path.rglob('*.html')))
 
-                # Only write if changed
-                if fixed_content != original_content:
-                    with open(html_file, 'w', encoding='utf-8') as f:
-                        f.write(fixed_content)
-                    files_modified += 1
-                    print(f"✓ Fixed: {html_file.relative_to(ROOT_DIR)}")
-                else:
-                    print(f"  Skipped (no changes): {html_file.relative_to(ROOT_DIR)}")
-
-            except Exception as e:
-                print(f"✗ Error processing {html_file}: {e}")
+    files_modified = 0
+    for modified, message in map_files(fix_file, html_files, jobs):
+        print(message)
+        if modified:
+            files_modified += 1
 
     print(f"\n{'='*60}")
-    print(f"Files processed: {files_processed}")
+    print(f"Files processed: {len(html_files)}")
     print(f"Files modified: {files_modified}")
     print(f"{'='*60}")
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Fix asset paths in language directories")
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
     print("Fixing asset paths in language directories...\n")
-    process_html_files()
+    process_html_files(args.jobs)
     print("\n✓ Done!")
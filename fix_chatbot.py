@@ -6,8 +6,12 @@ Updates to use the correct rasa-webchat library.
 
 import os
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from html_document import HtmlDocument
+
 # Old snippet to find and replace
 OLD_SNIPPET = '''<!-- TVMaster VIP Chatbot -->
 <div id="tvmaster-chat-widget"></div>
@@ -62,19 +66,20 @@ def should_process_file(filepath):
             return False
     return filepath.suffix == '.html'
 
+def replace_chatbot_snippet(html_content):
+    """Swap the old rasa-chat snippet for the rasa-webchat one."""
+    return html_content.replace(OLD_SNIPPET, NEW_SNIPPET)
+
 def fix_chatbot_widget(filepath):
     """Replace old chatbot snippet with new one."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        doc = HtmlDocument.load(filepath)
 
-        if OLD_SNIPPET not in content:
+        if OLD_SNIPPET not in doc.content:
             return False
 
-        updated_content = content.replace(OLD_SNIPPET, NEW_SNIPPET)
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        doc.content = replace_chatbot_snippet(doc.content)
+        doc.save()
 
         print(f"  ✅ Updated: {filepath}")
         return True
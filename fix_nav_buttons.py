@@ -8,6 +8,33 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from html_document import HtmlDocument
+
+# Files to fix
+SETUP_FILES = [
+    'setup/smart-tv.html',
+    'setup/fire-tv.html',
+    'setup/android-tv.html',
+    'setup/desktop.html',
+    'setup/mobile.html',
+    'setup/mag-box.html',
+    'setup/iptv-extreme.html',
+    'setup/smart-iptv.html',
+    'setup/smart-one-iptv.html',
+    'setup/index.html',
+]
+
+SPORTS_FILES = [
+    'sports/arsenal-vs-liverpool.html',
+    'sports/chiefs-vs-49ers-2025.html',
+    'sports/manchester-derby-2025.html',
+    'sports/ufc-305-perth.html',
+    'sports/index.html',
+]
+
+HTML_FILES = SETUP_FILES + SPORTS_FILES
+
 def fix_nav_buttons(html_content):
     """Remove duplicate nav-toggle buttons from HTML content."""
 
@@ -43,15 +70,13 @@ def fix_nav_buttons(html_content):
 def process_file(filepath):
     """Process a single HTML file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        doc = HtmlDocument.load(filepath)
 
-        original_content = content
-        fixed_content = fix_nav_buttons(content)
+        original_content = doc.content
+        doc.content = fix_nav_buttons(original_content)
+        fixed_content = doc.content
 
-        if original_content != fixed_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(fixed_content)
+        if doc.save():
 
             # Count how many were removed
             original_count = original_content.count('<button class="nav-toggle"')
@@ -68,34 +93,10 @@ def process_file(filepath):
         return False
 
 def main():
-    # Files to fix
-    setup_files = [
-        'setup/smart-tv.html',
-        'setup/fire-tv.html',
-        'setup/android-tv.html',
-        'setup/desktop.html',
-        'setup/mobile.html',
-        'setup/mag-box.html',
-        'setup/iptv-extreme.html',
-        'setup/smart-iptv.html',
-        'setup/smart-one-iptv.html',
-        'setup/index.html',
-    ]
-
-    sports_files = [
-        'sports/arsenal-vs-liverpool.html',
-        'sports/chiefs-vs-49ers-2025.html',
-        'sports/manchester-derby-2025.html',
-        'sports/ufc-305-perth.html',
-        'sports/index.html',
-    ]
-
-    all_files = setup_files + sports_files
-
     print("🔧 Fixing duplicate nav-toggle buttons in 16 files...\n")
 
     fixed_count = 0
-    for filepath in all_files:
+    for filepath in HTML_FILES:
         path = Path(filepath)
         if path.exists():
             if process_file(path):
@@ -103,7 +104,7 @@ def main():
         else:
             print(f"✗ File not found: {filepath}")
 
-    print(f"\n✅ Fixed {fixed_count} out of {len(all_files)} files")
+    print(f"\n✅ Fixed {fixed_count} out of {len(HTML_FILES)} files")
 
 if __name__ == '__main__':
     main()
@@ -1,159 +1,229 @@
 #!/usr/bin/env python3
 """
 Generate index.html files for language directories
+
+The English index.html is parsed once into a compiled template: the
+language-specific values (lang attribute, title, meta description and
+keywords, Open Graph/Twitter tags, canonical URLs, locale, language name
+and the ./assets/ prefix) become slots and everything else is literal text.
+Each language from _config/languages.json is then rendered by filling the
+slots in a single join, and a file is only written if its bytes changed.
+
+Usage:
+    python generate_lang_index.py
+    python generate_lang_index.py de fr
+    python generate_lang_index.py --jobs 4 --dry-run
 """
+
+import argparse
+import json
 import os
-import shutil
-
-# Language configurations
-languages = {
-    'de': {
-        'lang': 'de',
-        'locale': 'de_DE',
-        'language_name': 'German',
-        'title': 'TVMaster VIP - #1 Premium IPTV Service | 30.000+ Kanäle, 4K Streaming',
-        'description': '🏆 Bewertet mit 4,9/5 von 50.000+ Nutzern! TVMaster VIP bietet 30.000+ Live-TV-Kanäle, 3.000+ Sportnetzwerke & 10.000+ Filme in atemberaubendem 4K. Bester IPTV-Anbieter mit sofortiger Aktivierung, 99,9% Verfügbarkeit, ohne Puffern, Mehrgerätezugriff & 24/7 Expertenunterstützung. Starten Sie heute Ihre risikofreie 7-Tage-Testversion!',
-        'keywords': 'bester IPTV-Service 2025, Premium IPTV-Anbieter, 4K IPTV-Streaming, Live-TV-Streaming-Service, Sport IPTV-Abonnement, IPTV für Smart TV, Android TV Box IPTV, Multi-Device IPTV, IPTV ohne Puffern, günstige IPTV-Pläne, IPTV vs Kabelfernsehen, internationale IPTV-Kanäle',
-    },
-    'fr': {
-        'lang': 'fr',
-        'locale': 'fr_FR',
-        'language_name': 'French',
-        'title': 'TVMaster VIP - #1 Service IPTV Premium | 30 000+ Chaînes, Streaming 4K',
-        'description': '🏆 Noté 4,9/5 par 50 000+ utilisateurs! TVMaster VIP propose 30 000+ chaînes de télévision en direct, 3 000+ réseaux sportifs et 10 000+ films en 4K époustouflant. Meilleur fournisseur IPTV avec activation instantanée, disponibilité de 99,9%, sans mise en mémoire tampon, accès multi-appareils et support expert 24/7. Commencez votre essai gratuit de 7 jours sans risque aujourd\'hui!',
-        'keywords': 'meilleur service IPTV 2025, fournisseur IPTV premium, streaming IPTV 4K, service de streaming TV en direct, abonnement IPTV sport, IPTV pour Smart TV, boîtier Android TV IPTV, IPTV multi-appareils, IPTV sans mise en mémoire tampon, forfaits IPTV pas chers, IPTV vs télévision par câble, chaînes IPTV internationales',
-    },
-    'it': {
-        'lang': 'it',
-        'locale': 'it_IT',
-        'language_name': 'Italian',
-        'title': 'TVMaster VIP - #1 Servizio IPTV Premium | 30.000+ Canali, Streaming 4K',
-        'description': '🏆 Valutato 4,9/5 da 50.000+ utenti! TVMaster VIP offre 30.000+ canali TV in diretta, 3.000+ reti sportive e 10.000+ film in straordinario 4K. Miglior provider IPTV con attivazione istantanea, uptime del 99,9%, zero buffering, accesso multi-dispositivo e supporto esperto 24/7. Inizia oggi la tua prova gratuita di 7 giorni senza rischi!',
-        'keywords': 'miglior servizio IPTV 2025, provider IPTV premium, streaming IPTV 4K, servizio streaming TV in diretta, abbonamento IPTV sport, IPTV per Smart TV, box Android TV IPTV, IPTV multi-dispositivo, IPTV senza buffering, piani IPTV economici, IPTV vs TV via cavo, canali IPTV internazionali',
-    },
-    'nl': {
-        'lang': 'nl',
-        'locale': 'nl_NL',
-        'language_name': 'Dutch',
-        'title': 'TVMaster VIP - #1 Premium IPTV Service | 30.000+ Kanalen, 4K Streaming',
-        'description': '🏆 Beoordeeld met 4,9/5 door 50.000+ gebruikers! TVMaster VIP levert 30.000+ live tv-kanalen, 3.000+ sportnetwerken & 10.000+ films in prachtige 4K. Beste IPTV-provider met directe activering, 99,9% uptime, geen buffering, toegang op meerdere apparaten & 24/7 deskundige ondersteuning. Start vandaag nog uw risicovrije proefperiode van 7 dagen!',
-        'keywords': 'beste IPTV-service 2025, premium IPTV-provider, 4K IPTV-streaming, live tv-streamingservice, sport IPTV-abonnement, IPTV voor Smart TV, Android TV box IPTV, multi-device IPTV, IPTV zonder buffering, goedkope IPTV-abonnementen, IPTV vs kabeltelevisie, internationale IPTV-kanalen',
-    },
-    'no': {
-        'lang': 'no',
-        'locale': 'no_NO',
-        'language_name': 'Norwegian',
-        'title': 'TVMaster VIP - #1 Premium IPTV-tjeneste | 30 000+ Kanaler, 4K Streaming',
-        'description': '🏆 Vurdert 4,9/5 av 50 000+ brukere! TVMaster VIP leverer 30 000+ direkte TV-kanaler, 3 000+ sportnettverk & 10 000+ filmer i fantastisk 4K. Best IPTV-leverandør med øyeblikkelig aktivering, 99,9% oppetid, null buffring, tilgang på flere enheter & 24/7 ekspertstøtte. Start din risikofrie 7-dagers prøveperiode i dag!',
-        'keywords': 'beste IPTV-tjeneste 2025, premium IPTV-leverandør, 4K IPTV-streaming, direkte TV-strømmetjeneste, sport IPTV-abonnement, IPTV for Smart TV, Android TV-boks IPTV, flerenhets IPTV, IPTV uten buffring, billige IPTV-planer, IPTV vs kabel-TV, internasjonale IPTV-kanaler',
-    },
-    'sv': {
-        'lang': 'sv',
-        'locale': 'sv_SE',
-        'language_name': 'Swedish',
-        'title': 'TVMaster VIP - #1 Premium IPTV-tjänst | 30 000+ Kanaler, 4K Streaming',
-        'description': '🏆 Betygsatt 4,9/5 av 50 000+ användare! TVMaster VIP levererar 30 000+ live-TV-kanaler, 3 000+ sportnätverk & 10 000+ filmer i fantastisk 4K. Bästa IPTV-leverantören med omedelbar aktivering, 99,9% drifttid, noll buffring, åtkomst till flera enheter & 24/7 expertstöd. Starta din riskfria 7-dagars provperiod idag!',
-        'keywords': 'bästa IPTV-tjänsten 2025, premium IPTV-leverantör, 4K IPTV-streaming, live-TV-streamingtjänst, sport IPTV-prenumeration, IPTV för Smart TV, Android TV-box IPTV, flerdatorers IPTV, IPTV utan buffring, billiga IPTV-planer, IPTV vs kabel-TV, internationella IPTV-kanaler',
-    }
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+ROOT_DIR = Path(__file__).parent
+CONFIG_FILE = ROOT_DIR / '_config' / 'languages.json'
+SOURCE_PAGE = 'index.html'
+
+# Languages whose index.html is translated by hand, not generated
+TRANSLATED_BY_HAND = {'th'}
+
+STATUS_VERBS = {
+    'created': ('Created', 'Would create'),
+    'updated': ('Updated', 'Would update'),
 }
 
-def read_template():
-    """Read the Thai index.html as a template"""
-    with open('th/index.html', 'r', encoding='utf-8') as f:
-        return f.read()
-
-def create_lang_index(lang_code, config, template):
-    """Create index.html for a specific language"""
-    # For now, we'll use the English index as base and update meta tags
-    with open('index.html', 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Replace language-specific elements
-    content = content.replace('lang="en"', f'lang="{config["lang"]}"')
-    content = content.replace('content="en_US"', f'content="{config["locale"]}"')
-    content = content.replace('content="English"', f'content="{config["language_name"]}"')
-
-    # Update canonical URL
-    content = content.replace(
-        'href="https://web.tvmaster.vip/"',
-        f'href="https://web.tvmaster.vip/{lang_code}/"'
-    )
+sys.path.insert(0, str(ROOT_DIR / 'scripts'))
+from parallel_jobs import add_jobs_argument, map_files
+
+# Slot name -> patterns whose single group is the slot's text in the English page
+SLOT_PATTERNS = {
+    'lang': [r'<html[^>]*?\slang="([^"]*)"'],
+    'title': [r'<title>([^<]*)</title>'],
+    'description': [r'<meta name="description" content="([^"]*)"'],
+    'keywords': [r'<meta name="keywords" content="([^"]*)"'],
+    'og_title': [r'<meta property="og:title" content="([^"]*)"'],
+    'og_description': [r'<meta property="og:description" content="([^"]*)"'],
+    'twitter_title': [r'<meta name="twitter:title" content="([^"]*)"'],
+    'twitter_description': [r'<meta name="twitter:description" content="([^"]*)"'],
+    'url': [
+        r'<link rel="canonical" href="([^"]*)"',
+        r'<meta property="og:url" content="([^"]*)"',
+        r'<meta name="twitter:url" content="([^"]*)"',
+    ],
+    'locale': [r'<meta property="og:locale" content="([^"]*)"'],
+    'language_name': [r'<meta name="language" content="([^"]*)"'],
+    # Same forms as fix_asset_paths.py: href/src/content attributes and url()
+    'asset_prefix': [r'''(?:(?:href|src|content)="|url\(['"])(\./)assets/'''],
+}
 
-    # Update og:url
-    content = content.replace(
-        '<meta property="og:url" content="https://web.tvmaster.vip/"',
-        f'<meta property="og:url" content="https://web.tvmaster.vip/{lang_code}/"'
-    )
+COMPILED_SLOT_PATTERNS = {
+    slot: [re.compile(pattern) for pattern in patterns]
+    for slot, patterns in SLOT_PATTERNS.items()
+}
 
-    # Update twitter:url
-    content = content.replace(
-        '<meta name="twitter:url" content="https://web.tvmaster.vip/"',
-        f'<meta name="twitter:url" content="https://web.tvmaster.vip/{lang_code}/"'
-    )
 
-    # Update title
-    content = content.replace(
-        '<title>TVMaster VIP - #1 Premium IPTV Service | 30,000+ Channels, 4K Streaming, Zero Buffering</title>',
-        f'<title>{config["title"]}</title>'
-    )
+class PageTemplate:
+    """A page split into literal text and named slots."""
+
+    def __init__(self, segments: List[Union[str, Tuple[str]]]):
+        # str = literal text, (slot,) = slot
+        self.segments = segments
+        self.slots = {segment[0] for segment in segments if isinstance(segment, tuple)}
+
+    @classmethod
+    def compile(cls, html: str) -> 'PageTemplate':
+        """Mark every slot occurrence in html and split it into segments."""
+        spans = []
+        for slot, patterns in COMPILED_SLOT_PATTERNS.items():
+            for pattern in patterns:
+                for match in pattern.finditer(html):
+                    spans.append((match.start(1), match.end(1), slot))
+        spans.sort()
+
+        segments = []
+        position = 0
+        for start, end, slot in spans:
+            if start < position:
+                raise ValueError(f"Overlapping template slots at offset {start} ({slot})")
+            if start > position:
+                segments.append(html[position:start])
+            segments.append((slot,))
+            position = end
+        if position < len(html):
+            segments.append(html[position:])
+
+        return cls(segments)
+
+    def render(self, values: Dict[str, str]) -> str:
+        """Fill every slot; raises KeyError naming a slot without a value."""
+        return ''.join(
+            segment if isinstance(segment, str) else values[segment[0]]
+            for segment in self.segments
+        )
+
+
+def escape_attr(value: str) -> str:
+    """Escape a value for a double-quoted attribute (or <title>)."""
+    return value.replace('"', '&quot;').replace('<', '&lt;')
+
+
+def language_values(config: Dict) -> Dict[str, str]:
+    """Slot values for one language from its _config/languages.json entry."""
+    home = config['seo']['home']
+    title = escape_attr(home['title'])
+    description = escape_attr(home['description'])
+
+    return {
+        'lang': config['hreflang'],
+        'title': title,
+        'description': description,
+        'keywords': escape_attr(home['keywords']),
+        'og_title': escape_attr(home.get('og_title', home['title'])),
+        'og_description': escape_attr(home.get('og_description', home['description'])),
+        'twitter_title': title,
+        'twitter_description': description,
+        'url': config['site']['url'],
+        'locale': config['locale'],
+        'language_name': config['name'],
+        'asset_prefix': '../' if config.get('path') else './',
+    }
 
-    # Update meta description
-    import re
-    content = re.sub(
-        r'<meta name="description" content="[^"]*"',
-        f'<meta name="description" content="{config["description"]}"',
-        content
-    )
 
-    # Update meta keywords
-    content = re.sub(
-        r'<meta name="keywords" content="[^"]*"',
-        f'<meta name="keywords" content="{config["keywords"]}"',
-        content
-    )
+def render_language(task):
+    """Render one language's index.html. Returns (output path, status)."""
+    template, lang_code, values, dry_run = task
+    output_path = ROOT_DIR / lang_code / 'index.html'
+    relative_path = output_path.relative_to(ROOT_DIR).as_posix()
 
-    # Update og:title
-    content = re.sub(
-        r'<meta property="og:title" content="[^"]*"',
-        f'<meta property="og:title" content="{config["title"]}"',
-        content
-    )
+    try:
+        content = template.render(values).encode('utf-8')
+    except KeyError as e:
+        return relative_path, f'error: no value for slot {e}'
 
-    # Update og:description
-    content = re.sub(
-        r'<meta property="og:description" content="[^"]*"',
-        f'<meta property="og:description" content="{config["description"]}"',
-        content
-    )
+    try:
+        with open(output_path, 'rb') as f:
+            if f.read() == content:
+                return relative_path, 'unchanged'
+        status = 'updated'
+    except FileNotFoundError:
+        status = 'created'
 
-    # Update twitter:title
-    content = re.sub(
-        r'<meta name="twitter:title" content="[^"]*"',
-        f'<meta name="twitter:title" content="{config["title"]}"',
-        content
-    )
+    if not dry_run:
+        os.makedirs(output_path.parent, exist_ok=True)
+        with open(output_path, 'wb') as f:
+            f.write(content)
+    return relative_path, status
 
-    # Update twitter:description
-    content = re.sub(
-        r'<meta name="twitter:description" content="[^"]*"',
-        f'<meta name="twitter:description" content="{config["description"]}"',
-        content
-    )
 
-    # Write the file
-    output_path = f'{lang_code}/index.html'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+def load_languages() -> Dict:
+    with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-    print(f'✅ Created {output_path}')
 
 def main():
-    template = read_template()
-
-    for lang_code, config in languages.items():
-        create_lang_index(lang_code, config, template)
+    parser = argparse.ArgumentParser(
+        description="Generate language index.html files from the English page"
+    )
+    parser.add_argument(
+        'languages',
+        nargs='*',
+        help="Language codes to generate (default: every configured language "
+             f"except the default and {', '.join(sorted(TRANSLATED_BY_HAND))})"
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help="Report what would change without writing files"
+    )
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    config = load_languages()
+    default_language = config.get('default_language', 'en')
+    configured = config['languages']
+
+    if args.languages:
+        unknown = [code for code in args.languages if code not in configured]
+        if unknown:
+            parser.error(f"Unknown language(s): {', '.join(unknown)}")
+        lang_codes = [code for code in args.languages if code != default_language]
+    else:
+        lang_codes = [code for code in configured
+                      if code != default_language and code not in TRANSLATED_BY_HAND]
+
+    with open(ROOT_DIR / SOURCE_PAGE, 'r', encoding='utf-8', newline='') as f:
+        template = PageTemplate.compile(f.read())
+
+    tasks = []
+    for lang_code in lang_codes:
+        try:
+            values = language_values(configured[lang_code])
+        except KeyError as e:
+            print(f'⚠️  Skipping {lang_code}: missing {e} in {CONFIG_FILE.name}')
+            continue
+        tasks.append((template, lang_code, values, args.dry_run))
+
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0, 'error': 0}
+    for output_path, status in map_files(render_language, tasks, args.jobs):
+        if status.startswith('error'):
+            counts['error'] += 1
+            print(f'❌ {output_path}: {status}')
+        elif status == 'unchanged':
+            counts['unchanged'] += 1
+            print(f'   Unchanged: {output_path}')
+        else:
+            counts[status] += 1
+            verb = STATUS_VERBS[status][1 if args.dry_run else 0]
+            print(f'✅ {verb} {output_path}')
+
+    print(f"\n✅ {counts['created']} created, {counts['updated']} updated, "
+          f"{counts['unchanged']} unchanged ({len(template.slots)} slots, "
+          f"{len(template.segments)} template segments)")
+    return 1 if counts['error'] else 0
 
-    print('\n✅ All language index files created successfully!')
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
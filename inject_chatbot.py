@@ -2,12 +2,22 @@
 """
 Script to inject the TVMaster VIP Rasa chatbot widget into all HTML files.
 Adds the chatbot snippet before the closing </body> tag.
+
+Usage:
+    python inject_chatbot.py
+    python inject_chatbot.py --jobs 4
 """
 
+import argparse
 import os
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from html_document import HtmlDocument
+from parallel_jobs import add_jobs_argument, map_files
+
 # The chatbot widget snippet to inject
 CHATBOT_SNIPPET = '''
 <!-- TVMaster VIP Chatbot -->
@@ -50,38 +60,49 @@ def already_has_chatbot(content):
     """Check if the file already contains the chatbot widget."""
     return 'tvmaster-chat-widget' in content or 'RasaWebchat' in content
 
-def inject_chatbot_widget(filepath):
-    """Inject the chatbot widget before the closing body tag."""
+def add_chatbot_snippet(doc):
+    """Insert the chatbot snippet before </body>. Returns True if it was added."""
+    if already_has_chatbot(doc.content) or doc.body_close is None:
+        return False
+    doc.insert(doc.body_close, f'{CHATBOT_SNIPPET}\n')
+    return True
+
+def inject_chatbot_file(filepath):
+    """Inject the chatbot into one file. Returns (injected, message) without printing."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        doc = HtmlDocument.load(filepath)
 
         # Check if already has the chatbot
-        if already_has_chatbot(content):
-            print(f"  ⏭️  Skipping (already has chatbot): {filepath}")
-            return False
+        if already_has_chatbot(doc.content):
+            return False, f"  ⏭️  Skipping (already has chatbot): {filepath}"
 
         # Check if file has a closing body tag
-        if '</body>' not in content:
-            print(f"  ⚠️  Skipping (no </body> tag): {filepath}")
-            return False
+        if doc.body_close is None:
+            return False, f"  ⚠️  Skipping (no </body> tag): {filepath}"
 
         # Inject the chatbot snippet before </body>
-        updated_content = content.replace('</body>', f'{CHATBOT_SNIPPET}\n</body>')
+        add_chatbot_snippet(doc)
 
         # Write back to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        doc.save()
 
-        print(f"  ✅ Injected chatbot: {filepath}")
-        return True
+        return True, f"  ✅ Injected chatbot: {filepath}"
 
     except Exception as e:
-        print(f"  ❌ Error processing {filepath}: {e}")
-        return False
+        return False, f"  ❌ Error processing {filepath}: {e}"
+
+def inject_chatbot_widget(filepath):
+    """Inject the chatbot widget before the closing body tag."""
+    injected, message = inject_chatbot_file(filepath)
+    print(message)
+    return injected
 
 def main():
     """Main function to process all HTML files."""
+    parser = argparse.ArgumentParser(description="Inject the chatbot widget into all HTML files")
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
     root_dir = Path('.')
     processed_count = 0
     skipped_count = 0
@@ -98,9 +119,10 @@ def main():
 
     print(f"Found {len(html_files)} HTML files to process\n")
 
-    # Process each file
-    for filepath in sorted(html_files):
-        if inject_chatbot_widget(filepath):
+    # Process each file (results come back in file order)
+    for injected, message in map_files(inject_chatbot_file, sorted(html_files), args.jobs):
+        print(message)
+        if injected:
             processed_count += 1
         else:
             skipped_count += 1
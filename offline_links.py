@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Offline link checker.
+Resolves every href/src in the site's HTML files against the files on disk,
+without any HTTP requests. Each page is parsed once; links are then checked
+in memory against the set of known paths and per-page #fragment id tables.
+
+Usage:
+    python offline_links.py
+    python offline_links.py --root /path/to/site --no-fragments
+"""
+
+import argparse
+import os
+import posixpath
+import re
+import sys
+import time
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+ROOT_DIR = Path(__file__).parent
+
+# Absolute URLs that point back into this site
+SITE_PREFIXES = (
+    "https://eleven11zz.github.io/thesitez2/",
+    "https://web.tvmaster.vip/",
+)
+
+SKIP_DIRS = {".git", ".github", "node_modules", "_includes", "_templates", "_config"}
+SKIP_SCHEMES = ("mailto:", "tel:", "javascript:", "data:", "sms:", "whatsapp:")
+
+# Tags and attributes that reference other files
+LINK_ATTRS = {
+    "a": "href",
+    "link": "href",
+    "area": "href",
+    "img": "src",
+    "script": "src",
+    "iframe": "src",
+    "source": "src",
+    "video": "src",
+    "audio": "src",
+    "track": "src",
+    "embed": "src",
+}
+
+# Comments and raw-text elements are matched whole so that markup inside
+# inline scripts (e.g. '<a href="...">' in a JS string) is not mistaken for links
+TAG_RE = re.compile(
+    r'<!--.*?-->'
+    r'|<(script|style)\b([^>]*)>.*?</\1\s*>'
+    r'|<([a-zA-Z][\w:-]*)(\s[^>]*)?>',
+    re.DOTALL | re.IGNORECASE
+)
+ATTR_RE = re.compile(r'([\w:.-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))')
+
+
+def parse_attrs(attr_text):
+    """Parse a tag's attribute string into a dict (lowercased names)."""
+    attrs = {}
+    if not attr_text:
+        return attrs
+    for match in ATTR_RE.finditer(attr_text):
+        name = match.group(1).lower()
+        value = match.group(2)
+        if value is None:
+            value = match.group(3) if match.group(3) is not None else match.group(4)
+        attrs.setdefault(name, value)
+    return attrs
+
+
+def scan_page(html):
+    """Return (links, ids) for a page: links as (tag, attr, value) tuples."""
+    links = []
+    ids = set()
+
+    for match in TAG_RE.finditer(html):
+        if match.group(1):
+            tag, attr_text = match.group(1).lower(), match.group(2)
+        elif match.group(3):
+            tag, attr_text = match.group(3).lower(), match.group(4)
+        else:
+            continue  # comment
+
+        attrs = parse_attrs(attr_text)
+
+        if "id" in attrs:
+            ids.add(attrs["id"])
+        if tag == "a" and "name" in attrs:
+            ids.add(attrs["name"])
+
+        attr = LINK_ATTRS.get(tag)
+        if attr and attrs.get(attr):
+            links.append((tag, attr, attrs[attr]))
+
+    return links, ids
+
+
+class SiteIndex:
+    """In-memory index of the site: known files plus links and ids per page."""
+
+    def __init__(self, root=ROOT_DIR):
+        self.root = Path(root)
+        self.files = set()
+        self.dirs = set()
+        self.pages = {}
+
+    def build(self):
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            rel_dir = Path(dirpath).relative_to(self.root).as_posix()
+            rel_dir = "" if rel_dir == "." else rel_dir
+            self.dirs.add(rel_dir)
+
+            for filename in filenames:
+                rel_path = posixpath.join(rel_dir, filename) if rel_dir else filename
+                self.files.add(rel_path)
+
+                if filename.endswith(".html"):
+                    with open(os.path.join(dirpath, filename), "r", encoding="utf-8", errors="replace") as f:
+                        self.pages[rel_path] = scan_page(f.read())
+
+        return self
+
+    def to_site_path(self, page, url):
+        """
+        Map a link found on page to a site-relative path.
+        Returns (path, fragment), or None for external/non-file links.
+        """
+        for prefix in SITE_PREFIXES:
+            if url.startswith(prefix):
+                url = "/" + url[len(prefix):]
+                break
+
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc:
+            return None
+
+        path = unquote(parts.path)
+        if not path:
+            return page, parts.fragment
+
+        if path.startswith("/"):
+            joined = path.lstrip("/")
+        else:
+            joined = posixpath.join(posixpath.dirname(page), path)
+
+        normalized = posixpath.normpath(joined) if joined else "."
+        if normalized == ".":
+            normalized = ""
+        if normalized.startswith(".."):
+            return "..", parts.fragment
+
+        if path.endswith("/"):
+            normalized = posixpath.join(normalized, "index.html") if normalized else "index.html"
+        return normalized, parts.fragment
+
+    def resolve(self, path):
+        """Return the file that serves path (dir -> dir/index.html), or None."""
+        if path in self.files:
+            return path
+        if path in self.dirs:
+            index = posixpath.join(path, "index.html") if path else "index.html"
+            if index in self.files:
+                return index
+        return None
+
+    def check(self, check_fragments=True):
+        """Validate every link on every page; return broken link tuples."""
+        broken = []
+
+        for page in sorted(self.pages):
+            links, _ = self.pages[page]
+            for tag, attr, raw in links:
+                raw = raw.strip()
+                if not raw or raw.startswith(SKIP_SCHEMES) or raw.startswith("{{"):
+                    continue
+
+                mapped = self.to_site_path(page, raw)
+                if mapped is None:
+                    continue
+                path, fragment = mapped
+
+                target = self.resolve(path)
+                if target is None:
+                    broken.append((page, raw, path, "missing file"))
+                    continue
+
+                if check_fragments and fragment and target in self.pages:
+                    if unquote(fragment) not in self.pages[target][1]:
+                        broken.append((page, raw, f"{target}#{fragment}", "missing #id"))
+
+        return broken
+
+
+def check_site(root=ROOT_DIR, check_fragments=True):
+    """Build the index for root and return its broken links."""
+    return SiteIndex(root).build().check(check_fragments)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check site links offline against the files on disk")
+    parser.add_argument("--root", default=str(ROOT_DIR), help="Site root directory")
+    parser.add_argument("--no-fragments", action="store_true", help="Do not validate #fragment targets")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = SiteIndex(args.root).build()
+    broken_links = index.check(not args.no_fragments)
+    elapsed = time.perf_counter() - started
+
+    link_count = sum(len(links) for links, _ in index.pages.values())
+    print(f"Checked {link_count} links on {len(index.pages)} pages in {elapsed:.2f}s")
+
+    print("\n=== Broken / suspicious internal links ===")
+    if not broken_links:
+        print("None found ✅")
+    else:
+        for src, raw, full, status in broken_links:
+            print(f"On {src} -> '{raw}' -> {full} => {status}")
+
+    sys.exit(1 if broken_links else 0)
+
+
+if __name__ == "__main__":
+    main()
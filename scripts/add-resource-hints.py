@@ -4,9 +4,15 @@ Add Resource Hints for Performance Optimization
 Adds preload, prefetch, preconnect, and dns-prefetch hints
 """
 
-import re
+import argparse
 import os
 from pathlib import Path
+from typing import Optional
+
+from build_manifest import BuildManifest
+from html_document import HtmlDocument
+
+TRANSFORM_VERSION = "1"
 
 HTML_FILES = [
     "index.html",
@@ -19,13 +25,14 @@ HTML_FILES = [
     "sports/live.html",
 ]
 
-def add_resource_hints_to_head(content: str, filepath: str) -> tuple[str, list]:
+def add_resource_hints_to_head(doc: HtmlDocument, filepath: str) -> list:
     """Add resource hints to <head> section"""
     changes = []
+    content = doc.content
 
     # Check if resource hints already exist
     if 'rel="preconnect"' in content and 'rel="preload"' in content:
-        return content, changes
+        return changes
 
     # Resource hints to add
     hints = []
@@ -63,66 +70,62 @@ def add_resource_hints_to_head(content: str, filepath: str) -> tuple[str, list]:
         changes.append("Added performance.css")
 
     if not hints:
-        return content, changes
+        return changes
 
     # Find insertion point (after meta tags, before first CSS link or end of head)
     insertion_point = None
 
     # Try to insert after theme-color meta tag
-    match = re.search(r'<meta name="theme-color"[^>]*>\n', content)
-    if match:
-        insertion_point = match.end()
+    theme_color = next((t for t in doc.tags('meta') if t.get('name') == 'theme-color'), None)
+    if theme_color and content.startswith('\n', theme_color.end):
+        insertion_point = theme_color.end + 1
     else:
         # Insert before first link rel="stylesheet"
-        match = re.search(r'<link rel="stylesheet"', content)
-        if match:
-            insertion_point = match.start()
+        stylesheet = next((t for t in doc.tags('link') if t.get('rel') == 'stylesheet'), None)
+        if stylesheet:
+            insertion_point = stylesheet.start
         else:
             # Insert before </head>
-            match = re.search(r'</head>', content)
-            if match:
-                insertion_point = match.start()
+            insertion_point = doc.head_close
 
     if insertion_point:
         hints_text = '\n'.join(hints) + '\n\n'
-        content = content[:insertion_point] + hints_text + content[insertion_point:]
+        doc.insert(insertion_point, hints_text)
 
-    return content, changes
+    return changes
 
-def optimize_script_loading(content: str) -> tuple[str, list]:
+def optimize_script_loading(doc: HtmlDocument) -> list:
     """Ensure all scripts use defer or async"""
     changes = []
 
-    # Find script tags without defer/async (except inline scripts and JSON-LD)
-    script_pattern = r'<script\s+src="([^"]+)"([^>]*)></script>'
-
-    def replace_script(match):
-        nonlocal changes
-        src = match.group(1)
-        attrs = match.group(2)
+    # Script tags with src and no inline body (inline scripts and JSON-LD are left alone)
+    def replace_script(tag):
+        src = tag.get('src')
+        if not src or not tag.is_empty_element:
+            return None
 
         # Skip if already has defer or async
-        if 'defer' in attrs or 'async' in attrs:
-            return match.group(0)
+        if tag.has('defer') or tag.has('async'):
+            return None
 
-        # Skip if it's JSON-LD
-        if 'application/ld+json' in attrs:
-            return match.group(0)
+        # Skip if it's JSON-LD, or a module (deferred by default)
+        if tag.get('type') in ('application/ld+json', 'module'):
+            return None
 
         # Add defer for local scripts, async for CDN scripts
         if src.startswith('http'):
             # CDN scripts can use async
             changes.append(f"Added async to {src}")
-            return f'<script src="{src}"{attrs} async></script>'
+            return tag.with_attrs('async')
         else:
             # Local scripts should use defer to maintain order
             changes.append(f"Added defer to {src}")
-            return f'<script src="{src}"{attrs} defer></script>'
+            return tag.with_attrs('defer')
 
-    new_content = re.sub(script_pattern, replace_script, content)
-    return new_content, changes
+    doc.rewrite_tags('script', replace_script)
+    return changes
 
-def process_file(filepath: str) -> dict:
+def process_file(filepath: str, manifest: Optional[BuildManifest] = None) -> dict:
     """Process a single HTML file"""
     print(f"\n📄 Processing: {filepath}")
 
@@ -130,36 +133,46 @@ def process_file(filepath: str) -> dict:
         print(f"   ⚠️  File not found, skipping")
         return {"file": filepath, "changes": []}
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    if manifest and manifest.is_fresh(filepath):
+        print("   ⏭️  Unchanged since last run, skipping")
+        return {"file": filepath, "changes": []}
 
-    original_content = content
+    doc = HtmlDocument.load(filepath)
     all_changes = []
 
     # Add resource hints
-    content, changes = add_resource_hints_to_head(content, filepath)
+    changes = add_resource_hints_to_head(doc, filepath)
     all_changes.extend(changes)
     for change in changes:
         print(f"   ✓ {change}")
 
     # Optimize script loading
-    content, changes = optimize_script_loading(content)
+    changes = optimize_script_loading(doc)
     all_changes.extend(changes)
     for change in changes:
         print(f"   ✓ {change}")
 
     # Write back if changes were made
-    if content != original_content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+    if doc.save():
         print(f"   💾 Saved {len(all_changes)} optimization(s)")
     else:
         print("   ℹ️  No changes needed")
 
+    if manifest:
+        manifest.record(filepath)
+
     return {"file": filepath, "changes": all_changes}
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reprocess files even if unchanged since the last run"
+    )
+    args = parser.parse_args()
+
     print("=" * 70)
     print("⚡ Resource Hints & Script Optimization")
     print("=" * 70)
@@ -171,22 +184,27 @@ def main():
     project_root = script_dir.parent
     os.chdir(project_root)
 
+    manifest = BuildManifest.load("add-resource-hints", TRANSFORM_VERSION, force=args.force)
+
     results = []
     total_files = 0
     total_changes = 0
 
     for html_file in HTML_FILES:
-        result = process_file(html_file)
+        result = process_file(html_file, manifest)
         results.append(result)
         if result["changes"]:
             total_files += 1
             total_changes += len(result["changes"])
 
+    manifest.save()
+
     # Summary
     print("\n" + "=" * 70)
     print("📊 SUMMARY")
     print("=" * 70)
     print(f"Total files processed: {len(HTML_FILES)}")
+    print(f"Unchanged (skipped): {manifest.skipped}")
     print(f"Files modified: {total_files}")
     print(f"Total improvements: {total_changes}")
 
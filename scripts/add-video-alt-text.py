@@ -3,8 +3,21 @@
 Add ARIA labels to product videos for screen reader accessibility
 """
 
+import argparse
 import re
 from pathlib import Path
+from typing import Optional
+
+from build_manifest import BuildManifest
+from html_document import HtmlDocument
+
+TRANSFORM_VERSION = "1"
+
+# HTML files with product videos
+HTML_FILES = [
+    "iptv-products.html",
+    "tv-box-products.html",
+]
 
 # Product video descriptions based on the product names
 VIDEO_DESCRIPTIONS = {
@@ -19,42 +32,32 @@ VIDEO_DESCRIPTIONS = {
     "The world TV": "Global Hospitality IPTV package preview - Worldwide channels",
 }
 
-def add_aria_labels_to_videos(content: str, file_name: str) -> tuple[str, int]:
+def add_aria_labels_to_videos(doc: HtmlDocument) -> int:
     """Add aria-label attributes to video elements"""
-    changes = 0
 
-    # Find all video elements with poster attributes
-    video_pattern = r'<video class="catalog-video[^"]*"([^>]*?)>(.*?)</video>'
-
-    def replace_video(match):
-        nonlocal changes
-        full_tag = match.group(0)
-        video_attrs = match.group(1)
-        video_content = match.group(2)
+    def replace_video(tag):
+        # Only product catalog videos
+        if not tag.get('class', '').startswith('catalog-video'):
+            return None
 
         # Check if aria-label already exists
-        if 'aria-label=' in video_attrs:
-            return full_tag  # No change
+        if tag.has('aria-label'):
+            return None  # No change
 
         # Extract poster filename to determine description
-        poster_match = re.search(r'poster="[^"]*/([\w%\s]+)\.jpg"', video_attrs)
+        poster_match = re.search(r'/([\w%\s]+)\.jpg$', tag.get('poster', ''))
         if not poster_match:
-            return full_tag
+            return None
 
         filename = poster_match.group(1).replace('%20', ' ')
         description = VIDEO_DESCRIPTIONS.get(filename, f"{filename} package preview")
 
         # Add aria-label before the closing >
-        new_attrs = video_attrs.rstrip() + f' aria-label="{description}"'
-        changes += 1
-
-        return f'<video class="catalog-video hover-play lazy-video" {new_attrs}>{video_content}</video>'
+        return tag.with_attrs(f'aria-label="{description}"')
 
-    new_content = re.sub(video_pattern, replace_video, content, flags=re.DOTALL)
+    return doc.rewrite_tags('video', replace_video)
 
-    return new_content, changes
-
-def process_file(file_path: str):
+def process_file(file_path: str, manifest: Optional[BuildManifest] = None):
     """Process a single HTML file"""
     path = Path(file_path)
 
@@ -64,38 +67,50 @@ def process_file(file_path: str):
 
     print(f"\n📄 Processing: {file_path}")
 
+    if manifest and manifest.is_fresh(path):
+        print("   ⏭️  Unchanged since last run, skipping")
+        return 0
+
     # Read file
-    content = path.read_text(encoding='utf-8')
+    doc = HtmlDocument.load(path)
 
     # Add aria-labels to videos
-    new_content, changes = add_aria_labels_to_videos(content, path.name)
+    changes = add_aria_labels_to_videos(doc)
 
-    if changes > 0:
-        # Write back
-        path.write_text(new_content, encoding='utf-8')
+    if doc.save():
         print(f"   ✓ Added aria-label to {changes} video element(s)")
     else:
         print(f"   ℹ️  No changes needed")
 
+    if manifest:
+        manifest.record(path)
+
     return changes
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description="Add ARIA labels to product videos")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reprocess files even if unchanged since the last run"
+    )
+    args = parser.parse_args()
+
     print("=" * 70)
     print("📹 Adding ARIA Labels to Product Videos")
     print("=" * 70)
 
-    files = [
-        "iptv-products.html",
-        "tv-box-products.html",
-    ]
+    manifest = BuildManifest.load("add-video-alt-text", TRANSFORM_VERSION, force=args.force)
 
     total_changes = 0
-    for file in files:
-        changes = process_file(file)
+    for file in HTML_FILES:
+        changes = process_file(file, manifest)
         if changes:
             total_changes += changes
 
+    manifest.save()
+
     print("\n" + "=" * 70)
     print(f"✅ Added {total_changes} aria-label attributes to videos")
     print("=" * 70)
@@ -12,10 +12,16 @@ This script applies comprehensive accessibility improvements:
 - Ensures proper heading hierarchy
 """
 
+import argparse
 import re
 import os
 from pathlib import Path
-from typing import List, Tuple
+from typing import Optional
+
+from build_manifest import BuildManifest
+from html_document import HtmlDocument
+
+TRANSFORM_VERSION = "1"
 
 # HTML files to process
 HTML_FILES = [
@@ -29,49 +35,43 @@ HTML_FILES = [
     "sports/live.html",
 ]
 
-def read_file(filepath: str) -> str:
-    """Read file content"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return f.read()
-
-def write_file(filepath: str, content: str):
-    """Write content to file"""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-
-def add_accessibility_css(content: str) -> Tuple[str, bool]:
+def add_accessibility_css(doc: HtmlDocument) -> bool:
     """Add accessibility.css link if not present"""
-    if 'accessibility.css' in content:
-        return content, False
+    if 'accessibility.css' in doc.content:
+        return False
 
-    # Find ui-ux-fixes.css and add accessibility.css after it
-    pattern = r'(<link rel="stylesheet" href="\./assets/css/ui-ux-fixes\.css"/>)'
-    replacement = r'\1\n<link rel="stylesheet" href="./assets/css/accessibility.css"/>'
+    link = '<link rel="stylesheet" href="./assets/css/accessibility.css"/>'
 
-    new_content = re.sub(pattern, replacement, content, count=1)
+    # Find ui-ux-fixes.css and add accessibility.css after it
+    ui_fixes = next((t for t in doc.tags('link')
+                     if t.get('rel') == 'stylesheet' and t.get('href') == './assets/css/ui-ux-fixes.css'), None)
+    if ui_fixes:
+        doc.insert(ui_fixes.end, f'\n{link}')
+        return True
 
     # If ui-ux-fixes.css not found, add before </head>
-    if new_content == content:
-        pattern = r'(</head>)'
-        replacement = r'<link rel="stylesheet" href="./assets/css/accessibility.css"/>\n\1'
-        new_content = re.sub(pattern, replacement, content, count=1)
+    if doc.head_close is not None:
+        doc.insert(doc.head_close, f'{link}\n')
+        return True
 
-    return new_content, new_content != content
+    return False
 
-def add_skip_link(content: str) -> Tuple[str, bool]:
+def add_skip_link(doc: HtmlDocument) -> bool:
     """Add skip-to-main-content link after <body>"""
-    if 'skip-to-main' in content:
-        return content, False
+    if 'skip-to-main' in doc.content:
+        return False
 
-    pattern = r'(<body[^>]*>)'
-    replacement = r'\1\n<!-- Skip to main content for keyboard users -->\n<a href="#main-content" class="skip-to-main">Skip to main content</a>\n'
+    body = doc.first('body')
+    if not body:
+        return False
 
-    new_content = re.sub(pattern, replacement, content, count=1)
-    return new_content, new_content != content
+    doc.insert(body.end, '\n<!-- Skip to main content for keyboard users -->\n<a href="#main-content" class="skip-to-main">Skip to main content</a>\n')
+    return True
 
-def add_aria_landmarks(content: str) -> Tuple[str, bool]:
+def add_aria_landmarks(doc: HtmlDocument) -> bool:
     """Add ARIA roles to semantic elements"""
     changed = False
+    content = doc.content
 
     # Add role="banner" to header if not present
     if '<header' in content and 'role="banner"' not in content:
@@ -121,11 +121,13 @@ def add_aria_landmarks(content: str) -> Tuple[str, bool]:
         )
         changed = True
 
-    return content, changed
+    doc.content = content
+    return changed
 
-def improve_button_aria_labels(content: str) -> Tuple[str, bool]:
+def improve_button_aria_labels(doc: HtmlDocument) -> bool:
     """Add aria-labels to buttons that need them"""
     changed = False
+    content = doc.content
 
     # Nav toggle button
     if 'nav-toggle' in content and 'aria-label="Open navigation menu"' not in content:
@@ -136,11 +138,13 @@ def improve_button_aria_labels(content: str) -> Tuple[str, bool]:
         )
         changed = True
 
-    return content, changed
+    doc.content = content
+    return changed
 
-def improve_image_alt_text(content: str) -> Tuple[str, bool]:
+def improve_image_alt_text(doc: HtmlDocument) -> bool:
     """Improve alt text for logo images"""
     changed = False
+    content = doc.content
 
     # Header logo
     if 'header-logo' in content:
@@ -165,9 +169,10 @@ def improve_image_alt_text(content: str) -> Tuple[str, bool]:
         content
     )
 
-    return content, changed
+    doc.content = content
+    return changed
 
-def process_file(filepath: str) -> dict:
+def process_file(filepath: str, manifest: Optional[BuildManifest] = None) -> dict:
     """Process a single HTML file with all accessibility fixes"""
     print(f"\n📄 Processing: {filepath}")
 
@@ -175,46 +180,61 @@ def process_file(filepath: str) -> dict:
         print(f"   ⚠️  File not found, skipping")
         return {"file": filepath, "changes": []}
 
-    content = read_file(filepath)
+    if manifest and manifest.is_fresh(filepath):
+        print("   ⏭️  Unchanged since last run, skipping")
+        return {"file": filepath, "changes": []}
+
+    doc = HtmlDocument.load(filepath)
     changes = []
 
     # Apply all fixes
-    content, changed = add_accessibility_css(content)
+    changed = add_accessibility_css(doc)
     if changed:
         changes.append("Added accessibility.css")
         print("   ✓ Added accessibility.css link")
 
-    content, changed = add_skip_link(content)
+    changed = add_skip_link(doc)
     if changed:
         changes.append("Added skip-to-main link")
         print("   ✓ Added skip-to-main-content link")
 
-    content, changed = add_aria_landmarks(content)
+    changed = add_aria_landmarks(doc)
     if changed:
         changes.append("Added ARIA landmarks")
         print("   ✓ Added ARIA landmark roles")
 
-    content, changed = improve_button_aria_labels(content)
+    changed = improve_button_aria_labels(doc)
     if changed:
         changes.append("Improved button aria-labels")
         print("   ✓ Improved button aria-labels")
 
-    content, changed = improve_image_alt_text(content)
+    changed = improve_image_alt_text(doc)
     if changed:
         changes.append("Improved image alt text")
         print("   ✓ Improved image alt text")
 
     # Write back if changes were made
     if changes:
-        write_file(filepath, content)
+        doc.save()
         print(f"   💾 Saved {len(changes)} accessibility improvements")
     else:
         print("   ℹ️  No changes needed (already accessible)")
 
+    if manifest:
+        manifest.record(filepath)
+
     return {"file": filepath, "changes": changes}
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reprocess files even if unchanged since the last run"
+    )
+    args = parser.parse_args()
+
     print("=" * 70)
     print("🔍 WCAG 2.1 AA Accessibility Fixes")
     print("=" * 70)
@@ -224,22 +244,27 @@ def main():
     project_root = script_dir.parent
     os.chdir(project_root)
 
+    manifest = BuildManifest.load("apply-accessibility-fixes", TRANSFORM_VERSION, force=args.force)
+
     results = []
     total_files = 0
     total_changes = 0
 
     for html_file in HTML_FILES:
-        result = process_file(html_file)
+        result = process_file(html_file, manifest)
         results.append(result)
         if result["changes"]:
             total_files += 1
             total_changes += len(result["changes"])
 
+    manifest.save()
+
     # Summary
     print("\n" + "=" * 70)
     print("📊 SUMMARY")
     print("=" * 70)
     print(f"Total files processed: {len(HTML_FILES)}")
+    print(f"Unchanged (skipped): {manifest.skipped}")
     print(f"Files modified: {total_files}")
     print(f"Total improvements: {total_changes}")
 
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Incremental build manifest for the HTML post-processors.
+
+Records, per transform, the content hash of every file it last produced and
+the transform's version. A file whose current hash still matches (and whose
+transform version is unchanged) is already in its processed state and is
+skipped on the next run. Size + mtime are checked first, so unchanged files
+are not even re-read.
+
+Transforms that read other files (e.g. image dimensions) can record them as
+dependencies; a change to any dependency makes the page stale again. Inputs
+that aren't whole files (config keys, computed values) can be recorded as
+{name: digest} values and are checked against a caller-supplied lookup.
+
+Each post-processor defines a module-level TRANSFORM_VERSION and loads its
+manifest with it. Bump a script's TRANSFORM_VERSION whenever its output
+changes, so files processed by the old version are reprocessed, or run it
+with --force to reprocess everything.
+
+Usage:
+    from build_manifest import BuildManifest
+
+    manifest = BuildManifest.load("fix-cls-images", TRANSFORM_VERSION)
+    if not manifest.is_fresh("index.html"):
+        ...  # process and save the file
+        manifest.record("index.html", deps=["assets/logo.png"])
+    manifest.save()
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+ROOT_DIR = Path(__file__).parent.parent
+MANIFEST_FILE = ROOT_DIR / ".build-cache.json"
+MANIFEST_FORMAT = 1
+
+
+def file_hash(path) -> str:
+    """SHA-256 of a file's bytes."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def file_signature(path) -> Optional[list]:
+    """[size, mtime_ns] for a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def manifest_key(path) -> str:
+    """Manifest keys are POSIX paths relative to the project root."""
+    path = Path(path)
+    if not path.is_absolute():
+        path = Path.cwd() / path
+    try:
+        return path.resolve().relative_to(ROOT_DIR.resolve()).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+class BuildManifest:
+    """One transform's view of the shared .build-cache.json."""
+
+    def __init__(self, transform: str, version: str, files: Optional[Dict] = None,
+                 path: Path = MANIFEST_FILE, enabled: bool = True):
+        self.transform = transform
+        self.version = str(version)
+        self.files = files or {}
+        self.path = Path(path)
+        self.enabled = enabled
+        self.skipped = 0
+
+    @classmethod
+    def load(cls, transform: str, version, force: bool = False,
+             enabled: bool = True, path: Path = MANIFEST_FILE) -> "BuildManifest":
+        """
+        Load the transform's entries. A version change discards them.
+        force starts from an empty section (everything is reprocessed and
+        re-recorded); enabled=False turns the manifest off entirely (dry runs).
+        """
+        files = {}
+        if enabled and not force:
+            section = cls._read(path).get("transforms", {}).get(transform, {})
+            if section.get("version") == str(version):
+                files = section.get("files", {})
+        return cls(transform, version, files, path, enabled)
+
+    @staticmethod
+    def _read(path: Path) -> Dict:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("format") != MANIFEST_FORMAT:
+            return {}
+        return data
+
+    def is_fresh(self, filepath, current_value: Optional[Callable[[str], Optional[str]]] = None) -> bool:
+        """
+        True if filepath is unchanged since this transform last recorded it.
+        current_value(name) returns the current digest of a recorded value dependency.
+        """
+        if not self.enabled:
+            return False
+
+        entry = self.files.get(manifest_key(filepath))
+        if not entry:
+            return False
+
+        signature = file_signature(filepath)
+        if signature is None:
+            return False
+
+        # Dependencies are compared by size + mtime only
+        for dep, dep_signature in entry.get("deps", {}).items():
+            if file_signature(ROOT_DIR / dep) != dep_signature:
+                return False
+
+        values = entry.get("values", {})
+        if values:
+            if current_value is None:
+                return False
+            for name, digest in values.items():
+                if current_value(name) != digest:
+                    return False
+
+        if signature != entry["stat"]:
+            # Touched but maybe not modified: fall back to the content hash
+            if file_hash(filepath) != entry["sha256"]:
+                return False
+            entry["stat"] = signature
+
+        self.skipped += 1
+        return True
+
+    def record(self, filepath, deps: Iterable = (), values: Optional[Dict[str, Optional[str]]] = None):
+        """Record filepath's current content as this transform's output."""
+        if not self.enabled:
+            return
+        signature = file_signature(filepath)
+        if signature is None:
+            self.files.pop(manifest_key(filepath), None)
+            return
+
+        entry = {"sha256": file_hash(filepath), "stat": signature}
+        dep_keys = sorted({manifest_key(dep) for dep in deps})
+        if dep_keys:
+            entry["deps"] = {dep: file_signature(ROOT_DIR / dep) for dep in dep_keys}
+        if values:
+            entry["values"] = dict(sorted(values.items()))
+        self.files[manifest_key(filepath)] = entry
+
+    def save(self):
+        """Merge this transform's section into the manifest file atomically."""
+        if not self.enabled:
+            return
+
+        data = self._read(self.path)
+        data["format"] = MANIFEST_FORMAT
+        transforms = data.setdefault("transforms", {})
+        transforms[self.transform] = {
+            "version": self.version,
+            "files": dict(sorted(self.files.items())),
+        }
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".build-cache.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Config-key dependency tracking for minimal rebuilds.
+
+Rendered pages depend on a handful of values in _config/languages.json, not
+on the whole file. TrackedConfig is a read-only view of the config that
+records the dotted path and a digest of every value read through it, so a
+build can store exactly which keys each page consumed (together with the
+partials it included, in build_manifest.py) and the next build can re-render
+only the pages whose keys changed. Editing one French SEO string then
+touches the French pages that use it, not every language.
+
+Reading a key that doesn't exist is recorded too (digest None), so adding
+it later invalidates the pages that fell back to a default. Iterating over
+an object records its key list.
+
+Usage:
+    from dependency_tracker import TrackedConfig, config_digest
+
+    tracked = TrackedConfig(config)
+    title = tracked["languages"]["fr"]["seo"]["faq"]["title"]
+    tracked.reads   # {"languages.fr.seo.faq.title": "3f0c..."}
+
+    # Next build: is the recorded key still the same?
+    config_digest(config, "languages.fr.seo.faq.title") == tracked.reads[...]
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterator, Optional
+
+# Prefixes of value-dependency names in the build manifest
+CONFIG_PREFIX = "config:"
+VALUE_PREFIX = "value:"
+
+_MISSING = object()
+
+
+def value_digest(value: Any) -> Optional[str]:
+    """Short digest of a config value; objects digest their key list."""
+    if value is _MISSING:
+        return None
+    if isinstance(value, dict):
+        value = {"keys": list(value)}
+    encoded = json.dumps(value, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def lookup(config: Dict, path: str) -> Any:
+    """Value at a dotted path, or _MISSING."""
+    value = config
+    for key in path.split(".") if path else []:
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def config_digest(config: Dict, path: str) -> Optional[str]:
+    """Current digest of the value at a dotted path (None if it doesn't exist)."""
+    return value_digest(lookup(config, path))
+
+
+class TrackedConfig:
+    """Read-only view of a config dict that records every value read, by dotted path."""
+
+    def __init__(self, data: Dict, reads: Optional[Dict[str, Optional[str]]] = None, path: str = ""):
+        self._data = data
+        self._path = path
+        self.reads: Dict[str, Optional[str]] = {} if reads is None else reads
+
+    def _child_path(self, key) -> str:
+        return f"{self._path}.{key}" if self._path else str(key)
+
+    def _read(self, key):
+        """Value of key: nested objects come back tracked, leaves are recorded."""
+        path = self._child_path(key)
+        if key not in self._data:
+            self.reads[path] = None
+            return _MISSING
+        value = self._data[key]
+        if isinstance(value, dict):
+            return TrackedConfig(value, self.reads, path)
+        self.reads[path] = value_digest(value)
+        return value
+
+    def __getitem__(self, key):
+        value = self._read(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = self._read(key)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key) -> bool:
+        if key not in self._data:
+            self.reads[self._child_path(key)] = None
+            return False
+        return True
+
+    def __iter__(self) -> Iterator:
+        self.reads[self._path] = value_digest(self._data)
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        self.reads[self._path] = value_digest(self._data)
+        return len(self._data)
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Inverted lookup indexes for the sports events feed.
+
+Finding "what's on today for Arsenal" in events.json means scanning every
+event of every league. build_indexes() precomputes the lookups once per
+fetch; event_shards.write_shards() writes them as compact JSON next to the
+shards (events/index/<name>.json) and lists them in the manifest:
+
+    teams      team key    -> [event ids]
+    dates      YYYY-MM-DD  -> [event ids]
+    stations   station key -> [event ids]
+    sports     sport key   -> [league slugs]
+    events     event id    -> [date, [league slugs]]  (which shard holds it)
+
+Team, station and sport keys are index_key() of the name: casefolded, with
+runs of anything but letters and digits turned into single dashes
+("Manchester United" -> "manchester-united"). Event ids are listed in start
+order, each once, even when an event appears in several leagues.
+
+So "Arsenal today" is teams["arsenal"] intersected with dates[today], and
+events[id] names the day or league shard to load the events from.
+
+Usage:
+    from event_indexes import build_indexes, index_key
+
+    indexes = build_indexes(events_data)
+    indexes["teams"][index_key("Arsenal")]
+"""
+
+import re
+from typing import Any, Dict, List
+
+INDEX_NAMES = ("teams", "dates", "stations", "sports", "events")
+
+NON_KEY_RE = re.compile(r"[\W_]+")
+
+
+def index_key(name: str) -> str:
+    """Lookup key for a team, station or sport name."""
+    return NON_KEY_RE.sub("-", name.casefold()).strip("-")
+
+
+def _add(index: Dict[str, List[str]], key: str, value: str):
+    values = index.setdefault(key, [])
+    if value not in values:
+        values.append(value)
+
+
+def build_indexes(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """{index name: index} for a feed; keys are sorted so unchanged indexes stay byte-identical."""
+    teams: Dict[str, List[str]] = {}
+    dates: Dict[str, List[str]] = {}
+    stations: Dict[str, List[str]] = {}
+    sports: Dict[str, List[str]] = {}
+    locations: Dict[str, List[Any]] = {}
+
+    entries = []
+    for league in data["leagues"]:
+        if league.get("sport"):
+            _add(sports, index_key(league["sport"]), league["slug"])
+        for event in league["events"]:
+            if event.get("id") is not None:
+                entries.append((event.get("start", {}).get("utc") or "", str(event["id"]),
+                                event, league["slug"]))
+    entries.sort(key=lambda entry: entry[:2])
+
+    for _, event_id, event, slug in entries:
+        date = event.get("start", {}).get("date")
+        if event_id in locations:
+            # The same event listed under another league
+            if slug not in locations[event_id][1]:
+                locations[event_id][1].append(slug)
+            continue
+        locations[event_id] = [date, [slug]]
+
+        if date:
+            _add(dates, date, event_id)
+        for side in ("homeTeam", "awayTeam"):
+            name = (event.get(side) or {}).get("name")
+            if name and index_key(name):
+                _add(teams, index_key(name), event_id)
+        for station in event.get("tvStations") or []:
+            if index_key(station):
+                _add(stations, index_key(station), event_id)
+
+    indexes = {
+        "teams": teams,
+        "dates": dates,
+        "stations": stations,
+        "sports": sports,
+        "events": locations,
+    }
+    return {name: dict(sorted(index.items())) for name, index in indexes.items()}
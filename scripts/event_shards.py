@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Minified per-league and per-day shards of the sports events feed.
+
+events.json holds every league for the next 60 days, pretty-printed. Next
+to it, write_shards() writes compact copies split two ways, plus an index:
+
+    events/league/<slug>.json    one league with all its events
+    events/day/<YYYY-MM-DD>.json every league's events starting that (UTC) day
+    events/index/<name>.json     lookup indexes, if given (see event_indexes.py)
+    events/manifest.json         every file with its event or key count, size and hash
+
+A shard has the same shape as events.json ({"source", "leagues": [...]})
+minus generatedAt, so unchanged shards stay byte-identical between runs and
+events.js can load one through data-events-feed as it is. The manifest hash
+(SHA-256, 16 hex digits) doubles as a cache-busting query string.
+
+Only shards whose bytes changed are rewritten, each atomically. The
+manifest is written after them and shards it no longer lists (past days,
+removed leagues) are deleted last, so the manifest never points at a
+missing file.
+
+check_day_shard() verifies that a day's shard (today's, for the live page)
+exists whenever the feed has events on that day.
+
+Usage:
+    from event_shards import check_day_shard, write_shards
+
+    stats = write_shards(events_data, "../assets/js/events", build_indexes(events_data))
+    problem = check_day_shard(events_data, "../assets/js/events", "2025-11-25")
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+MANIFEST_NAME = "manifest.json"
+SHARD_KINDS = ("league", "day", "index")
+MANIFEST_SECTIONS = ("leagues", "days", "indexes")
+
+# League fields copied into every shard next to its events
+LEAGUE_FIELDS = ("leagueId", "slug", "label", "sport")
+
+
+def compact_json(data: Any) -> bytes:
+    """Minified UTF-8 JSON."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+def write_if_changed(path: Path, content: bytes) -> bool:
+    """Atomically replace path with content unless it already holds it. Returns True if written."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+
+def league_header(league: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: league.get(field) for field in LEAGUE_FIELDS}
+
+
+def build_shards(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """{relative shard path: shard document}, league shards first, then days in date order."""
+    source = data.get("source")
+    shards = {}
+
+    for league in data["leagues"]:
+        shards[f"league/{league['slug']}.json"] = {"source": source, "leagues": [league]}
+
+    # date -> slug -> events, keeping feed order within each day
+    days: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    for league in data["leagues"]:
+        for event in league["events"]:
+            date = event.get("start", {}).get("date")
+            if date:
+                days.setdefault(date, {}).setdefault(league["slug"], []).append(event)
+
+    headers = {league["slug"]: league_header(league) for league in data["leagues"]}
+    for date in sorted(days):
+        shards[f"day/{date}.json"] = {
+            "source": source,
+            "leagues": [dict(headers[slug], events=events) for slug, events in days[date].items()],
+        }
+
+    return shards
+
+
+def write_shards(data: Dict[str, Any], directory,
+                 indexes: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, int]:
+    """
+    Write the league and day shards of a feed, its {name: index} lookup
+    indexes and the manifest into directory. Returns counts: leagues, days,
+    indexes, written, unchanged, removed and bytes (largest shard).
+    """
+    directory = Path(directory)
+    stats = {"leagues": 0, "days": 0, "indexes": 0, "written": 0, "unchanged": 0,
+             "removed": 0, "bytes": 0}
+    manifest = {
+        "generatedAt": data.get("generatedAt"),
+        "source": data.get("source"),
+        "totalEvents": sum(len(league["events"]) for league in data["leagues"]),
+        "leagues": {},
+        "days": {},
+        "indexes": {},
+    }
+
+    for relative_path, shard in build_shards(data).items():
+        content = compact_json(shard)
+        kind, name = relative_path.split("/", 1)
+        key = name[:-len(".json")]
+        entry = {
+            "path": relative_path,
+            "events": sum(len(league["events"]) for league in shard["leagues"]),
+            "bytes": len(content),
+            "hash": content_hash(content),
+        }
+        if kind == "league":
+            league = shard["leagues"][0]
+            entry = dict(label=league.get("label"), sport=league.get("sport"), **entry)
+            manifest["leagues"][key] = entry
+            stats["leagues"] += 1
+        else:
+            entry = dict(leagues=[league["slug"] for league in shard["leagues"]], **entry)
+            manifest["days"][key] = entry
+            stats["days"] += 1
+
+        stats["bytes"] = max(stats["bytes"], len(content))
+        if write_if_changed(directory / relative_path, content):
+            stats["written"] += 1
+        else:
+            stats["unchanged"] += 1
+
+    for name, index in (indexes or {}).items():
+        relative_path = f"index/{name}.json"
+        content = compact_json(index)
+        manifest["indexes"][name] = {
+            "path": relative_path,
+            "keys": len(index),
+            "bytes": len(content),
+            "hash": content_hash(content),
+        }
+        stats["indexes"] += 1
+        if write_if_changed(directory / relative_path, content):
+            stats["written"] += 1
+        else:
+            stats["unchanged"] += 1
+
+    if write_if_changed(directory / MANIFEST_NAME, compact_json(manifest)):
+        stats["written"] += 1
+    else:
+        stats["unchanged"] += 1
+
+    listed = {entry["path"] for section in MANIFEST_SECTIONS for entry in manifest[section].values()}
+    for kind in SHARD_KINDS:
+        for path in sorted((directory / kind).glob("*.json")):
+            if f"{kind}/{path.name}" not in listed:
+                path.unlink()
+                stats["removed"] += 1
+
+    return stats
+
+
+def check_day_shard(data: Dict[str, Any], directory, date: str) -> Optional[str]:
+    """
+    Problem with a day's shard, or None: if the feed has events starting
+    on date (YYYY-MM-DD), day/<date>.json must exist and hold all of them.
+    """
+    expected = sum(1 for league in data["leagues"] for event in league["events"]
+                   if event.get("start", {}).get("date") == date)
+    if not expected:
+        return None
+
+    path = Path(directory) / "day" / f"{date}.json"
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            shard = json.load(f)
+    except (OSError, ValueError):
+        return f"day/{date}.json is missing but the feed has {expected} events that day"
+
+    found = sum(len(league.get("events", [])) for league in shard.get("leagues", []))
+    if found != expected:
+        return f"day/{date}.json has {found} events, the feed has {expected}"
+    return None
+
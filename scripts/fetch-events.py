@@ -5,34 +5,85 @@ Sports Events Fetcher for TVMaster VIP
 Automatically fetches upcoming sports events from TheSportsDB API
 and updates the events.json file for the live sports hub.
 
+Leagues are fetched concurrently by a small thread pool sharing one
+HttpClient (see http_fetch.py): a token bucket holds the whole run to the
+API's rate limit, each worker reuses a keep-alive connection, and failed
+requests are retried with jittered backoff. A refresh therefore takes about
+as long as the rate cap allows, not the sum of every league's round-trip.
+Results are reported in LEAGUES_CONFIG order, whatever order they arrive in.
+
+Responses are cached in .http-cache/ (see response_cache.py): within
+--max-age seconds a league is served from disk without a request, after that
+it is revalidated with a conditional request, so a frequent cron costs
+almost nothing while TheSportsDB's data hasn't changed.
+
+The fetched events are merged into the existing events.json, keyed by event
+id: new and changed events are upserted, events that have left the
+DAYS_AHEAD window expire, and a league whose fetch failed keeps its
+last-known-good events instead of vanishing from the hub. The file is
+written atomically (temp file + rename) and left untouched when nothing
+changed. --full regenerates it from this run's data alone.
+
+Minified shards are written next to the feed (see event_shards.py): one per
+league, one per day and a manifest with counts and hashes, so the live page
+can load just today's or one league's events instead of the whole feed.
+Lookup indexes (team, date and TV station -> event ids, sport -> leagues;
+see event_indexes.py) are written with them, so finding an event doesn't
+take a scan of every league.
+
 Usage:
     python3 fetch-events.py
+    python3 fetch-events.py --workers 4 --rate 2 --retries 3
+    python3 fetch-events.py --api-base http://127.0.0.1:8000/api/v1/json/3
+    python3 fetch-events.py --max-age 0     # always revalidate
+    python3 fetch-events.py --no-cache
+    python3 fetch-events.py --full          # don't merge with the existing feed
+    python3 fetch-events.py --no-shards
+    python3 fetch-events.py --no-indexes
 
 Requirements:
-    pip install requests
+    Python 3 standard library only
 
 TheSportsDB API:
     Free tier: 2 requests per second
     Premium: Unlimited (Patreon supporters get API key)
 """
 
+import argparse
 import json
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
-import urllib.request
-import urllib.error
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional
+
+from event_indexes import build_indexes
+from event_shards import MANIFEST_NAME, check_day_shard, write_shards
+from http_fetch import FetchError, HttpClient
+from response_cache import CACHE_DIR, ResponseCache
 
 # Configuration
 OUTPUT_FILE = "../assets/js/events.json"
 DAYS_AHEAD = 60  # Fetch events for next 60 days
 
+# start.time of events the API lists without a kick-off time
+NO_TIME = "00:00"
+
 # TheSportsDB API Configuration
 # Free API key for testing (limited to 2 requests/second)
 API_KEY = "3"  # Use "3" for testing or get your own from https://www.thesportsdb.com/api.php
 API_BASE = f"https://www.thesportsdb.com/api/v1/json/{API_KEY}"
 
+# Request pacing (--rate 0 lifts the limit for premium keys)
+RATE_LIMIT = 2.0  # requests per second
+MAX_WORKERS = 4
+MAX_RETRIES = 3
+
+# Cached responses younger than this are used without asking the API
+CACHE_MAX_AGE = 15 * 60  # seconds
+
 # Leagues to fetch (leagueId from TheSportsDB)
 LEAGUES_CONFIG = [
     # Soccer / Football
@@ -65,28 +116,16 @@ LEAGUES_CONFIG = [
 ]
 
 
-def fetch_url(url: str) -> Dict[str, Any]:
-    """Fetch data from URL with error handling"""
-    try:
-        print(f"  Fetching: {url}")
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            return data
-    except urllib.error.HTTPError as e:
-        print(f"  ❌ HTTP Error {e.code}: {e.reason}")
-        return {}
-    except urllib.error.URLError as e:
-        print(f"  ❌ URL Error: {e.reason}")
-        return {}
-    except Exception as e:
-        print(f"  ❌ Error: {str(e)}")
-        return {}
+def fetch_url(client: HttpClient, url: str) -> Dict[str, Any]:
+    """Fetch and decode a JSON document. Raises FetchError once retries are exhausted."""
+    data = client.get_json(url)
+    return data if isinstance(data, dict) else {}
 
 
-def fetch_league_events(league_id: str) -> List[Dict[str, Any]]:
+def fetch_league_events(client: HttpClient, league_id: str, api_base: str = API_BASE) -> List[Dict[str, Any]]:
     """Fetch upcoming events for a specific league"""
-    url = f"{API_BASE}/eventsnextleague.php?id={league_id}"
-    data = fetch_url(url)
+    url = f"{api_base}/eventsnextleague.php?id={league_id}"
+    data = fetch_url(client, url)
 
     if not data or "events" not in data or not data["events"]:
         return []
@@ -130,7 +169,7 @@ def parse_event(event_data: Dict[str, Any]) -> Dict[str, Any]:
         "start": {
             "utc": utc_datetime,
             "date": date_str,
-            "time": time_str or "00:00"
+            "time": time_str or NO_TIME
         },
         "venue": event_data.get("strVenue"),
         "city": event_data.get("strCity"),
@@ -161,64 +200,183 @@ def parse_event(event_data: Dict[str, Any]) -> Dict[str, Any]:
     return event
 
 
-def filter_upcoming_events(events: List[Dict[str, Any]], days: int = DAYS_AHEAD) -> List[Dict[str, Any]]:
-    """Filter events to only include those in the next X days"""
-    now = datetime.utcnow()
+def event_start(event: Dict[str, Any]) -> Optional[datetime]:
+    """
+    When an event starts (naive UTC): start.utc, or the end of start.date for
+    events without a kick-off time, so they stay listed for their whole day.
+    """
+    start = event.get("start") or {}
+
+    if start.get("utc") and start.get("time") != NO_TIME:
+        try:
+            parsed = datetime.fromisoformat(start["utc"].rstrip("Z"))
+        except ValueError:
+            parsed = None
+        if parsed is not None:
+            if parsed.tzinfo is not None:
+                parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+            return parsed
+
+    try:
+        day = datetime.strptime(start.get("date") or "", "%Y-%m-%d")
+    except ValueError:
+        return None
+    return day + timedelta(days=1) - timedelta(seconds=1)
+
+
+def filter_upcoming_events(events: List[Dict[str, Any]], days: int = DAYS_AHEAD,
+                           now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Filter events to only include those starting in the next X days"""
+    now = now or datetime.utcnow()
     cutoff = now + timedelta(days=days)
 
     filtered = []
     for event in events:
-        date_str = event.get("start", {}).get("date")
-        if not date_str:
-            continue
-
-        try:
-            event_date = datetime.strptime(date_str, "%Y-%m-%d")
-            if now <= event_date <= cutoff:
-                filtered.append(event)
-        except:
-            continue
+        start = event_start(event)
+        if start is not None and now <= start <= cutoff:
+            filtered.append(event)
 
     return filtered
 
 
-def fetch_all_events() -> Dict[str, Any]:
-    """Fetch events from all configured leagues"""
-    print("\n🔄 Fetching sports events from TheSportsDB...\n")
+def fetch_all_events(client: HttpClient, api_base: str = API_BASE,
+                     workers: int = MAX_WORKERS) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+    """
+    Fetch events from all configured leagues.
+    Returns {league slug: upcoming events}, with None for leagues whose fetch failed.
+    """
+    print(f"\n🔄 Fetching sports events from TheSportsDB "
+          f"({workers} workers, {client.limiter.rate or 'unlimited'} req/s)...\n")
 
-    leagues_data = []
+    results = {}
+    started = time.monotonic()
 
-    for league_config in LEAGUES_CONFIG:
-        league_id = league_config["id"]
-        league_name = league_config["name"]
+    # Each league id is requested once, even if several entries share it
+    league_ids = list(dict.fromkeys(league["id"] for league in LEAGUES_CONFIG))
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {
+            league_id: executor.submit(fetch_league_events, client, league_id, api_base)
+            for league_id in league_ids
+        }
 
-        print(f"📊 {league_name} (ID: {league_id})")
+        # Report in config order; later leagues keep downloading meanwhile
+        for league_config in LEAGUES_CONFIG:
+            league_id = league_config["id"]
+            league_name = league_config["name"]
+
+            print(f"📊 {league_name} (ID: {league_id})")
+
+            try:
+                raw_events = futures[league_id].result()
+            except FetchError as e:
+                print(f"  ❌ {e}\n")
+                results[league_config["slug"]] = None
+                continue
+
+            # Parse and filter events
+            parsed_events = [parse_event(e) for e in raw_events]
+            upcoming_events = filter_upcoming_events(parsed_events)
+            results[league_config["slug"]] = upcoming_events
+
+            if not raw_events:
+                print(f"  ⚠️  No upcoming events found\n")
+            elif not upcoming_events:
+                print(f"  ⚠️  No events in next {DAYS_AHEAD} days\n")
+            else:
+                print(f"  ✅ Found {len(upcoming_events)} upcoming events\n")
 
-        raw_events = fetch_league_events(league_id)
+    stats = client.stats
+    print(f"🌐 {stats['requests']} requests ({stats['retries']} retries, "
+          f"{stats['connections']} connections) in {time.monotonic() - started:.1f}s")
+    if client.cache:
+        print(f"💾 Cache: {stats['cached']} fresh, {stats['revalidated']} not modified")
 
-        if not raw_events:
-            print(f"  ⚠️  No upcoming events found\n")
-            continue
+    return results
 
-        # Parse and filter events
-        parsed_events = [parse_event(e) for e in raw_events]
-        upcoming_events = filter_upcoming_events(parsed_events)
 
-        if not upcoming_events:
-            print(f"  ⚠️  No events in next {DAYS_AHEAD} days\n")
-            continue
+def output_file_path(output_path: str) -> str:
+    """Absolute path of an output file given relative to this script"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(script_dir, output_path)
 
-        print(f"  ✅ Found {len(upcoming_events)} upcoming events\n")
 
-        league_data = {
-            "leagueId": league_id,
-            "slug": league_config["slug"],
-            "label": league_name,
+def load_previous_events(output_path: str) -> Optional[Dict[str, Any]]:
+    """The current events.json, or None if it is missing or unreadable"""
+    try:
+        with open(output_file_path(output_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("leagues"), list):
+        return None
+    return data
+
+
+def event_sort_key(event: Dict[str, Any]):
+    return (event.get("start", {}).get("utc") or "", str(event.get("id")))
+
+
+def merge_league_events(previous: List[Dict[str, Any]], fetched: List[Dict[str, Any]],
+                        counts: Dict[str, int], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Upsert fetched events into a league's previous events by id, then expire old ones"""
+    merged = {event.get("id"): event for event in previous}
+
+    for event in fetched:
+        known = merged.get(event.get("id"))
+        if known is None:
+            counts["added"] += 1
+        elif known != event:
+            counts["updated"] += 1
+        merged[event.get("id")] = event
+
+    upcoming = filter_upcoming_events(list(merged.values()), now=now)
+    counts["expired"] += len(merged) - len(upcoming)
+    return sorted(upcoming, key=event_sort_key)
+
+
+def build_events_data(results: Dict[str, Optional[List[Dict[str, Any]]]],
+                      previous: Optional[Dict[str, Any]] = None,
+                      now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Assemble the feed from this run's results, merged into the previous feed if given.
+    Leagues without upcoming events are left out, as before.
+    """
+    previous_events = {
+        league.get("slug"): league.get("events") or []
+        for league in (previous or {}).get("leagues", [])
+    }
+    counts = {"added": 0, "updated": 0, "expired": 0, "kept": 0}
+    leagues_data = []
+
+    for league_config in LEAGUES_CONFIG:
+        slug = league_config["slug"]
+        fetched = results.get(slug)
+        old_events = previous_events.get(slug, [])
+
+        if fetched is None:
+            # Fetch failed: keep the last-known-good events that are still upcoming
+            events = merge_league_events(old_events, [], counts, now)
+            counts["kept"] += len(events)
+            if events:
+                print(f"♻️  {league_config['name']}: kept {len(events)} last-known-good events")
+        else:
+            events = merge_league_events(old_events, fetched, counts, now)
+
+        if not events:
+            continue
+
+        leagues_data.append({
+            "leagueId": league_config["id"],
+            "slug": slug,
+            "label": league_config["name"],
             "sport": league_config["sport"],
-            "events": upcoming_events
-        }
+            "events": events
+        })
 
-        leagues_data.append(league_data)
+    if previous is not None:
+        print(f"🔀 Merged: {counts['added']} new, {counts['updated']} updated, "
+              f"{counts['expired']} expired, {counts['kept']} kept from failed leagues")
 
     return {
         "generatedAt": datetime.utcnow().isoformat() + "Z",
@@ -228,18 +386,25 @@ def fetch_all_events() -> Dict[str, Any]:
 
 
 def save_events(data: Dict[str, Any], output_path: str):
-    """Save events data to JSON file"""
+    """Save events data to JSON file atomically (temp file + rename)"""
     try:
-        # Get absolute path
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        full_path = os.path.join(script_dir, output_path)
+        full_path = output_file_path(output_path)
+        directory = os.path.dirname(full_path)
 
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        os.makedirs(directory, exist_ok=True)
 
-        # Write JSON file
-        with open(full_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write a temp file next to the feed and swap it in, so readers
+        # never see a half-written events.json
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".events.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
         print(f"\n✅ Events saved to: {full_path}")
         print(f"📊 Total leagues: {len(data['leagues'])}")
@@ -253,30 +418,132 @@ def save_events(data: Dict[str, Any], output_path: str):
         return False
 
 
+def shards_directory(output_path: str) -> str:
+    """Shards go in a directory named after the feed: events.json -> events/"""
+    return os.path.splitext(output_file_path(output_path))[0]
+
+
+def save_shards(data: Dict[str, Any], output_path: str, with_indexes: bool = True) -> bool:
+    """Write the per-league and per-day shards of the feed and its lookup indexes"""
+    directory = shards_directory(output_path)
+    try:
+        stats = write_shards(data, directory, build_indexes(data) if with_indexes else None)
+    except OSError as e:
+        print(f"\n❌ Error saving shards: {str(e)}")
+        return False
+
+    print(f"\n🧩 Shards: {stats['leagues']} leagues, {stats['days']} days, "
+          f"{stats['indexes']} indexes in {directory}")
+    print(f"   {stats['written']} written, {stats['unchanged']} unchanged, "
+          f"{stats['removed']} removed (largest {stats['bytes'] / 1024:.1f} KB, "
+          f"index: {MANIFEST_NAME})")
+
+    # The live page loads today's shard first; it must exist if today has events
+    problem = check_day_shard(data, directory, datetime.utcnow().strftime("%Y-%m-%d"))
+    if problem:
+        print(f"❌ Today's shard: {problem}")
+        return False
+    return True
+
+
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(
+        description="Fetch upcoming sports events from TheSportsDB into events.json"
+    )
+    parser.add_argument(
+        "--api-base",
+        default=API_BASE,
+        help="API base URL, e.g. a local mock server (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help="Concurrent fetch threads (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=RATE_LIMIT,
+        help="Maximum requests per second, 0 = unlimited (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=MAX_RETRIES,
+        help="Retries per request after a connection error, 429 or 5xx (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=CACHE_MAX_AGE,
+        help="Reuse cached responses younger than this many seconds without "
+             "a request; older ones are revalidated (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Don't read or write the response cache ({CACHE_DIR.name}/)"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Regenerate the feed from this run only instead of merging it into "
+             "the existing one (leagues that fail to fetch are dropped)"
+    )
+    parser.add_argument(
+        "--no-shards",
+        action="store_true",
+        help="Don't write the per-league/per-day shards and their manifest"
+    )
+    parser.add_argument(
+        "--no-indexes",
+        action="store_true",
+        help="Don't write the team/date/station/sport lookup indexes"
+    )
+    parser.add_argument(
+        "--output",
+        default=OUTPUT_FILE,
+        help="Output file, relative to this script (default: %(default)s)"
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("   TVMaster VIP - Sports Events Fetcher")
     print("=" * 60)
 
     # Fetch events
-    events_data = fetch_all_events()
+    cache = None if args.no_cache else ResponseCache(max_age=args.max_age)
+    with HttpClient(rate=args.rate, retries=args.retries, cache=cache) as client:
+        results = fetch_all_events(client, args.api_base.rstrip("/"), args.workers)
 
-    if not events_data["leagues"]:
+    if all(events is None for events in results.values()):
         print("\n⚠️  No events fetched. Check your internet connection or API key.")
-        sys.exit(1)
+        return 1
+
+    previous = None if args.full else load_previous_events(args.output)
+    events_data = build_events_data(results, previous)
 
-    # Save to file
-    success = save_events(events_data, OUTPUT_FILE)
+    if not events_data["leagues"]:
+        print("\n⚠️  No upcoming events in any league. Keeping the existing feed.")
+        return 1
 
-    if success:
-        print("\n✅ Event update complete!")
-        print(f"⏰ Next update recommended in 24 hours")
-        sys.exit(0)
-    else:
+    if previous is not None and previous["leagues"] == events_data["leagues"]:
+        print(f"\nℹ️  No changes; {output_file_path(args.output)} left as it is")
+        events_data = previous
+    elif not save_events(events_data, args.output):
         print("\n❌ Failed to save events")
-        sys.exit(1)
+        return 1
+
+    # Shards are refreshed even when the feed itself didn't change
+    if not args.no_shards and not save_shards(events_data, args.output, not args.no_indexes):
+        return 1
+
+    print("\n✅ Event update complete!")
+    print(f"⏰ Next update recommended in 24 hours")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -6,12 +6,17 @@ Prevents layout shifts by reserving space for images before they load
 WCAG Core Web Vitals Target: CLS < 0.1
 """
 
-import re
+import argparse
 import os
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from PIL import Image
 
+from build_manifest import BuildManifest
+from html_document import HtmlDocument
+
+TRANSFORM_VERSION = "1"
+
 # HTML files to process
 HTML_FILES = [
     "index.html",
@@ -60,68 +65,64 @@ def get_image_dimensions(image_path: str) -> Tuple[int, int]:
     # Default dimensions if unknown
     return None
 
-def add_dimensions_to_images(content: str, html_file: str) -> Tuple[str, int]:
+def resolve_image_path(src: str, html_file: str) -> str:
+    """Get image path (relative to the project root) from an img src in html_file"""
+    if html_file.startswith('sports/'):
+        return src.replace('../', '')
+    return src.replace('./', '')
+
+def file_dependencies(doc: HtmlDocument, html_file: str) -> List[str]:
+    """Images still without dimensions; if one appears or changes, the page is rerun"""
+    return [
+        resolve_image_path(tag.get('src'), html_file)
+        for tag in doc.tags('img')
+        if tag.get('src') and not (tag.has('width') and tag.has('height'))
+    ]
+
+def add_dimensions_to_images(doc: HtmlDocument, html_file: str) -> int:
     """Add width and height attributes to img tags"""
     changes = 0
 
-    # Pattern to match img tags without width/height
-    img_pattern = r'<img\s+([^>]*?)src="([^"]+)"([^>]*?)>'
-
-    def replace_img(match):
+    def replace_img(tag):
         nonlocal changes
-        before_src = match.group(1)
-        src = match.group(2)
-        after_src = match.group(3)
+        src = tag.get('src')
+        if not src:
+            return None
 
         # Check if width/height already exist
-        full_tag = match.group(0)
-        if 'width=' in full_tag and 'height=' in full_tag:
-            return full_tag  # Already has dimensions
-
-        # Get image path relative to HTML file
-        if html_file.startswith('sports/'):
-            image_path = src.replace('../', '')
-        else:
-            image_path = src.replace('./', '')
+        if tag.has('width') and tag.has('height'):
+            return None  # Already has dimensions
 
         # Get dimensions
-        dimensions = get_image_dimensions(image_path)
+        dimensions = get_image_dimensions(resolve_image_path(src, html_file))
 
         if dimensions:
             width, height = dimensions
             changes += 1
 
-            # Build new img tag with dimensions
-            new_tag = f'<img {before_src}src="{src}" width="{width}" height="{height}"{after_src}>'
-            return new_tag
+            # Insert dimensions right after the src attribute
+            src_attr = f'src="{src}"'
+            if src_attr in tag.text:
+                return tag.text.replace(src_attr, f'{src_attr} width="{width}" height="{height}"', 1)
+            return tag.with_attrs(f'width="{width}" height="{height}"')
 
-        return full_tag  # No dimensions found, keep as is
+        return None  # No dimensions found, keep as is
 
-    new_content = re.sub(img_pattern, replace_img, content)
-    return new_content, changes
+    doc.rewrite_tags('img', replace_img)
+    return changes
 
-def add_lazy_loading(content: str) -> Tuple[str, int]:
+def add_lazy_loading(doc: HtmlDocument) -> int:
     """Add loading='lazy' to images that don't have it"""
-    changes = 0
-
-    # Pattern for img tags without loading attribute
-    def replace_lazy(match):
-        nonlocal changes
-        full_tag = match.group(0)
 
+    def replace_lazy(tag):
         # Skip if already has loading attribute or if it's above the fold (header logo)
-        if 'loading=' in full_tag or 'header-logo' in full_tag:
-            return full_tag
+        if tag.has('loading') or 'header-logo' in tag.text:
+            return None
 
-        changes += 1
         # Add loading="lazy" before the closing >
-        new_tag = full_tag.replace('>', ' loading="lazy" decoding="async">')
-        return new_tag
+        return tag.with_attrs('loading="lazy" decoding="async"')
 
-    img_pattern = r'<img\s+[^>]*?>'
-    new_content = re.sub(img_pattern, replace_lazy, content)
-
-    return new_content, changes
+    return doc.rewrite_tags('img', replace_lazy)
 
 def add_aspect_ratio_css(content: str) -> Tuple[str, int]:
     """Add aspect-ratio CSS for responsive images"""
@@ -132,7 +133,7 @@ def add_aspect_ratio_css(content: str) -> Tuple[str, int]:
     # This would be added to the CSS, not HTML
     return content, 0
 
-def process_file(filepath: str) -> dict:
+def process_file(filepath: str, manifest: Optional[BuildManifest] = None) -> dict:
     """Process a single HTML file"""
     print(f"\n📄 Processing: {filepath}")
 
@@ -140,35 +141,46 @@ def process_file(filepath: str) -> dict:
         print(f"   ⚠️  File not found, skipping")
         return {"file": filepath, "changes": []}
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    if manifest and manifest.is_fresh(filepath):
+        print("   ⏭️  Unchanged since last run, skipping")
+        return {"file": filepath, "changes": []}
 
+    doc = HtmlDocument.load(filepath)
     changes = []
 
     # Add image dimensions
-    content, dim_changes = add_dimensions_to_images(content, filepath)
+    dim_changes = add_dimensions_to_images(doc, filepath)
     if dim_changes > 0:
         changes.append(f"Added dimensions to {dim_changes} images")
         print(f"   ✓ Added width/height to {dim_changes} image(s)")
 
     # Add lazy loading
-    content, lazy_changes = add_lazy_loading(content)
+    lazy_changes = add_lazy_loading(doc)
     if lazy_changes > 0:
         changes.append(f"Added lazy loading to {lazy_changes} images")
         print(f"   ✓ Added lazy loading to {lazy_changes} image(s)")
 
     # Write back if changes were made
-    if changes:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+    if doc.save():
         print(f"   💾 Saved {len(changes)} performance improvements")
     else:
         print("   ℹ️  No changes needed")
 
+    if manifest:
+        manifest.record(filepath, deps=file_dependencies(doc, filepath))
+
     return {"file": filepath, "changes": changes}
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reprocess files even if unchanged since the last run"
+    )
+    args = parser.parse_args()
+
     print("=" * 70)
     print("⚡ Core Web Vitals Optimization - CLS Fix")
     print("=" * 70)
@@ -180,22 +192,27 @@ def main():
     project_root = script_dir.parent
     os.chdir(project_root)
 
+    manifest = BuildManifest.load("fix-cls-images", TRANSFORM_VERSION, force=args.force)
+
     results = []
     total_files = 0
     total_changes = 0
 
     for html_file in HTML_FILES:
-        result = process_file(html_file)
+        result = process_file(html_file, manifest)
         results.append(result)
         if result["changes"]:
             total_files += 1
             total_changes += len(result["changes"])
 
+    manifest.save()
+
     # Summary
     print("\n" + "=" * 70)
     print("📊 SUMMARY")
     print("=" * 70)
     print(f"Total files processed: {len(HTML_FILES)}")
+    print(f"Unchanged (skipped): {manifest.skipped}")
     print(f"Files modified: {total_files}")
     print(f"Total improvements: {total_changes}")
 
@@ -3,19 +3,37 @@
 Comprehensive Sitemap Generator for TVMaster VIP
 Generates XML sitemap with all pages across 8 language versions.
 
+Pages come from a single-walk cross-language page index, so hreflang
+alternates only point at translations that exist. <lastmod> is the date of
+each page's last content commit (see git_lastmod.py), so a fresh checkout
+doesn't mark every URL as changed. URLs are streamed to disk as they are
+generated; past 50,000 URLs / 50MB the output is split into sitemap-N.xml
+files plus a sitemap_index.xml. robots.txt's Sitemap: line is pointed at
+whichever file is written (sitemap.xml, sitemap.xml.gz or sitemap_index.xml).
+Sitemaps left by an earlier run in another layout are only deleted with
+--clean.
+
 Usage:
     python scripts/generate-comprehensive-sitemap.py
     python scripts/generate-comprehensive-sitemap.py --output sitemap.xml
     python scripts/generate-comprehensive-sitemap.py --pretty
+    python scripts/generate-comprehensive-sitemap.py --gzip
+    python scripts/generate-comprehensive-sitemap.py --mtime
+    python scripts/generate-comprehensive-sitemap.py --max-urls 1000 --clean
 """
 
+import gzip
 import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
 import argparse
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+
+from git_lastmod import GitLastModified
+from page_index import PageIndex
+from sitemap_writer import MAX_BYTES, MAX_URLS, SITEMAP_NS, SitemapWriter
 
 # Configuration
 ROOT_DIR = Path(__file__).parent.parent
@@ -102,51 +120,85 @@ def get_page_settings(page_path):
     return DEFAULT_SETTINGS
 
 
-def get_last_modified(file_path):
-    """Get last modified date of file."""
+def get_last_modified(file_path, timestamp=None):
+    """Get last modified date of file (timestamp: an already known mtime)."""
     try:
-        timestamp = os.path.getmtime(file_path)
+        if timestamp is None:
+            timestamp = os.path.getmtime(file_path)
         return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
     except:
         return datetime.now().strftime("%Y-%m-%d")
 
 
-def find_html_files(directory, exclude_patterns=None):
-    """Find all HTML files in directory recursively."""
+def is_excluded(page_path, exclude_patterns=None):
+    """Check if a page should be left out of the sitemap."""
     if exclude_patterns is None:
         exclude_patterns = ["404.html", "index.backup", ".backup."]
+    filename = page_path.rsplit("/", 1)[-1]
+    return any(pattern in filename for pattern in exclude_patterns)
+
+
+def find_html_files(page_index, lang_code, exclude_patterns=None):
+    """Find all sitemap pages that exist in a language."""
+    return [
+        page for page in page_index.pages_for(lang_code)
+        if not is_excluded(page, exclude_patterns)
+    ]
+
+
+def update_robots_txt(writer: SitemapWriter) -> bool:
+    """
+    Point robots.txt's Sitemap: line for this sitemap at the file that was
+    just written. Returns True if robots.txt was changed; warns if it has no
+    such line.
+    """
+    robots_path = writer.directory / "robots.txt"
+    url = f"{BASE_URL}/{writer.entry_point.name}"
+    try:
+        content = robots_path.read_text(encoding="utf-8")
+    except OSError:
+        print(f"⚠️  No robots.txt next to the sitemap; add: Sitemap: {url}")
+        return False
 
-    html_files = []
-
-    for root, dirs, files in os.walk(directory):
-        # Skip hidden directories and node_modules
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d != 'node_modules']
+    found = False
 
-        for file in files:
-            if file.endswith('.html'):
-                # Skip excluded patterns
-                if any(pattern in file for pattern in exclude_patterns):
-                    continue
+    def replace(match):
+        nonlocal found
+        if not writer.is_output_name(match.group(2).rsplit("/", 1)[-1]):
+            return match.group(0)
+        found = True
+        return f"{match.group(1)}{url}"
 
-                file_path = Path(root) / file
-                relative_path = file_path.relative_to(directory)
-                html_files.append(str(relative_path))
+    updated = re.sub(r"(?im)^(Sitemap:[ \t]*)(\S+)[ \t]*$", replace, content)
+    if not found:
+        print(f"⚠️  robots.txt has no Sitemap: line for this sitemap; add: Sitemap: {url}")
+        return False
+    if updated == content:
+        return False
 
-    return html_files
+    robots_path.write_text(updated, encoding="utf-8")
+    print(f"🤖 robots.txt now points at {url}")
+    return True
 
 
-def generate_sitemap(output_file="sitemap.xml", pretty_print=False):
-    """Generate comprehensive sitemap XML."""
+def generate_sitemap(output_file="sitemap.xml", pretty_print=False, gzip_output=False,
+                     max_urls=MAX_URLS, use_git=True, clean=False):
+    """
+    Generate comprehensive sitemap XML.
+    Returns the path to submit: the sitemap itself, or the sitemap index if sharded.
+    """
     print(f"\n{'='*70}")
     print(f"Generating Sitemap for TVMaster VIP")
     print(f"{'='*70}\n")
 
-    # Create root element
-    urlset = ET.Element("urlset")
-    urlset.set("xmlns", "http://www.sitemaps.org/schemas/sitemap/0.9")
-    urlset.set("xmlns:xhtml", "http://www.w3.org/1999/xhtml")
+    writer = SitemapWriter(ROOT_DIR / output_file, BASE_URL, gzip_output=gzip_output,
+                           pretty=pretty_print, max_urls=max_urls, clean=clean)
+
+    # One walk over the whole site instead of one per language
+    page_index = PageIndex.build(ROOT_DIR, LANGUAGES)
 
-    urls_added = 0
+    # Last content commit per file, from one batched git log (cached by HEAD)
+    git_lastmod = GitLastModified(ROOT_DIR) if use_git else None
 
     # Process each language
     for lang_code in LANGUAGES:
@@ -159,101 +211,124 @@ def generate_sitemap(output_file="sitemap.xml", pretty_print=False):
         print(f"📝 Processing language: {lang_code.upper()}")
 
         # Find all HTML files
-        html_files = find_html_files(lang_dir)
+        html_files = find_html_files(page_index, lang_code)
 
         for html_file in html_files:
-            # Create URL element
-            url_elem = ET.SubElement(urlset, "url")
-
-            # Full URL
-            page_url = get_url_for_page(lang_code, html_file)
-            loc = ET.SubElement(url_elem, "loc")
-            loc.text = page_url
-
-            # Last modified date
-            file_path = lang_dir / html_file
-            lastmod = ET.SubElement(url_elem, "lastmod")
-            lastmod.text = get_last_modified(file_path)
-
             # Get page settings
             settings = get_page_settings(html_file)
 
-            # Change frequency
-            changefreq = ET.SubElement(url_elem, "changefreq")
-            changefreq.text = settings["changefreq"]
-
-            # Priority
-            priority = ET.SubElement(url_elem, "priority")
-            priority.text = settings["priority"]
+            # Alternate language links (hreflang), only for translations that exist
+            alternates = [
+                (alt_lang, get_url_for_page(alt_lang, html_file))
+                for alt_lang in page_index.alternates(html_file, exclude=lang_code)
+            ]
 
-            # Add alternate language links (hreflang)
-            for alt_lang in LANGUAGES:
-                if alt_lang != lang_code:
-                    xhtml_link = ET.SubElement(url_elem, "{http://www.w3.org/1999/xhtml}link")
-                    xhtml_link.set("rel", "alternate")
-                    xhtml_link.set("hreflang", alt_lang)
-                    xhtml_link.set("href", get_url_for_page(alt_lang, html_file))
-
-            urls_added += 1
+            file_path = lang_dir / html_file
+            if git_lastmod:
+                lastmod = git_lastmod.date(file_path)
+            else:
+                lastmod = get_last_modified(file_path, page_index.mtime(lang_code, html_file))
+
+            writer.add(
+                get_url_for_page(lang_code, html_file),
+                lastmod=lastmod,
+                changefreq=settings["changefreq"],
+                priority=settings["priority"],
+                alternates=alternates
+            )
 
         print(f"   ✅ Added {len(html_files)} pages")
 
-    # Create XML tree
-    tree = ET.ElementTree(urlset)
-
-    # Write to file
-    output_path = ROOT_DIR / output_file
-
-    if pretty_print:
-        # Pretty print XML
-        xml_str = ET.tostring(urlset, encoding='unicode')
-        dom = minidom.parseString(xml_str)
-        pretty_xml = dom.toprettyxml(indent="  ", encoding="UTF-8")
-
-        with open(output_path, 'wb') as f:
-            f.write(pretty_xml)
-    else:
-        # Standard output
-        tree.write(output_path, encoding='UTF-8', xml_declaration=True)
+    writer.close()
+    output_path = writer.entry_point
+    update_robots_txt(writer)
 
     print(f"\n{'='*70}")
     print(f"✨ Sitemap generated successfully!")
     print(f"{'='*70}")
     print(f"📁 Output file: {output_path}")
-    print(f"📊 Total URLs: {urls_added}")
+    if writer.index_file:
+        print(f"🗂️  Sharded into {len(writer.files)} sitemaps:")
+        for shard in writer.files:
+            print(f"   • {shard.name} ({os.path.getsize(shard):,} bytes)")
+    print(f"📊 Total URLs: {writer.urls_written}")
     print(f"🌍 Languages: {len(LANGUAGES)}")
     print(f"💾 File size: {os.path.getsize(output_path):,} bytes")
+    if writer.stale and clean:
+        print(f"🧹 Removed sitemaps from an earlier layout: {', '.join(p.name for p in writer.stale)}")
+    elif writer.stale:
+        print(f"⚠️  Left sitemaps from an earlier layout: {', '.join(p.name for p in writer.stale)}"
+              f" (rerun with --clean to delete them)")
     print(f"{'='*70}\n")
 
     return output_path
 
 
+def open_sitemap(sitemap_path):
+    """Open a sitemap for reading, transparently decompressing .gz files."""
+    if str(sitemap_path).endswith(".gz"):
+        return gzip.open(sitemap_path, "rb")
+    return open(sitemap_path, "rb")
+
+
+def scan_sitemap(sitemap_path):
+    """
+    Stream-parse a sitemap or sitemap index with constant memory.
+    Returns (root tag, entry count, uncompressed size, child sitemap URLs).
+    """
+    root = None
+    count = 0
+    children = []
+    with open_sitemap(sitemap_path) as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event == "start":
+                continue
+            if elem.tag in (f"{{{SITEMAP_NS}}}url", f"{{{SITEMAP_NS}}}sitemap"):
+                count += 1
+                if elem.tag == f"{{{SITEMAP_NS}}}sitemap":
+                    children.append(elem.findtext(f"{{{SITEMAP_NS}}}loc"))
+                # Drop finished entries so memory doesn't grow with the file
+                root.clear()
+        size = f.tell()
+    return root.tag, count, size, children
+
+
 def validate_sitemap(sitemap_path):
-    """Basic validation of generated sitemap."""
+    """Basic validation of a generated sitemap or sitemap index and its shards."""
     print("\n🔍 Validating sitemap...\n")
 
     try:
-        tree = ET.parse(sitemap_path)
-        root = tree.getroot()
-
-        # Count URLs
-        urls = root.findall(".//{http://www.sitemaps.org/schemas/sitemap/0.9}url")
+        sitemap_path = Path(sitemap_path)
+        root_tag, count, size, children = scan_sitemap(sitemap_path)
         print(f"✅ Valid XML structure")
-        print(f"✅ Total URLs: {len(urls)}")
 
-        # Check file size (should be under 50MB)
-        file_size = os.path.getsize(sitemap_path)
-        if file_size > 50 * 1024 * 1024:
-            print(f"⚠️  Warning: Sitemap size ({file_size:,} bytes) exceeds 50MB limit")
+        if root_tag == f"{{{SITEMAP_NS}}}sitemapindex":
+            print(f"✅ Sitemap index with {count} sitemaps")
+            paths = [sitemap_path.parent / url.rsplit("/", 1)[-1] for url in children]
         else:
-            print(f"✅ File size OK: {file_size:,} bytes")
-
-        # Check URL count (should be under 50,000)
-        if len(urls) > 50000:
-            print(f"⚠️  Warning: URL count ({len(urls)}) exceeds 50,000 limit")
-        else:
-            print(f"✅ URL count OK: {len(urls)}")
-
+            paths = [sitemap_path]
+
+        total_urls = 0
+        for path in paths:
+            if path != sitemap_path:
+                _, count, size, _ = scan_sitemap(path)
+            total_urls += count
+
+            # Check file size (should be under 50MB uncompressed)
+            if size > MAX_BYTES:
+                print(f"⚠️  Warning: {path.name} size ({size:,} bytes) exceeds 50MB limit")
+            else:
+                print(f"✅ File size OK: {path.name} {size:,} bytes")
+
+            # Check URL count (should be under 50,000)
+            if count > MAX_URLS:
+                print(f"⚠️  Warning: {path.name} URL count ({count}) exceeds 50,000 limit")
+            else:
+                print(f"✅ URL count OK: {path.name} {count}")
+
+        print(f"✅ Total URLs: {total_urls}")
         print(f"\n✨ Sitemap validation passed!\n")
         return True
 
@@ -262,6 +337,14 @@ def validate_sitemap(sitemap_path):
         return False
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(
@@ -279,6 +362,28 @@ def main():
         action="store_true",
         help="Pretty print XML with indentation"
     )
+    parser.add_argument(
+        "--gzip",
+        "-z",
+        action="store_true",
+        help="Write gzip-compressed sitemaps (.xml.gz)"
+    )
+    parser.add_argument(
+        "--mtime",
+        action="store_true",
+        help="Use file modification times for <lastmod> instead of git history"
+    )
+    parser.add_argument(
+        "--max-urls",
+        type=positive_int,
+        default=MAX_URLS,
+        help=f"Maximum URLs per sitemap file before sharding (default: {MAX_URLS})"
+    )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Delete sitemaps left by an earlier run in another layout"
+    )
     parser.add_argument(
         "--validate",
         "-v",
@@ -289,7 +394,8 @@ def main():
     args = parser.parse_args()
 
     # Generate sitemap
-    sitemap_path = generate_sitemap(args.output, args.pretty)
+    sitemap_path = generate_sitemap(args.output, args.pretty, args.gzip, args.max_urls,
+                                    use_git=not args.mtime, clean=args.clean)
 
     # Validate if requested
     if args.validate:
@@ -298,7 +404,7 @@ def main():
     print(f"📤 Next steps:")
     print(f"   1. Review the generated sitemap: {sitemap_path}")
     print(f"   2. Submit to Google Search Console: https://search.google.com/search-console")
-    print(f"   3. Update robots.txt with: Sitemap: {BASE_URL}/sitemap.xml")
+    print(f"   3. Check robots.txt has: Sitemap: {BASE_URL}/{sitemap_path.name}")
     print(f"   4. Test with: https://www.xml-sitemaps.com/validate-xml-sitemap.html\n")
 
 
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Git-aware last-modified dates for site files.
+
+Filesystem mtimes reset on every checkout, so a freshly cloned site looks
+entirely "changed". This provider reads the date of the last commit that
+changed each HTML file's content from `git log`. Commits whose only edits
+to a file are date lines (dateModified, article:modified_time, <lastmod>)
+don't count, so writing these dates back into pages doesn't move them
+forward on the next run. Only changes small enough to be date-only are
+diffed; the rest of the history is read as a cheap --numstat listing.
+
+Results are cached in .lastmod-cache.json keyed by HEAD, so repeated runs
+on the same commit don't touch git history at all. Files with uncommitted
+changes, untracked files, non-HTML files and checkouts without git
+fall back to mtime.
+
+Usage:
+    from git_lastmod import GitLastModified
+
+    lastmod = GitLastModified(ROOT_DIR)
+    print(lastmod.date("index.html"))        # 2025-11-10
+    print(lastmod.isoformat("index.html"))   # 2025-11-10T09:00:00+00:00
+"""
+
+import json
+import os
+import re
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+ROOT_DIR = Path(__file__).parent.parent
+CACHE_FILE = ROOT_DIR / ".lastmod-cache.json"
+
+COMMIT_MARKER = "\x1ecommit "
+
+# Only pages carry dates worth tracking; other files fall back to mtime
+PATHSPECS = ("*.html",)
+
+# Changes touching more lines than this are content changes without diffing
+DATE_ONLY_MAX_LINES = 16
+
+# Diff lines that only carry a modification date
+DATE_LINE_RE = re.compile(
+    r'^\s*("dateModified"\s*:|<meta[^>]+article:modified_time|<lastmod>)'
+)
+
+
+def run_git(root: Path, *args: str) -> Optional[str]:
+    """Run a git command in root; None if git or the repository is unavailable."""
+    try:
+        result = subprocess.run(
+            ["git", "-c", "core.quotepath=off", *args],
+            cwd=root, capture_output=True, text=True, encoding="utf-8", errors="replace"
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def read_numstat(root: Path) -> Dict[str, List[Tuple[str, str, bool]]]:
+    """
+    Map every HTML path in the history to its changes, newest first, as
+    (commit, committer date, might be date-only). A change might be date-only
+    when it touches at most DATE_ONLY_MAX_LINES lines; binary changes never are.
+    """
+    output = run_git(root, "log", "--no-merges", "--no-renames", "--no-color", "--numstat",
+                     f"--format={COMMIT_MARKER}%H %cI", "--", *PATHSPECS)
+    history: Dict[str, List[Tuple[str, str, bool]]] = {}
+    commit = date = None
+    for line in (output or "").split("\n"):
+        if line.startswith(COMMIT_MARKER):
+            commit, date = line[len(COMMIT_MARKER):].split(" ", 1)
+            continue
+        parts = line.split("\t", 2)
+        if len(parts) != 3 or commit is None:
+            continue
+        added, deleted, path = parts
+        small = added.isdigit() and deleted.isdigit() and \
+            int(added) + int(deleted) <= DATE_ONLY_MAX_LINES
+        history.setdefault(path, []).append((commit, date, small))
+    return history
+
+
+def read_content_changes(root: Path, commits: Iterable[str]) -> Set[Tuple[str, str]]:
+    """
+    (commit, path) pairs among the given commits' HTML changes that change
+    more than date lines. One `git log -p -U0` over just those commits.
+    """
+    changed: Set[Tuple[str, str]] = set()
+    process = subprocess.Popen(
+        ["git", "-c", "core.quotepath=off", "log", "--no-walk=unsorted", "--stdin",
+         "--no-renames", "--no-color", "--unified=0", "-p", f"--format={COMMIT_MARKER}%H",
+         "--", *PATHSPECS],
+        cwd=root, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, encoding="utf-8", errors="replace"
+    )
+    process.stdin.write("".join(f"{commit}\n" for commit in commits))
+    process.stdin.close()
+
+    commit = None
+    path = None
+    in_header = False
+    content_changed = False
+    saw_lines = False
+
+    def finish_file():
+        # Binary and mode-only changes have no +/- lines; count them as content
+        if path and (content_changed or not saw_lines):
+            changed.add((commit, path))
+
+    for line in process.stdout:
+        if line.startswith(COMMIT_MARKER):
+            finish_file()
+            commit = line[len(COMMIT_MARKER):].strip()
+            path = None
+        elif line.startswith("diff --git "):
+            finish_file()
+            # "diff --git a/<path> b/<path>"; the ---/+++ lines refine it
+            path = line.rstrip("\n").rsplit(" b/", 1)[-1]
+            in_header = True
+            content_changed = saw_lines = False
+        elif in_header and line.startswith(("--- ", "+++ ")):
+            target = line[4:].rstrip("\n")
+            if line.startswith("+++ ") and target != "/dev/null":
+                path = target[2:]  # strip b/
+        elif line.startswith("@@"):
+            in_header = False
+        elif not in_header and line[:1] in ("+", "-") and path:
+            saw_lines = True
+            if not content_changed and not DATE_LINE_RE.match(line[1:]):
+                content_changed = True
+
+    finish_file()
+    process.wait()
+    return changed
+
+
+def read_history(root: Path) -> Dict[str, str]:
+    """
+    Map every tracked HTML file to the committer date (ISO 8601) of the
+    newest commit that changed more than its date lines.
+
+    A --numstat pass lists each file's changes. Only changes small enough
+    to be date-only are diffed, newest first, in one batch per round; a file
+    stops at its first content change, so most rounds diff a handful of commits.
+    """
+    tracked = set((run_git(root, "ls-files", "-z", "--", *PATHSPECS) or "").split("\0"))
+    history = read_numstat(root)
+    commit_dates = {commit: date for changes in history.values() for commit, date, _ in changes}
+
+    dates: Dict[str, str] = {}
+    position = {path: 0 for path in history if path in tracked}
+    while position:
+        candidates: Dict[str, Set[str]] = {}
+        for path, index in list(position.items()):
+            commit, date, small = history[path][index]
+            if small and index + 1 < len(history[path]):
+                candidates.setdefault(commit, set()).add(path)
+            else:
+                # A large change, or the file's first commit
+                dates[path] = date
+                del position[path]
+        if not candidates:
+            break
+
+        changed = read_content_changes(root, candidates)
+        for commit, paths in candidates.items():
+            for path in paths:
+                if (commit, path) in changed:
+                    dates[path] = commit_dates[commit]
+                    del position[path]
+                else:
+                    position[path] += 1
+
+    return dates
+
+
+class GitLastModified:
+    """Last content change per file, from git history with an mtime fallback."""
+
+    def __init__(self, root: Path = ROOT_DIR, cache_file: Optional[Path] = CACHE_FILE):
+        self.root = Path(root).resolve()
+        self.cache_file = cache_file
+        self._dates: Optional[Dict[str, str]] = None
+        self._dirty: Set[str] = set()
+
+    def load(self) -> Dict[str, str]:
+        """Load committed dates (from cache when HEAD is unchanged)."""
+        if self._dates is not None:
+            return self._dates
+
+        head = run_git(self.root, "rev-parse", "HEAD")
+        if head is None:
+            self._dates = {}  # not a git checkout
+            return self._dates
+        head = head.strip()
+
+        self._dates = self._read_cache(head)
+        if self._dates is None:
+            self._dates = read_history(self.root)
+            self._write_cache(head)
+
+        # Uncommitted and untracked files: their git date is stale or missing
+        status = run_git(self.root, "status", "--porcelain", "-z", "--untracked-files=all") or ""
+        entries = iter(status.split("\0"))
+        for entry in entries:
+            if len(entry) > 3:
+                self._dirty.add(entry[3:])
+                if entry[0] in "RC":
+                    # Renames and copies are followed by their source path, without a status
+                    self._dirty.add(next(entries, ""))
+
+        return self._dates
+
+    def _read_cache(self, head: str) -> Optional[Dict[str, str]]:
+        if not self.cache_file:
+            return None
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cache.get("head") != head:
+            return None
+        return cache.get("files", {})
+
+    def _write_cache(self, head: str):
+        if not self.cache_file:
+            return
+        tmp_path = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"head": head, "files": self._dates}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.cache_file)
+
+    def _key(self, path) -> str:
+        path = Path(path)
+        if path.is_absolute():
+            path = path.resolve().relative_to(self.root)
+        return path.as_posix()
+
+    def get(self, path) -> Optional[datetime]:
+        """Last content change of path; mtime for dirty/untracked files."""
+        key = self._key(path)
+        dates = self.load()
+
+        if key in dates and key not in self._dirty:
+            return datetime.fromisoformat(dates[key])
+
+        try:
+            timestamp = os.path.getmtime(self.root / key)
+        except OSError:
+            return None
+        return datetime.fromtimestamp(timestamp, timezone.utc).replace(microsecond=0)
+
+    def date(self, path) -> Optional[str]:
+        """YYYY-MM-DD, as used by <lastmod> and date-only schema fields."""
+        modified = self.get(path)
+        return modified.strftime("%Y-%m-%d") if modified else None
+
+    def isoformat(self, path) -> Optional[str]:
+        """Full ISO 8601 timestamp, as used by dateModified."""
+        modified = self.get(path)
+        return modified.isoformat() if modified else None
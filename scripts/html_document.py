@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Shared HTML document model for the fixer scripts.
+
+Each file is read once and tokenized in a single pass into a tag/offset index
+(img, script, link, video, meta, style, body open/close, head close). Transforms
+read tags from the index and rewrite them by offset instead of re-scanning the
+whole document with their own regexes, and the file is written at most once.
+
+Usage:
+    from html_document import HtmlDocument
+
+    doc = HtmlDocument.load("index.html")
+    for tag in doc.tags("img"):
+        print(tag.start, tag.get("src"))
+    doc.rewrite_tags("img", lambda tag: tag.with_attrs('loading="lazy"'))
+    doc.save()
+"""
+
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+INDEXED_TAGS = ("img", "script", "link", "video", "meta", "style", "body")
+RAW_TEXT_TAGS = ("script", "style")
+
+# One alternation for the whole document. Comments are consumed so tags inside
+# them are not indexed; attribute values may contain '>' when quoted.
+TOKEN_RE = re.compile(
+    r'<!--.*?-->'
+    r'|<(?P<name>' + "|".join(INDEXED_TAGS) + r')\b'
+    r'(?P<attrs>(?:"[^"]*"|\'[^\']*\'|[^\'">])*)>'
+    r'|</(?P<close>body|head)\s*>',
+    re.DOTALL | re.IGNORECASE
+)
+RAW_TEXT_END_RE = {
+    name: re.compile(rf'</{name}\s*>', re.IGNORECASE) for name in RAW_TEXT_TAGS
+}
+# Whitespace, optional self-closing slash and '>' at the end of a tag
+TAG_END_RE = re.compile(r'\s*/?>$')
+ATTR_RE = re.compile(
+    r'([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'=<>`]+)))?'
+)
+
+
+class Tag:
+    """An opening tag found in a document, with its offsets."""
+
+    __slots__ = ("name", "start", "end", "text", "close_start", "close_end", "_attrs")
+
+    def __init__(self, name: str, start: int, end: int, text: str):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.text = text
+        # For script/style: offsets of the matching closing tag
+        self.close_start = None
+        self.close_end = None
+        self._attrs = None
+
+    @property
+    def attrs(self) -> Dict[str, str]:
+        """Attributes by lowercased name; boolean attributes map to ''."""
+        if self._attrs is None:
+            self._attrs = {}
+            attr_text = self.text[len(self.name) + 1:-1]
+            for match in ATTR_RE.finditer(attr_text):
+                value = next((g for g in match.groups()[1:] if g is not None), "")
+                self._attrs.setdefault(match.group(1).lower(), value)
+        return self._attrs
+
+    def get(self, attr: str, default: Optional[str] = None) -> Optional[str]:
+        return self.attrs.get(attr, default)
+
+    def has(self, attr: str) -> bool:
+        return attr in self.attrs
+
+    @property
+    def is_empty_element(self) -> bool:
+        """True for <script ...></script> with nothing between the tags."""
+        return self.close_start == self.end
+
+    def with_attrs(self, extra: str) -> str:
+        """
+        Return the tag text with extra attributes appended. The rest of the
+        text, including how the tag closes (">", "/>" or " />"), is kept as is.
+        """
+        if not extra:
+            return self.text
+        head = TAG_END_RE.sub("", self.text)
+        return f"{head} {extra}{self.text[len(head):]}"
+
+
+class HtmlDocument:
+    """An HTML file loaded once, with a lazily built tag/offset index."""
+
+    def __init__(self, path, content: str):
+        self.path = Path(path)
+        self.original = content
+        self._content = content
+        self._index = None
+
+    @classmethod
+    def load(cls, path) -> "HtmlDocument":
+        # newline='' keeps the file's own line endings on save
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return cls(path, f.read())
+
+    @property
+    def content(self) -> str:
+        return self._content
+
+    @content.setter
+    def content(self, value: str):
+        if value != self._content:
+            self._content = value
+            self._index = None
+
+    @property
+    def changed(self) -> bool:
+        return self._content != self.original
+
+    @property
+    def index(self) -> Dict[str, List[Tag]]:
+        """Tags by name, in document order. Rebuilt after content changes."""
+        if self._index is None:
+            self._index = self._tokenize(self._content)
+        return self._index
+
+    @staticmethod
+    def _tokenize(content: str) -> Dict[str, List[Tag]]:
+        index = {name: [] for name in INDEXED_TAGS}
+        index["/body"] = []
+        index["/head"] = []
+
+        pos = 0
+        while True:
+            match = TOKEN_RE.search(content, pos)
+            if not match:
+                break
+            pos = match.end()
+
+            if match.group("close"):
+                close = "/" + match.group("close").lower()
+                index[close].append(Tag(close, match.start(), match.end(), match.group(0)))
+                continue
+            if not match.group("name"):
+                continue  # comment
+
+            name = match.group("name").lower()
+            tag = Tag(name, match.start(), match.end(), match.group(0))
+            index[name].append(tag)
+
+            # Skip raw text so markup inside inline scripts/styles is not indexed
+            if name in RAW_TEXT_TAGS:
+                end = RAW_TEXT_END_RE[name].search(content, pos)
+                if end:
+                    tag.close_start, tag.close_end = end.start(), end.end()
+                    pos = end.end()
+
+        return index
+
+    def tags(self, name: str) -> List[Tag]:
+        return self.index.get(name.lower(), [])
+
+    def first(self, name: str) -> Optional[Tag]:
+        tags = self.tags(name)
+        return tags[0] if tags else None
+
+    @property
+    def body_close(self) -> Optional[int]:
+        """Offset of the last </body> tag."""
+        tags = self.tags("/body")
+        return tags[-1].start if tags else None
+
+    @property
+    def head_close(self) -> Optional[int]:
+        """Offset of the first </head> tag."""
+        tag = self.first("/head")
+        return tag.start if tag else None
+
+    def rewrite_tags(self, name: str, func: Callable[[Tag], Optional[str]]) -> int:
+        """
+        Replace tags in one splice pass.
+        func returns the new tag text, or None to leave the tag unchanged.
+        Returns the number of tags replaced.
+        """
+        parts = []
+        last = 0
+        count = 0
+        for tag in self.tags(name):
+            replacement = func(tag)
+            if replacement is None or replacement == tag.text:
+                continue
+            parts.append(self._content[last:tag.start])
+            parts.append(replacement)
+            last = tag.end
+            count += 1
+
+        if count:
+            parts.append(self._content[last:])
+            self.content = "".join(parts)
+        return count
+
+    def insert(self, offset: int, text: str):
+        self.content = self._content[:offset] + text + self._content[offset:]
+
+    def save(self) -> bool:
+        """Write the file if its content changed. Returns True if written."""
+        if not self.changed:
+            return False
+        with open(self.path, "w", encoding="utf-8", newline="") as f:
+            f.write(self._content)
+        self.original = self._content
+        return True
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+HTML Post-Processing Pipeline
+Runs the fixer transforms as named stages in a single pass per file.
+
+Each file is loaded once into an HtmlDocument, every selected stage is applied
+to it in memory, and the file is written at most once. Each stage only touches
+the files its original script targeted (e.g. accessibility fixes on the core
+pages, asset path fixes in language directories).
+
+Files already processed by the same stages (same stage versions) and not
+modified since are skipped via the .build-cache.json build manifest.
+
+Usage:
+    python scripts/html_pipeline.py                      # all stages
+    python scripts/html_pipeline.py --list
+    python scripts/html_pipeline.py --stages add_lazy_loading_to_images,add_video_lazy_loading
+    python scripts/html_pipeline.py --stages fix_asset_paths de/index.html
+    python scripts/html_pipeline.py --dry-run
+    python scripts/html_pipeline.py --jobs 4
+    python scripts/html_pipeline.py --force                # ignore the build manifest
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from build_manifest import BuildManifest
+from html_document import HtmlDocument
+from parallel_jobs import add_jobs_argument, map_files
+
+ROOT_DIR = Path(__file__).parent.parent
+
+SKIP_DIRS = {"_includes", "_templates", "_config", ".git", ".github", "node_modules"}
+
+# How a stage function is called:
+#   doc       -> func(doc)
+#   doc+path  -> func(doc, relative_path)
+#   text      -> doc.content = func(doc.content)
+DOC = "doc"
+DOC_PATH = "doc+path"
+TEXT = "text"
+
+# Stage registry, in default run order:
+# name -> (script, function, call style, scope)
+# scope names a module attribute: a list of target files or a predicate on the path
+STAGES = {
+    "fix_asset_paths": ("fix_asset_paths.py", "fix_asset_paths", TEXT, "is_language_page"),
+    "fix_nav_buttons": ("fix_nav_buttons.py", "fix_nav_buttons", TEXT, "HTML_FILES"),
+    "inject_chatbot_widget": ("inject_chatbot.py", "add_chatbot_snippet", DOC, "should_process_file"),
+    "fix_chatbot_widget": ("fix_chatbot.py", "replace_chatbot_snippet", TEXT, "should_process_file"),
+    "add_resource_hints_to_head": ("scripts/add-resource-hints.py", "add_resource_hints_to_head", DOC_PATH, "HTML_FILES"),
+    "optimize_script_loading": ("scripts/add-resource-hints.py", "optimize_script_loading", DOC, "HTML_FILES"),
+    "add_dimensions_to_images": ("scripts/fix-cls-images.py", "add_dimensions_to_images", DOC_PATH, "HTML_FILES"),
+    "add_lazy_loading": ("scripts/fix-cls-images.py", "add_lazy_loading", DOC, "HTML_FILES"),
+    "add_lazy_loading_to_images": ("scripts/optimize-images-simple.py", "add_lazy_loading_to_images", DOC, "HTML_FILES"),
+    "add_video_lazy_loading": ("scripts/optimize-images-simple.py", "add_video_lazy_loading", DOC, "HTML_FILES"),
+    "add_aria_labels_to_videos": ("scripts/add-video-alt-text.py", "add_aria_labels_to_videos", DOC, "HTML_FILES"),
+    "add_accessibility_css": ("scripts/apply-accessibility-fixes.py", "add_accessibility_css", DOC, "HTML_FILES"),
+    "add_skip_link": ("scripts/apply-accessibility-fixes.py", "add_skip_link", DOC, "HTML_FILES"),
+    "add_aria_landmarks": ("scripts/apply-accessibility-fixes.py", "add_aria_landmarks", DOC, "HTML_FILES"),
+    "improve_button_aria_labels": ("scripts/apply-accessibility-fixes.py", "improve_button_aria_labels", DOC, "HTML_FILES"),
+    "improve_image_alt_text": ("scripts/apply-accessibility-fixes.py", "improve_image_alt_text", DOC, "HTML_FILES"),
+}
+
+_modules = {}
+_stage_cache = {}
+
+
+class Stage:
+    """A registered transform, bound to its function and file scope."""
+
+    def __init__(self, name: str, func: Callable, style: str, scope,
+                 version: str = "1", dependencies: Optional[Callable] = None):
+        self.name = name
+        self.func = func
+        self.style = style
+        self.version = version
+        # Optional func(doc, rel_path) -> other files the stage's output depends on
+        self.dependencies = dependencies
+        if callable(scope):
+            self.applies_to = lambda rel_path: bool(scope(Path(rel_path)))
+        else:
+            files = set(scope)
+            self.applies_to = lambda rel_path: rel_path in files
+
+    def apply(self, doc: HtmlDocument, rel_path: str) -> int:
+        """Run the stage on doc and return the number of changes it made."""
+        before = doc.content
+
+        if self.style == TEXT:
+            doc.content = self.func(before)
+            result = doc.content != before
+        elif self.style == DOC_PATH:
+            result = self.func(doc, rel_path)
+        else:
+            result = self.func(doc)
+
+        # Flags like improve_image_alt_text's can be set without an edit
+        if doc.content == before:
+            return 0
+        if isinstance(result, bool):
+            return int(result)
+        if isinstance(result, (list, tuple)):
+            return len(result)
+        return result or 1
+
+
+def load_module(script: str):
+    """Import a fixer script by path (most have hyphenated names)."""
+    if script not in _modules:
+        path = ROOT_DIR / script
+        name = "_pipeline_" + path.stem.replace("-", "_")
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[script] = module
+    return _modules[script]
+
+
+def load_stages(names: List[str]) -> List[Stage]:
+    """Resolve stage names to Stage objects, skipping ones that fail to load."""
+    stages = []
+    for name in names:
+        script, func_name, style, scope_attr = STAGES[name]
+        try:
+            module = load_module(script)
+        except ImportError as e:
+            print(f"⚠️  Skipping stage {name}: {e}")
+            continue
+        stages.append(Stage(name, getattr(module, func_name), style, getattr(module, scope_attr),
+                            getattr(module, "TRANSFORM_VERSION", "1"),
+                            getattr(module, "file_dependencies", None)))
+    return stages
+
+
+def find_html_files() -> List[str]:
+    """All site HTML files, relative to ROOT_DIR."""
+    html_files = []
+    for root, dirs, files in os.walk(ROOT_DIR):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for file in sorted(files):
+            if file.endswith(".html"):
+                html_files.append((Path(root) / file).relative_to(ROOT_DIR).as_posix())
+    return html_files
+
+
+def process_file(rel_path: str, stages: List[Stage], dry_run: bool = False) -> Dict:
+    """Apply stages to one file in memory and write it at most once."""
+    result = {"file": rel_path, "changed": False, "stages": {}, "deps": [], "error": None}
+
+    try:
+        doc = HtmlDocument.load(ROOT_DIR / rel_path)
+        for stage in stages:
+            if not stage.applies_to(rel_path):
+                continue
+            started = time.perf_counter()
+            changes = stage.apply(doc, rel_path)
+            result["stages"][stage.name] = (changes, time.perf_counter() - started)
+            if stage.dependencies:
+                result["deps"].extend(stage.dependencies(doc, rel_path))
+
+        result["changed"] = doc.changed
+        if not dry_run:
+            doc.save()
+    except Exception as e:
+        result["error"] = str(e)
+
+    return result
+
+
+def process_file_task(task) -> Dict:
+    """
+    Worker entry point: (rel_path, stage_names, dry_run).
+    Stages hold closures and can't be pickled, so each worker process
+    loads them once by name and reuses them for every file it gets.
+    """
+    rel_path, stage_names, dry_run = task
+    if stage_names not in _stage_cache:
+        _stage_cache[stage_names] = load_stages(list(stage_names))
+    return process_file(rel_path, _stage_cache[stage_names], dry_run)
+
+
+def run_pipeline(stage_names: List[str], files: Optional[List[str]] = None,
+                 dry_run: bool = False, jobs: int = 1, force: bool = False) -> List[Dict]:
+    """Run the selected stages over files (default: every site HTML file)."""
+    stages = load_stages(stage_names)
+    if files is None:
+        files = find_html_files()
+
+    # One manifest section per stage list: a different selection, order or
+    # stage version means files have to be reprocessed
+    version = ",".join(f"{stage.name}@{stage.version}" for stage in stages)
+    manifest = BuildManifest.load("html_pipeline", version, force=force, enabled=not dry_run)
+
+    # fix-cls-images resolves image paths relative to the project root
+    os.chdir(ROOT_DIR)
+
+    targets = []
+    for rel_path in files:
+        if not any(stage.applies_to(rel_path) for stage in stages):
+            continue
+        if not (ROOT_DIR / rel_path).exists():
+            print(f"⚠️  File not found: {rel_path}")
+            continue
+        if manifest.is_fresh(ROOT_DIR / rel_path):
+            continue
+        targets.append(rel_path)
+
+    # Only pass on stages that loaded here, so workers don't repeat the warnings
+    loaded = tuple(stage.name for stage in stages)
+    _stage_cache[loaded] = stages
+    tasks = [(rel_path, loaded, dry_run) for rel_path in targets]
+    results = map_files(process_file_task, tasks, jobs)
+
+    for result in results:
+        if not result["error"]:
+            manifest.record(ROOT_DIR / result["file"], deps=result["deps"])
+    manifest.save()
+
+    if manifest.skipped:
+        print(f"⏭️  {manifest.skipped} file(s) unchanged since the last run, skipped")
+    return results
+
+
+def print_report(results: List[Dict], stage_names: List[str], dry_run: bool, elapsed: float):
+    """Print changed files and per-stage change counts and timings."""
+    totals = defaultdict(lambda: {"files": 0, "changes": 0, "time": 0.0})
+
+    for result in results:
+        if result["error"]:
+            print(f"  ❌ {result['file']}: {result['error']}")
+            continue
+        for name, (changes, seconds) in result["stages"].items():
+            totals[name]["time"] += seconds
+            totals[name]["changes"] += changes
+            if changes:
+                totals[name]["files"] += 1
+        if result["changed"]:
+            applied = [name for name, (changes, _) in result["stages"].items() if changes]
+            verb = "Would update" if dry_run else "Updated"
+            print(f"  ✅ {verb}: {result['file']} ({', '.join(applied)})")
+
+    print(f"\n{'='*70}")
+    print("📊 Stage Summary")
+    print(f"{'='*70}")
+    print(f"{'Stage':<30} {'Files':>7} {'Changes':>9} {'Time (ms)':>11}")
+    for name in stage_names:
+        if name in totals:
+            stats = totals[name]
+            print(f"{name:<30} {stats['files']:>7} {stats['changes']:>9} {stats['time'] * 1000:>11.1f}")
+
+    changed = sum(1 for r in results if r["changed"])
+    print(f"\n✨ {changed} of {len(results)} files {'would change' if dry_run else 'changed'} "
+          f"in {elapsed:.2f}s")
+    print(f"{'='*70}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the HTML fixer transforms as a single-pass pipeline"
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="HTML files relative to the project root (default: all site pages)"
+    )
+    parser.add_argument(
+        "--stages",
+        "-s",
+        help="Comma-separated stage names, applied in the order given (default: all)"
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List available stages"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report changes without writing files"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reprocess files even if unchanged since the last run"
+    )
+    add_jobs_argument(parser)
+
+    args = parser.parse_args()
+
+    if args.list:
+        for name, (script, func_name, style, scope) in STAGES.items():
+            print(f"{name:<30} {script}:{func_name}")
+        return
+
+    stage_names = args.stages.split(",") if args.stages else list(STAGES)
+    unknown = [name for name in stage_names if name not in STAGES]
+    if unknown:
+        print(f"❌ Unknown stage(s): {', '.join(unknown)} (see --list)")
+        sys.exit(1)
+
+    print(f"\n{'='*70}")
+    print(f"HTML Pipeline - {'DRY RUN' if args.dry_run else 'LIVE'}")
+    print(f"{'='*70}\n")
+
+    started = time.perf_counter()
+    results = run_pipeline(stage_names, args.files or None, args.dry_run, args.jobs, args.force)
+    print_report(results, stage_names, args.dry_run, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
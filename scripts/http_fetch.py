@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Rate-limited, retrying HTTP client for the API fetchers (standard library only).
+
+One HttpClient is shared by every worker thread of a fetch:
+
+- a TokenBucket caps the request rate across all threads, so a thread pool
+  finishes at the API's rate cap (2 requests/second on TheSportsDB's free
+  tier) instead of the sum of every round-trip;
+- each thread keeps one keep-alive http.client connection per host and
+  reuses it, so the TLS handshake happens once per worker, not per request;
+- connection errors, 429 and 5xx responses are retried with jittered
+  exponential backoff, or after the server's Retry-After if that is longer;
+- with a ResponseCache (see response_cache.py), fresh entries are served
+  without a request and stale ones are revalidated with a conditional GET.
+
+Usage:
+    from http_fetch import FetchError, HttpClient
+
+    with HttpClient(rate=2.0, retries=3) as client:
+        try:
+            data = client.get_json("https://www.thesportsdb.com/api/v1/json/3/...")
+        except FetchError as e:
+            print(f"❌ {e}")
+"""
+
+import http.client
+import json
+import random
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional
+from urllib.parse import urlsplit
+
+from response_cache import ResponseCache
+
+USER_AGENT = "TVMasterVIP-EventsFetcher/1.0"
+
+# Responses worth retrying: rate limited or a temporary server problem
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """A request that still failed after every retry."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, at most `capacity` banked."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, sleeping until it is due. Returns the time slept.
+        Callers reserve tokens in arrival order, so waiting threads are served
+        first come, first served. A rate of 0 disables the limit.
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+class Response:
+    """
+    A complete response: status, reason, headers and the whole body.
+    cache is None for a network response, "fresh" for one served from the
+    cache without a request and "revalidated" after a 304 Not Modified.
+    """
+
+    def __init__(self, status: int, reason: str, headers: Mapping[str, str], body: bytes,
+                 cache: Optional[str] = None):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        self.cache = cache
+
+
+class HttpClient:
+    """GET client shared between threads: rate limit, keep-alive connections, retries."""
+
+    def __init__(self, rate: float = 2.0, retries: int = 3, backoff: float = 0.5,
+                 max_backoff: float = 30.0, timeout: float = 10.0,
+                 user_agent: str = USER_AGENT, cache: Optional[ResponseCache] = None):
+        self.limiter = TokenBucket(rate)
+        self.cache = cache
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.stats = {"requests": 0, "retries": 0, "connections": 0, "cached": 0, "revalidated": 0}
+        self._local = threading.local()
+        self._connections: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """This thread's keep-alive connection to a host, opened on first use."""
+        pool = getattr(self._local, "connections", None)
+        if pool is None:
+            pool = self._local.connections = {}
+        conn = pool.get((scheme, netloc))
+        if conn is None:
+            connection_class = (http.client.HTTPSConnection if scheme == "https"
+                                else http.client.HTTPConnection)
+            conn = pool[(scheme, netloc)] = connection_class(netloc, timeout=self.timeout)
+            with self._lock:
+                self._connections.append(conn)
+                self.stats["connections"] += 1
+        return conn
+
+    def retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Exponential backoff with jitter (half fixed, half random), or Retry-After if longer."""
+        ceiling = min(self.max_backoff, self.backoff * 2 ** attempt)
+        delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+        if retry_after and retry_after.strip().isdigit():
+            delay = max(delay, min(float(retry_after), self.max_backoff))
+        return delay
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Response:
+        """
+        GET url and return the response, whatever its status, going through
+        the cache if there is one. Raises FetchError if the connection or a
+        retryable status still fails after every retry.
+        """
+        entry = self.cache.load(url) if self.cache else None
+        if entry is None:
+            response = self.request(url, headers)
+        elif self.cache.is_fresh(entry):
+            self._count("cached")
+            return Response(200, "OK", {}, entry["body"].encode("utf-8"), cache="fresh")
+        else:
+            response = self.request(url, dict(headers or {}, **ResponseCache.validators(entry)))
+            if response.status == 304:
+                self.cache.touch(url, entry)
+                self._count("revalidated")
+                return Response(200, "OK", response.headers, entry["body"].encode("utf-8"),
+                                cache="revalidated")
+
+        if self.cache and response.status == 200:
+            self.cache.store(url, response.body, response.headers.get("ETag"),
+                             response.headers.get("Last-Modified"))
+        return response
+
+    def request(self, url: str, headers: Optional[Dict[str, str]] = None) -> Response:
+        """GET url over the network (no cache), with rate limiting and retries."""
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise FetchError(f"Unsupported URL: {url}")
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        request_headers = {"User-Agent": self.user_agent, "Accept": "application/json"}
+        request_headers.update(headers or {})
+
+        conn = self._connection(parts.scheme, parts.netloc)
+        error = ""
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._count("retries")
+            self.limiter.acquire()
+            self._count("requests")
+            retry_after = None
+            try:
+                conn.request("GET", path, headers=request_headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                # Drop the broken socket; the next request reconnects
+                conn.close()
+                error = f"Connection error: {str(e) or type(e).__name__}"
+            else:
+                if response.status not in RETRY_STATUSES:
+                    return Response(response.status, response.reason, response.headers, body)
+                error = f"HTTP Error {response.status}: {response.reason}"
+                retry_after = response.headers.get("Retry-After")
+
+            if attempt < self.retries:
+                time.sleep(self.retry_delay(attempt, retry_after))
+
+        raise FetchError(f"{error} (after {self.retries + 1} attempts)")
+
+    def get_json(self, url: str) -> Any:
+        """GET url and decode the JSON body. Raises FetchError on any failure."""
+        response = self.get(url)
+        if response.status >= 400:
+            raise FetchError(f"HTTP Error {response.status}: {response.reason}")
+        try:
+            return json.loads(response.body.decode("utf-8"))
+        except ValueError as e:
+            raise FetchError(f"Invalid JSON: {e}")
+
+    def close(self):
+        """Close every connection opened by any thread."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Minimal include engine for the _includes partials.
+
+Pages pull in partials with a directive:
+
+    {% include 'header.html' %}
+    {% include 'schema-breadcrumb.html' BREADCRUMB_ITEMS='{"name": "Home"}' %}
+
+The pages are their own source, so rendering a page expands each bare
+directive into a marked region and, on later builds, re-renders the body
+of every region from the current partial:
+
+    <!-- {% include 'header.html' %} -->
+    <header ...>...</header>
+    <!-- {% endinclude %} -->
+
+Editing a partial and rebuilding therefore updates every page that uses it.
+Partials are parsed once into literal text, {{PLACEHOLDER}} and nested
+include segments and cached for the life of the engine. Placeholders are
+filled from the page context plus the directive's parameters; a language
+can override a partial with _includes/<lang>/<name>.
+
+Pass a RenderTrace to render_page to learn what a page consumed: every
+partial file looked up (overrides included, so creating one counts) and
+every placeholder filled. Builds store it for minimal rebuilds.
+
+Usage:
+    from include_engine import IncludeEngine
+
+    engine = IncludeEngine(ROOT_DIR / "_includes")
+    content, errors = engine.render_page(content, {"PAGE_TITLE": "..."}, lang="de")
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# {{NAME}} or {{ NAME }}; lowercase {{...}} belongs to client-side templates
+PLACEHOLDER_RE = re.compile(r"\{\{\s*([A-Z][A-Z0-9_]*)\s*\}\}")
+
+
+def directive_pattern(suffix: str = "") -> str:
+    """{% include 'name' PARAMS %} with uniquely named groups."""
+    return (rf"\{{%\s*include\s+(?P<quote{suffix}>['\"])(?P<name{suffix}>[^'\"]+)(?P=quote{suffix})"
+            rf"(?P<params{suffix}>(?:[^%]|%(?!\}}))*)%\}}")
+
+
+END_MARKER = "<!-- {% endinclude %} -->"
+
+# A rendered region (start marker, body, end marker) or a bare directive
+PAGE_INCLUDE_RE = re.compile(
+    r"(?P<start><!--\s*" + directive_pattern() + r"\s*-->)(?P<body>.*?)"
+    r"<!--\s*\{%\s*endinclude\s*%\}\s*-->"
+    r"|" + directive_pattern("_bare"),
+    re.DOTALL
+)
+
+# Inside partials: nested directives and placeholders, in one scan
+PARTIAL_TOKEN_RE = re.compile(
+    directive_pattern() + r"|\{\{\s*(?P<placeholder>[A-Z][A-Z0-9_]*)\s*\}\}"
+)
+
+PARAM_RE = re.compile(r"""([A-Z][A-Z0-9_]*)=(?:"([^"]*)"|'([^']*)')""")
+
+# Relative links in partials are written for a page in the site root
+RELATIVE_LINK_RE = re.compile(r"""((?:href|src|content)="|url\(['"])\./(assets/)?""")
+
+
+def parse_params(text: str) -> Dict[str, str]:
+    """NAME="value" / NAME='value' pairs of a directive."""
+    return {name: double if double is not None else single
+            for name, double, single in PARAM_RE.findall(text)}
+
+
+def normalize_name(name: str) -> str:
+    """'_includes/header.html' and 'header.html' name the same partial."""
+    name = name.strip()
+    return name[len("_includes/"):] if name.startswith("_includes/") else name
+
+
+def relative_links(html: str, site_prefix: str, lang_prefix: str) -> str:
+    """Point a partial's ./assets/ links at the site root and other ./ links at the language root."""
+    if site_prefix == "./" and lang_prefix == "./":
+        return html
+
+    def replace(match):
+        prefix = site_prefix if match.group(2) else lang_prefix
+        return f"{match.group(1)}{prefix}{match.group(2) or ''}"
+
+    return RELATIVE_LINK_RE.sub(replace, html)
+
+
+class RenderTrace:
+    """What a render consumed: partial paths looked up and placeholder names filled."""
+
+    def __init__(self):
+        self.partials: Set[Path] = set()
+        self.placeholders: Set[str] = set()
+
+
+class Partial:
+    """A parsed partial: literal text, ('var', name) and ('include', name, params) segments."""
+
+    def __init__(self, path: Path, text: str):
+        self.path = path
+        self.segments = []
+        position = 0
+        for match in PARTIAL_TOKEN_RE.finditer(text):
+            if match.start() > position:
+                self.segments.append(text[position:match.start()])
+            if match.group("placeholder"):
+                self.segments.append(("var", match.group("placeholder")))
+            else:
+                self.segments.append(("include", normalize_name(match.group("name")),
+                                      parse_params(match.group("params"))))
+            position = match.end()
+        if position < len(text):
+            self.segments.append(text[position:])
+
+
+class IncludeEngine:
+    """Resolves {% include %} directives against a directory of partials."""
+
+    def __init__(self, includes_dir: Path):
+        self.includes_dir = Path(includes_dir)
+        self._partials: Dict[Path, Partial] = {}
+        self._paths: Dict[Tuple[str, Optional[str]], Optional[Path]] = {}
+
+    def candidates(self, name: str, lang: Optional[str] = None) -> List[Path]:
+        """Where a partial is looked up, in order: _includes/<lang>/<name>, _includes/<name>."""
+        paths = [self.includes_dir / lang / name] if lang else []
+        paths.append(self.includes_dir / name)
+        return paths
+
+    def resolve(self, name: str, lang: Optional[str] = None) -> Optional[Path]:
+        """Path of a partial, preferring the language override."""
+        key = (name, lang)
+        if key not in self._paths:
+            self._paths[key] = next((path for path in self.candidates(name, lang) if path.is_file()), None)
+        return self._paths[key]
+
+    def partial(self, path: Path) -> Partial:
+        """Parsed partial, read and parsed on first use only."""
+        if path not in self._partials:
+            with open(path, "r", encoding="utf-8") as f:
+                self._partials[path] = Partial(path, f.read())
+        return self._partials[path]
+
+    def render_partial(self, name: str, context: Dict[str, str], errors: List[str],
+                       lang: Optional[str] = None, stack: Tuple[str, ...] = (),
+                       trace: Optional[RenderTrace] = None) -> Optional[str]:
+        """Render one partial; None (with an error recorded) if it can't be found."""
+        if trace is not None:
+            trace.partials.update(self.candidates(name, lang))
+        path = self.resolve(name, lang)
+        if path is None:
+            errors.append(f"Partial not found: {name}")
+            return None
+        if name in stack:
+            errors.append(f"Circular include: {' -> '.join(stack + (name,))}")
+            return None
+
+        parts = []
+        for segment in self.partial(path).segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+            elif segment[0] == "var":
+                if segment[1] in context:
+                    parts.append(context[segment[1]])
+                    if trace is not None:
+                        trace.placeholders.add(segment[1])
+                else:
+                    errors.append(f"Unresolved placeholder {{{{{segment[1]}}}}} in {name}")
+                    parts.append(f"{{{{{segment[1]}}}}}")
+            else:
+                _, child, params = segment
+                rendered = self.render_partial(child, dict(context, **params), errors,
+                                               lang, stack + (name,), trace)
+                parts.append(rendered if rendered is not None else "")
+        return "".join(parts)
+
+    def render_page(self, content: str, context: Dict[str, str], lang: Optional[str] = None,
+                    site_prefix: str = "./", lang_prefix: str = "./",
+                    trace: Optional[RenderTrace] = None) -> Tuple[str, List[str]]:
+        """
+        Expand bare directives and re-render existing include regions.
+        Returns (content, errors); regions that fail to render are left as they were.
+        """
+        errors: List[str] = []
+
+        def replace(match):
+            if match.group("start"):
+                start = match.group("start")
+                name, params = match.group("name"), match.group("params")
+            else:
+                if re.search(r"<!--\s*$", content[max(0, match.start() - 10):match.start()]):
+                    errors.append(f"Include region without {END_MARKER}: {match.group(0)}")
+                    return match.group(0)
+                name, params = match.group("name_bare"), match.group("params_bare")
+                start = f"<!-- {match.group(0)} -->"
+
+            page_errors: List[str] = []
+            rendered = self.render_partial(normalize_name(name), dict(context, **parse_params(params)),
+                                           page_errors, lang, trace=trace)
+            errors.extend(page_errors)
+            if rendered is None or page_errors:
+                return match.group(0)
+
+            rendered = relative_links(rendered, site_prefix, lang_prefix)
+            if not rendered.endswith("\n"):
+                rendered += "\n"
+            return f"{start}\n{rendered}{END_MARKER}"
+
+        return PAGE_INCLUDE_RE.sub(replace, content), errors
@@ -4,9 +4,15 @@ Simple Image Optimization for Core Web Vitals
 Adds lazy loading and aspect-ratio preservation to prevent CLS
 """
 
-import re
+import argparse
 import os
 from pathlib import Path
+from typing import Optional
+
+from build_manifest import BuildManifest
+from html_document import HtmlDocument
+
+TRANSFORM_VERSION = "1"
 
 HTML_FILES = [
     "index.html",
@@ -19,68 +25,47 @@ HTML_FILES = [
     "sports/live.html",
 ]
 
-def add_lazy_loading_to_images(content: str) -> tuple[str, int]:
+def add_lazy_loading_to_images(doc: HtmlDocument) -> int:
     """Add loading='lazy' and decoding='async' to images below the fold"""
     changes = 0
 
-    # Find all img tags
-    img_pattern = r'(<img\s+[^>]*?)(>)'
-
-    def replace_img(match):
+    def replace_img(tag):
         nonlocal changes
-        img_tag = match.group(1)
-        closing = match.group(2)
 
         # Skip if already has loading attribute
-        if 'loading=' in img_tag:
-            return match.group(0)
+        if tag.has('loading'):
+            return None
 
         # Skip header logos and hero images (above the fold)
-        if any(x in img_tag for x in ['header-logo', 'hero-', 'brand-logo']):
+        if any(x in tag.text for x in ['header-logo', 'hero-', 'brand-logo']):
             # These should load eagerly, but add decoding="async"
-            if 'decoding=' not in img_tag:
-                return f'{img_tag} decoding="async"{closing}'
-            return match.group(0)
+            if not tag.has('decoding'):
+                return tag.with_attrs('decoding="async"')
+            return None
 
         # Add lazy loading to everything else
-        attrs_to_add = []
-        if 'loading=' not in img_tag:
-            attrs_to_add.append('loading="lazy"')
-        if 'decoding=' not in img_tag:
+        attrs_to_add = ['loading="lazy"']
+        if not tag.has('decoding'):
             attrs_to_add.append('decoding="async"')
 
-        if attrs_to_add:
-            changes += 1
-            return f'{img_tag} {" ".join(attrs_to_add)}{closing}'
-
-        return match.group(0)
+        changes += 1
+        return tag.with_attrs(" ".join(attrs_to_add))
 
-    new_content = re.sub(img_pattern, replace_img, content)
-    return new_content, changes
+    doc.rewrite_tags('img', replace_img)
+    return changes
 
-def add_video_lazy_loading(content: str) -> tuple[str, int]:
+def add_video_lazy_loading(doc: HtmlDocument) -> int:
     """Add preload='none' to videos for lazy loading"""
-    changes = 0
-
-    # Find video tags without preload="none"
-    video_pattern = r'(<video\s+[^>]*?)(>)'
-
-    def replace_video(match):
-        nonlocal changes
-        video_tag = match.group(1)
-        closing = match.group(2)
 
+    def replace_video(tag):
         # Check if preload is already set
-        if 'preload=' in video_tag:
-            return match.group(0)
-
-        changes += 1
-        return f'{video_tag} preload="none"{closing}'
+        if tag.has('preload'):
+            return None
+        return tag.with_attrs('preload="none"')
 
-    new_content = re.sub(video_pattern, replace_video, content)
-    return new_content, changes
+    return doc.rewrite_tags('video', replace_video)
 
-def process_file(filepath: str) -> dict:
+def process_file(filepath: str, manifest: Optional[BuildManifest] = None) -> dict:
     """Process a single HTML file"""
     print(f"\n📄 Processing: {filepath}")
 
@@ -88,36 +73,46 @@ def process_file(filepath: str) -> dict:
         print(f"   ⚠️  File not found, skipping")
         return {"file": filepath, "changes": []}
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    if manifest and manifest.is_fresh(filepath):
+        print("   ⏭️  Unchanged since last run, skipping")
+        return {"file": filepath, "changes": []}
 
-    original_content = content
+    doc = HtmlDocument.load(filepath)
     changes = []
 
     # Add lazy loading to images
-    content, lazy_changes = add_lazy_loading_to_images(content)
+    lazy_changes = add_lazy_loading_to_images(doc)
     if lazy_changes > 0:
         changes.append(f"Optimized {lazy_changes} images with lazy loading")
         print(f"   ✓ Added lazy loading to {lazy_changes} image(s)")
 
     # Add lazy loading to videos
-    content, video_changes = add_video_lazy_loading(content)
+    video_changes = add_video_lazy_loading(doc)
     if video_changes > 0:
         changes.append(f"Optimized {video_changes} videos with preload=none")
         print(f"   ✓ Optimized {video_changes} video(s)")
 
     # Write back if changes were made
-    if content != original_content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+    if doc.save():
         print(f"   💾 Saved {len(changes)} optimization(s)")
     else:
         print("   ℹ️  No changes needed")
 
+    if manifest:
+        manifest.record(filepath)
+
     return {"file": filepath, "changes": changes}
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reprocess files even if unchanged since the last run"
+    )
+    args = parser.parse_args()
+
     print("=" * 70)
     print("⚡ Core Web Vitals - Image & Video Optimization")
     print("=" * 70)
@@ -129,22 +124,27 @@ def main():
     project_root = script_dir.parent
     os.chdir(project_root)
 
+    manifest = BuildManifest.load("optimize-images-simple", TRANSFORM_VERSION, force=args.force)
+
     results = []
     total_files = 0
     total_changes = 0
 
     for html_file in HTML_FILES:
-        result = process_file(html_file)
+        result = process_file(html_file, manifest)
         results.append(result)
         if result["changes"]:
             total_files += 1
             total_changes += len(result["changes"])
 
+    manifest.save()
+
     # Summary
     print("\n" + "=" * 70)
     print("📊 SUMMARY")
     print("=" * 70)
     print(f"Total files processed: {len(HTML_FILES)}")
+    print(f"Unchanged (skipped): {manifest.skipped}")
     print(f"Files modified: {total_files}")
     print(f"Total improvements: {total_changes}")
 
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Cross-language page index.
+
+One filesystem walk maps every logical page (its path relative to the
+language root, e.g. "setup/fire-tv.html") to the languages that actually
+have it, with each file's mtime. Sitemap and SEO generators use it to emit
+hreflang alternates only for translations that exist, instead of assuming
+every page exists in every language.
+
+English pages live in the project root; every other language in its own
+top-level directory (de/, fr/, ...).
+
+Usage:
+    from page_index import PageIndex
+
+    index = PageIndex.build(ROOT_DIR, ["en", "de", "fr"])
+    for page in index.pages_for("de"):
+        print(page, index.languages_for(page))
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+SKIP_DIRS = {"node_modules"}
+
+
+def is_published_dir(name: str) -> bool:
+    """Hidden and underscore directories (_includes, _templates, ...) aren't site pages."""
+    return not name.startswith((".", "_")) and name not in SKIP_DIRS
+
+
+class PageIndex:
+    """Logical page -> {language: mtime} for every HTML page on the site."""
+
+    def __init__(self, root: Path, languages: Iterable[str], default_language: str = "en"):
+        self.root = Path(root)
+        self.languages = list(languages)
+        self.default_language = default_language
+        self.pages: Dict[str, Dict[str, float]] = {}
+
+    @classmethod
+    def build(cls, root: Path, languages: Iterable[str],
+              default_language: str = "en") -> "PageIndex":
+        """Walk the site once and index every .html file by language."""
+        index = cls(root, languages, default_language)
+        lang_dirs = {lang for lang in index.languages if lang != default_language}
+
+        for dirpath, dirs, files in os.walk(index.root):
+            rel_dir = Path(dirpath).relative_to(index.root).parts
+            dirs[:] = sorted(d for d in dirs if is_published_dir(d))
+
+            # The first path component decides the language
+            if rel_dir and rel_dir[0] in lang_dirs:
+                lang, page_dir = rel_dir[0], rel_dir[1:]
+            else:
+                lang, page_dir = default_language, rel_dir
+
+            for file in files:
+                if not file.endswith(".html"):
+                    continue
+                page = "/".join(page_dir + (file,))
+                mtime = os.stat(os.path.join(dirpath, file)).st_mtime
+                index.pages.setdefault(page, {})[lang] = mtime
+
+        return index
+
+    def __contains__(self, page: str) -> bool:
+        return page in self.pages
+
+    def has(self, lang: str, page: str) -> bool:
+        return lang in self.pages.get(page, {})
+
+    def languages_for(self, page: str) -> List[str]:
+        """Languages that have page, in configured language order."""
+        available = self.pages.get(page, {})
+        return [lang for lang in self.languages if lang in available]
+
+    def pages_for(self, lang: str) -> List[str]:
+        """Every page that exists in lang, sorted."""
+        return sorted(page for page, langs in self.pages.items() if lang in langs)
+
+    def mtime(self, lang: str, page: str) -> Optional[float]:
+        return self.pages.get(page, {}).get(lang)
+
+    def path(self, lang: str, page: str) -> Path:
+        """Filesystem path of page in lang (whether or not it exists)."""
+        if lang == self.default_language:
+            return self.root / page
+        return self.root / lang / page
+
+    def alternates(self, page: str, exclude: Optional[str] = None) -> List[str]:
+        """Other languages that have page (for hreflang), excluding one."""
+        return [lang for lang in self.languages_for(page) if lang != exclude]
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Shared --jobs N execution mode for the tree-wide HTML rewriters.
+
+Files are fanned out to a ProcessPoolExecutor in chunks. Workers return their
+per-file results instead of printing, and results come back in input order,
+so the report is identical whatever the number of jobs.
+
+Usage:
+    from parallel_jobs import add_jobs_argument, map_files
+
+    add_jobs_argument(parser)
+    results = map_files(process_one_file, files, args.jobs)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+
+def add_jobs_argument(parser, default: int = 1):
+    """Add the shared --jobs/-j option to an argparse parser."""
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=default,
+        help=f"Worker processes (default: {default}, 0 = one per CPU core)"
+    )
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Translate a --jobs value into a worker count."""
+    if not jobs or jobs < 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def map_files(func: Callable, items: Iterable, jobs: Optional[int] = 1,
+              chunksize: Optional[int] = None) -> List:
+    """
+    Apply func to every item, in parallel when jobs > 1.
+    func must be a module-level function so it can be sent to workers.
+    Results are returned in the same order as items.
+    """
+    items = list(items)
+    workers = min(resolve_jobs(jobs), len(items))
+
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    if chunksize is None:
+        # A few chunks per worker balances load without per-file IPC overhead
+        chunksize = max(1, len(items) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items, chunksize=chunksize))
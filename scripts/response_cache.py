@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+On-disk HTTP response cache for the API fetchers.
+
+Each URL gets one JSON file in .http-cache/ holding the response body, its
+ETag and Last-Modified validators and when it was fetched. HttpClient (see
+http_fetch.py) consults it before every GET:
+
+- an entry younger than max_age is served without any request;
+- an older one is revalidated with If-None-Match / If-Modified-Since, and a
+  304 Not Modified just refreshes its fetch time;
+- any other 200 response replaces the entry.
+
+A frequent cron then costs one conditional request per league (or nothing,
+inside max_age) while the upstream data hasn't changed. One file per URL
+means worker threads never contend for the same file, and every file is
+written atomically.
+
+Usage:
+    from http_fetch import HttpClient
+    from response_cache import ResponseCache
+
+    cache = ResponseCache(max_age=900)
+    client = HttpClient(cache=cache)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+ROOT_DIR = Path(__file__).parent.parent
+CACHE_DIR = ROOT_DIR / ".http-cache"
+CACHE_FORMAT = 1
+
+
+def cache_key(url: str) -> str:
+    """File name of a URL's entry."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32] + ".json"
+
+
+class ResponseCache:
+    """URL -> {body, etag, lastModified, fetchedAt} entries, one file each."""
+
+    def __init__(self, directory: Path = CACHE_DIR, max_age: float = 0, enabled: bool = True):
+        self.directory = Path(directory)
+        self.max_age = max_age
+        self.enabled = enabled
+
+    def path(self, url: str) -> Path:
+        return self.directory / cache_key(url)
+
+    def load(self, url: str) -> Optional[Dict]:
+        """The URL's entry, or None (missing, unreadable, other format or other URL)."""
+        if not self.enabled:
+            return None
+        try:
+            with open(self.path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("format") != CACHE_FORMAT or entry.get("url") != url:
+            return None
+        return entry
+
+    def age(self, entry: Dict) -> float:
+        """Seconds since the entry was fetched or last revalidated."""
+        return time.time() - entry.get("fetchedAt", 0)
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """True if the entry can be served without asking the server."""
+        return self.max_age > 0 and 0 <= self.age(entry) < self.max_age
+
+    @staticmethod
+    def validators(entry: Dict) -> Dict[str, str]:
+        """Conditional request headers for an entry (empty if it has no validators)."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("lastModified"):
+            headers["If-Modified-Since"] = entry["lastModified"]
+        return headers
+
+    def store(self, url: str, body: bytes, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> Optional[Dict]:
+        """Save a 200 response. Bodies that aren't UTF-8 text are not cached."""
+        if not self.enabled:
+            return None
+        try:
+            text = body.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        entry = {
+            "format": CACHE_FORMAT,
+            "url": url,
+            "etag": etag,
+            "lastModified": last_modified,
+            "fetchedAt": time.time(),
+            "body": text,
+        }
+        self._write(url, entry)
+        return entry
+
+    def touch(self, url: str, entry: Dict):
+        """Record a successful revalidation (304): the entry is fresh again."""
+        if not self.enabled:
+            return
+        entry["fetchedAt"] = time.time()
+        self._write(url, entry)
+
+    def _write(self, url: str, entry: Dict):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".entry.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path(url))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
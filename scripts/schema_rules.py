@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Declarative schema.org rule registry for JSON-LD validation.
+
+Rules are plain data (see SCHEMA_RULES in validate-structured-data.py) and
+are compiled once, at import time, into validator closures: one per type,
+with every nested property check already bound. Validating a node is then
+just calling the closures for its @type(s) - no rule interpretation per node.
+
+Type rule keys:
+    required     properties the node must have
+    missing      message for a missing property (default below)
+    type         expected @type of the node, with wrong_type as message
+    properties   {property: value rule} for nested values
+    by_type      {@type: rule} applied when the node has that type
+    extends      name of another type rule to inherit (top-level rules only)
+
+Value rule keys (a value rule may also use every type rule key, which then
+applies to the value when it's an object):
+    object       message if the value is not an object
+    typed        the object must also have an @type (uses the object message)
+    array        message if the value is not an array
+    items        type rule applied to each array element ({i} = index)
+    many         value may be one object or an array of objects
+
+Messages are format strings; {type}, {prop} and {i} are filled in.
+
+PageTypeIndex maps page paths to the schema types they must carry, from
+glob patterns ("blog/*.html"); every pattern a page matches applies.
+
+Usage:
+    from schema_rules import compile_rules, node_types
+
+    validators = compile_rules({"Event": {"required": ["name", "startDate"]}})
+    issues = []
+    for schema_type in node_types(node):
+        if schema_type in validators:
+            validators[schema_type](node, issues)
+"""
+
+import re
+from typing import Callable, Dict, List, Pattern, Set, Tuple
+
+MISSING_MESSAGE = "Missing required property '{prop}' for {type}"
+
+Validator = Callable[[dict, List[str]], None]
+
+
+def node_types(node) -> List[str]:
+    """A node's @type as a list (schema.org allows a string or an array)."""
+    schema_type = node.get("@type") if isinstance(node, dict) else None
+    if schema_type is None:
+        return []
+    if isinstance(schema_type, list):
+        return [t for t in schema_type if isinstance(t, str)]
+    return [schema_type]
+
+
+def describe_type(node) -> str:
+    """Human-readable type for messages: 'Product' or 'Product/Thing'."""
+    types = node_types(node)
+    return "/".join(types) if types else "Unknown"
+
+
+def _message(template: str, context: Dict, **extra) -> str:
+    return template.format(**dict(context, **extra))
+
+
+def _compile_node(rule: Dict) -> Callable[[dict, List[str], Dict], None]:
+    """Compile a type rule into check(node, issues, context)."""
+    checks = []
+
+    expected = rule.get("type")
+    if expected:
+        wrong_type = rule["wrong_type"]
+
+        def check_type(node, issues, context):
+            if expected not in node_types(node):
+                issues.append(_message(wrong_type, context))
+        checks.append(check_type)
+
+    required = tuple(rule.get("required", ()))
+    if required:
+        missing = rule.get("missing", MISSING_MESSAGE)
+
+        def check_required(node, issues, context):
+            for prop in required:
+                if prop not in node:
+                    issues.append(_message(missing, context, prop=prop))
+        checks.append(check_required)
+
+    for prop, value_rule in rule.get("properties", {}).items():
+        checks.append(_compile_property(prop, value_rule))
+
+    by_type = {name: _compile_node(sub_rule) for name, sub_rule in rule.get("by_type", {}).items()}
+    if by_type:
+        def check_by_type(node, issues, context):
+            for schema_type in node_types(node):
+                if schema_type in by_type:
+                    by_type[schema_type](node, issues, dict(context, type=schema_type))
+        checks.append(check_by_type)
+
+    checks = tuple(checks)
+
+    def check_node(node, issues, context):
+        for check in checks:
+            check(node, issues, context)
+
+    return check_node
+
+
+def _compile_property(prop: str, rule: Dict) -> Callable[[dict, List[str], Dict], None]:
+    """Compile a value rule for node[prop] (skipped when prop is absent)."""
+    object_message = rule.get("object")
+    array_message = rule.get("array")
+    typed = rule.get("typed", False)
+    many = rule.get("many", False)
+    items = _compile_node(rule["items"]) if "items" in rule else None
+    nested = _compile_node(rule)
+
+    def check_object(value, issues, context):
+        if not isinstance(value, dict):
+            if object_message:
+                issues.append(_message(object_message, context, prop=prop))
+            return
+        if typed and "@type" not in value:
+            issues.append(_message(object_message, context, prop=prop))
+            return
+        nested(value, issues, dict(context, type=describe_type(value), prop=prop))
+
+    def check_property(node, issues, context):
+        if prop not in node:
+            return
+        value = node[prop]
+
+        if array_message and not isinstance(value, list):
+            issues.append(_message(array_message, context, prop=prop))
+            return
+
+        if items is not None and isinstance(value, list):
+            for i, item in enumerate(value):
+                if isinstance(item, dict):
+                    items(item, issues, dict(context, i=i, prop=prop))
+            return
+
+        if many and isinstance(value, list):
+            for item in value:
+                check_object(item, issues, context)
+            return
+
+        check_object(value, issues, context)
+
+    return check_property
+
+
+def compile_rules(rules: Dict[str, Dict]) -> Dict[str, Validator]:
+    """
+    Compile a {type: rule} registry into {type: validator(node, issues)}.
+    'extends' is resolved here, so subtypes share their parent's checks.
+    """
+    def resolve(name, seen=()):
+        rule = dict(rules[name])
+        parent = rule.pop("extends", None)
+        if parent is None:
+            return rule
+        if parent in seen:
+            raise ValueError(f"Circular 'extends' in schema rules: {name} -> {parent}")
+        base = resolve(parent, seen + (name,))
+        merged = dict(base, **rule)
+        merged["required"] = list(base.get("required", [])) + [
+            prop for prop in rule.get("required", []) if prop not in base.get("required", [])
+        ]
+        merged["properties"] = dict(base.get("properties", {}), **rule.get("properties", {}))
+        return merged
+
+    validators = {}
+    for name in rules:
+        check = _compile_node(resolve(name))
+
+        def validator(node, issues, check=check, name=name):
+            check(node, issues, {"type": name})
+
+        validators[name] = validator
+    return validators
+
+
+def document_types(schema) -> Set[str]:
+    """Types declared by a JSON-LD document: its own @type or its @graph nodes'."""
+    if not isinstance(schema, dict):
+        return set()
+    nodes = schema.get("@graph") if "@graph" in schema else [schema]
+    if not isinstance(nodes, list):
+        return set()
+    return {schema_type for node in nodes for schema_type in node_types(node)}
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a page glob: * and ? stay within a path segment, ** spans segments."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(parts)
+
+
+class PageTypeIndex:
+    """
+    Required schema types per page, from {glob: [types]}.
+    Literal patterns are a dict lookup. Wildcard patterns are compiled once
+    each and also joined into one alternation, which rejects pages no
+    pattern matches in a single regex call; a page that passes it gets the
+    union of every matching pattern's types, so overlapping globs
+    ("blog/*.html" and "**/*.html") all apply.
+    """
+
+    def __init__(self, patterns: Dict[str, List[str]]):
+        self.literal: Dict[str, Set[str]] = {}
+        self.wildcards: List[Tuple[Pattern, Set[str]]] = []
+
+        for pattern, types in patterns.items():
+            if any(ch in pattern for ch in "*?"):
+                self.wildcards.append((re.compile(glob_to_regex(pattern)), set(types)))
+            else:
+                self.literal.setdefault(pattern, set()).update(types)
+
+        self.wildcard_re = (re.compile("|".join(f"(?:{regex.pattern})" for regex, _ in self.wildcards))
+                            if self.wildcards else None)
+        self._cache: Dict[str, Set[str]] = {}
+
+    def required_types(self, page: str) -> Set[str]:
+        """Schema types page must have (empty if no pattern matches)."""
+        if page not in self._cache:
+            types = set(self.literal.get(page, ()))
+            if self.wildcard_re and self.wildcard_re.fullmatch(page):
+                for regex, wildcard_types in self.wildcards:
+                    if regex.fullmatch(page):
+                        types |= wildcard_types
+            self._cache[page] = types
+        return self._cache[page]
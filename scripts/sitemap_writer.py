@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Streaming sitemap writer with automatic sitemap-index sharding.
+
+URL entries are serialized and written one at a time, so memory stays
+constant however many pages there are. When a file approaches the sitemap
+protocol limits (50,000 URLs / 50MB uncompressed) the writer starts a new
+shard; if more than one shard was written, the shards become sitemap-N.xml
+and a sitemap_index.xml pointing at them is written. A single shard is
+simply renamed to the requested output file. Output can optionally be
+gzip-compressed (sitemap.xml.gz, sitemap-N.xml.gz).
+
+Outputs of an earlier run in another layout (a single sitemap.xml next to
+new shards, shards next to a new single file, plain next to gzipped) are
+listed in writer.stale and only deleted with clean=True, since robots.txt
+or a search console may still point at them.
+
+Usage:
+    from sitemap_writer import SitemapWriter
+
+    with SitemapWriter("sitemap.xml", base_url="https://web.tvmaster.vip") as writer:
+        writer.add("https://web.tvmaster.vip/", lastmod="2025-11-10",
+                   alternates=[("de", "https://web.tvmaster.vip/de/")])
+    print(writer.files)
+"""
+
+import gzip
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+XHTML_NS = "http://www.w3.org/1999/xhtml"
+
+# Protocol limits, per file
+MAX_URLS = 50000
+MAX_BYTES = 50 * 1024 * 1024
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+
+class SitemapWriter:
+    """Writes <url> entries to one or more sitemap files as they are added."""
+
+    def __init__(self, output, base_url: str, gzip_output: bool = False,
+                 pretty: bool = False, max_urls: int = MAX_URLS,
+                 max_bytes: int = MAX_BYTES, clean: bool = False):
+        if max_urls < 1 or max_bytes < 1:
+            raise ValueError("max_urls and max_bytes must be positive")
+        output = Path(output)
+        self.directory = output.parent
+        self.stem = output.name[:-len(".xml")] if output.name.endswith(".xml") else output.stem
+        self.base_url = base_url.rstrip("/")
+        self.gzip_output = gzip_output
+        self.pretty = pretty
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.clean = clean
+
+        self.urls_written = 0
+        self.files: List[Path] = []
+        self.index_file: Optional[Path] = None
+        self.stale: List[Path] = []
+
+        self._shards: List[Path] = []
+        self._file = None
+        self._shard_urls = 0
+        self._shard_bytes = 0
+
+        newline = "\n" if pretty else ""
+        self._header = (
+            XML_DECLARATION +
+            f'<urlset xmlns="{SITEMAP_NS}" xmlns:xhtml="{XHTML_NS}">{newline}'
+        ).encode("utf-8")
+        self._footer = "</urlset>\n".encode("utf-8")
+
+    def __enter__(self) -> "SitemapWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._file:
+            self._file.close()
+
+    @property
+    def entry_point(self) -> Optional[Path]:
+        """The file to submit: the index if sharded, else the single sitemap."""
+        return self.index_file or (self.files[0] if self.files else None)
+
+    def is_output_name(self, name: str) -> bool:
+        """True for any file name this writer produces, in any layout."""
+        return bool(re.match(rf"{re.escape(self.stem)}(?:-\d+|_index)?\.xml(?:\.gz)?$", name))
+
+    @property
+    def suffix(self) -> str:
+        return ".xml.gz" if self.gzip_output else ".xml"
+
+    def _open(self, path: Path):
+        if self.gzip_output:
+            # mtime=0 keeps output byte-identical across runs
+            return gzip.GzipFile(path, "wb", mtime=0)
+        return open(path, "wb")
+
+    def _start_shard(self):
+        path = self.directory / f".{self.stem}-{len(self._shards) + 1}{self.suffix}.tmp"
+        self._shards.append(path)
+        self._file = self._open(path)
+        self._file.write(self._header)
+        self._shard_urls = 0
+        self._shard_bytes = len(self._header) + len(self._footer)
+
+    def _end_shard(self):
+        self._file.write(self._footer)
+        self._file.close()
+        self._file = None
+
+    def format_url(self, loc: str, lastmod: Optional[str] = None,
+                   changefreq: Optional[str] = None, priority: Optional[str] = None,
+                   alternates: Iterable[Tuple[str, str]] = ()) -> str:
+        """Serialize one <url> entry."""
+        if self.pretty:
+            indent, child, newline = "  ", "    ", "\n"
+        else:
+            indent = child = newline = ""
+
+        parts = [f"{indent}<url>{newline}", f"{child}<loc>{escape(loc)}</loc>{newline}"]
+        if lastmod:
+            parts.append(f"{child}<lastmod>{escape(lastmod)}</lastmod>{newline}")
+        if changefreq:
+            parts.append(f"{child}<changefreq>{escape(changefreq)}</changefreq>{newline}")
+        if priority:
+            parts.append(f"{child}<priority>{escape(priority)}</priority>{newline}")
+        for hreflang, href in alternates:
+            parts.append(
+                f'{child}<xhtml:link rel="alternate" hreflang={quoteattr(hreflang)} '
+                f'href={quoteattr(href)}/>{newline}'
+            )
+        parts.append(f"{indent}</url>{newline}")
+        return "".join(parts)
+
+    def add(self, loc: str, lastmod: Optional[str] = None,
+            changefreq: Optional[str] = None, priority: Optional[str] = None,
+            alternates: Iterable[Tuple[str, str]] = ()):
+        """Write one URL entry, starting a new shard if this one is full."""
+        entry = self.format_url(loc, lastmod, changefreq, priority, alternates).encode("utf-8")
+
+        if self._file and (self._shard_urls >= self.max_urls or
+                           self._shard_bytes + len(entry) > self.max_bytes):
+            self._end_shard()
+        if not self._file:
+            self._start_shard()
+
+        self._file.write(entry)
+        self._shard_urls += 1
+        self._shard_bytes += len(entry)
+        self.urls_written += 1
+
+    def close(self) -> List[Path]:
+        """Finish the last shard and move the files into place."""
+        if not self._shards:
+            self._start_shard()  # an empty but valid urlset
+        if self._file:
+            self._end_shard()
+
+        if len(self._shards) == 1:
+            final = [self.directory / f"{self.stem}{self.suffix}"]
+        else:
+            final = [self.directory / f"{self.stem}-{n}{self.suffix}"
+                     for n in range(1, len(self._shards) + 1)]
+
+        for tmp_path, path in zip(self._shards, final):
+            os.replace(tmp_path, path)
+        self.files = final
+
+        if len(final) > 1:
+            self.index_file = self._write_index(final)
+
+        self.stale = self._find_stale(final)
+        if self.clean:
+            for path in self.stale:
+                path.unlink()
+        return self.files
+
+    def _write_index(self, shards: List[Path]) -> Path:
+        """Write <stem>_index.xml listing every shard."""
+        path = self.directory / f"{self.stem}_index.xml"
+        today = datetime.now().strftime("%Y-%m-%d")
+        newline = "\n" if self.pretty else ""
+        indent, child = ("  ", "    ") if self.pretty else ("", "")
+
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(XML_DECLARATION)
+            f.write(f'<sitemapindex xmlns="{SITEMAP_NS}">{newline}')
+            for shard in shards:
+                f.write(f"{indent}<sitemap>{newline}")
+                f.write(f"{child}<loc>{escape(f'{self.base_url}/{shard.name}')}</loc>{newline}")
+                f.write(f"{child}<lastmod>{today}</lastmod>{newline}")
+                f.write(f"{indent}</sitemap>{newline}")
+            f.write("</sitemapindex>\n")
+        os.replace(tmp_path, path)
+        return path
+
+    def _find_stale(self, current: List[Path]) -> List[Path]:
+        """
+        Outputs of an earlier run in another layout: shards and index left by
+        a larger run, or the single sitemap (plain or gzipped) left by a run
+        that wasn't sharded or compressed the same way.
+        """
+        keep = set(current)
+        if self.index_file:
+            keep.add(self.index_file)
+        return sorted(path for path in self.directory.iterdir()
+                      if self.is_output_name(path.name) and path not in keep)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Update Structured Data Modification Dates
+Sets JSON-LD "dateModified" and <meta property="article:modified_time"> to
+the date of each page's last content commit, from one batched git log pass
+(see git_lastmod.py). Values keep their existing format: date-only fields
+stay YYYY-MM-DD, timestamps stay full ISO 8601.
+
+Commits that only touch these date lines are ignored when resolving dates,
+so committing the output of this script doesn't change them again.
+
+Usage:
+    python scripts/update-date-modified.py
+    python scripts/update-date-modified.py --dry-run
+    python scripts/update-date-modified.py blog/complete-iptv-guide-2025.html
+"""
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from git_lastmod import GitLastModified
+from page_index import is_published_dir
+
+ROOT_DIR = Path(__file__).parent.parent
+
+DATE_MODIFIED_RE = re.compile(r'("dateModified"\s*:\s*")([^"]*)(")')
+MODIFIED_TIME_RE = re.compile(
+    r'(<meta\s+property="article:modified_time"\s+content=")([^"]*)(")'
+)
+
+
+def find_pages_with_dates() -> List[str]:
+    """All published HTML pages that carry a modification date."""
+    pages = []
+    for root, dirs, files in os.walk(ROOT_DIR):
+        dirs[:] = sorted(d for d in dirs if is_published_dir(d))
+        for file in sorted(files):
+            if not file.endswith(".html"):
+                continue
+            path = Path(root) / file
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+            if "dateModified" in content or "article:modified_time" in content:
+                pages.append(path.relative_to(ROOT_DIR).as_posix())
+    return pages
+
+
+def update_dates(content: str, date: str, timestamp: str) -> str:
+    """Replace modification dates, keeping each value's format."""
+    def replace(match):
+        old = match.group(2)
+        if old.startswith("{{"):
+            return match.group(0)  # template placeholder
+        new = date if len(old) == len("YYYY-MM-DD") else timestamp
+        return f"{match.group(1)}{new}{match.group(3)}"
+
+    content = DATE_MODIFIED_RE.sub(replace, content)
+    return MODIFIED_TIME_RE.sub(replace, content)
+
+
+def process_file(filepath: str, lastmod: GitLastModified, dry_run: bool = False) -> Optional[str]:
+    """Update one page. Returns the new date if the page changed."""
+    path = ROOT_DIR / filepath
+    if not path.exists():
+        print(f"   ⚠️  File not found: {filepath}")
+        return None
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        content = f.read()
+
+    timestamp = lastmod.isoformat(filepath)
+    updated = update_dates(content, lastmod.date(filepath), timestamp)
+
+    if updated == content:
+        return None
+
+    if not dry_run:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(updated)
+    return timestamp
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description="Set structured-data dateModified from git history"
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="HTML files relative to the project root (default: all pages with dates)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report changes without writing files"
+    )
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"📅 Structured Data dateModified - {'DRY RUN' if args.dry_run else 'LIVE'}")
+    print("=" * 70)
+
+    lastmod = GitLastModified(ROOT_DIR)
+    files = args.files or find_pages_with_dates()
+
+    updated = 0
+    for filepath in files:
+        new_date = process_file(filepath, lastmod, args.dry_run)
+        if new_date:
+            updated += 1
+            verb = "Would update" if args.dry_run else "Updated"
+            print(f"   ✅ {verb}: {filepath} → {new_date}")
+
+    print("\n" + "=" * 70)
+    print(f"✨ {updated} of {len(files)} pages {'would change' if args.dry_run else 'updated'}")
+    print("=" * 70)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
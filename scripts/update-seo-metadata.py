@@ -4,11 +4,24 @@ SEO Metadata Update Script
 Automatically updates meta tags, hreflang tags, canonical URLs, and structured data
 across all language versions of TVMaster VIP site.
 
+Placeholders ({{PAGE_TITLE}}, ...) are substituted in a single regex scan per
+page with a dict lookup. Placeholders without a value are reported as errors
+and the page is left untouched.
+
+--render-includes renders {% include %} directives and include regions in
+every page of every language from the _includes partials (see
+include_engine.py), with the same placeholder values. Each rendered page's
+partials and the languages.json keys it consumed are recorded in
+.build-cache.json, so the next run only re-renders pages whose inputs
+changed (--force renders everything).
+
 Usage:
     python scripts/update-seo-metadata.py
     python scripts/update-seo-metadata.py --page index.html
     python scripts/update-seo-metadata.py --lang de
     python scripts/update-seo-metadata.py --dry-run
+    python scripts/update-seo-metadata.py --jobs 4
+    python scripts/update-seo-metadata.py --render-includes
 """
 
 import json
@@ -16,14 +29,28 @@ import os
 import sys
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import argparse
 
+from build_manifest import BuildManifest
+from dependency_tracker import CONFIG_PREFIX, VALUE_PREFIX, TrackedConfig, config_digest, value_digest
+from git_lastmod import GitLastModified
+from include_engine import PLACEHOLDER_RE, IncludeEngine, RenderTrace
+from page_index import PageIndex
+from parallel_jobs import add_jobs_argument, map_files
+
 # Configuration
 ROOT_DIR = Path(__file__).parent.parent
 CONFIG_FILE = ROOT_DIR / "_config" / "languages.json"
 INCLUDES_DIR = ROOT_DIR / "_includes"
 
+# Bump when include rendering changes, so every page is re-rendered once
+INCLUDES_VERSION = "1"
+
+# Placeholders that don't come from languages.json (page index, git history);
+# pages that use them depend on their value
+DERIVED_PLACEHOLDERS = ("HREFLANG_LINKS", "ARTICLE_DATE_MODIFIED")
+
 # Page type mapping (filename -> config key)
 PAGE_TYPE_MAP = {
     "index.html": "home",
@@ -54,90 +81,153 @@ def get_language_path(lang_code: str) -> Path:
     return ROOT_DIR / lang_code
 
 
-def build_placeholders(config: Dict, lang_code: str, page_type: str, page_filename: str) -> Dict[str, str]:
-    """Build dictionary of placeholder replacements for a specific page and language."""
+def get_page_url(config: Dict, lang_code: str, page_filename: str) -> str:
+    """Build the full URL of a page in a language."""
+    lang_path = config["languages"][lang_code]["path"]
+    if lang_path:
+        return f"{config['base_url']}/{lang_path}/{page_filename}"
+    return f"{config['base_url']}/{page_filename}"
+
+
+def build_hreflang_links(config: Dict, page_filename: str, page_index: PageIndex) -> str:
+    """Alternate links for the languages that actually have the page."""
+    links = []
+    for lang_code in page_index.languages_for(page_filename):
+        hreflang = config["languages"][lang_code].get("hreflang", lang_code)
+        href = get_page_url(config, lang_code, page_filename)
+        links.append(f'<link rel="alternate" hreflang="{hreflang}" href="{href}"/>')
+
+    default_lang = config.get("default_language", "en")
+    if page_index.has(default_lang, page_filename):
+        href = get_page_url(config, default_lang, page_filename)
+        links.append(f'<link rel="alternate" hreflang="x-default" href="{href}"/>')
+
+    return "\n".join(links)
+
+
+def site_root_prefix(lang_code: str, page_filename: str, config: Dict) -> str:
+    """Relative path from a page to the site root ("./", "../", "../../", ...)."""
+    depth = page_filename.count("/") + (1 if config["languages"][lang_code]["path"] else 0)
+    return "../" * depth or "./"
+
+
+def build_page_index(config: Dict) -> PageIndex:
+    """Index which pages exist in which configured languages (one walk)."""
+    return PageIndex.build(ROOT_DIR, config["languages"], config.get("default_language", "en"))
+
+
+def build_placeholders(config: Dict, lang_code: str, page_type: str, page_filename: str,
+                       page_index: Optional[PageIndex] = None,
+                       lastmod: Optional[GitLastModified] = None) -> Dict[str, str]:
+    """Build {placeholder name: value} for a specific page and language."""
     lang_config = config["languages"][lang_code]
     seo_config = lang_config["seo"].get(page_type, lang_config["seo"]["home"])
 
     # Determine URL paths
     lang_path = lang_config["path"]
+    page_path = page_filename
     if lang_path:
-        page_path = page_filename
         canonical_url = f"{config['base_url']}/{lang_path}/{page_filename}"
-        css_path_prefix = "../"
     else:
-        page_path = page_filename
         canonical_url = f"{config['base_url']}/{page_filename}"
-        css_path_prefix = "./"
+    css_path_prefix = site_root_prefix(lang_code, page_filename, config)
 
     # Build placeholders dictionary
     placeholders = {
         # Meta tags
-        "{{PAGE_TITLE}}": seo_config["title"],
-        "{{PAGE_DESCRIPTION}}": seo_config["description"],
-        "{{PAGE_KEYWORDS}}": seo_config["keywords"],
-        "{{CANONICAL_URL}}": canonical_url,
+        "PAGE_TITLE": seo_config["title"],
+        "PAGE_DESCRIPTION": seo_config["description"],
+        "PAGE_KEYWORDS": seo_config["keywords"],
+        "CANONICAL_URL": canonical_url,
 
         # Open Graph
-        "{{OG_TITLE}}": seo_config.get("og_title", seo_config["title"]),
-        "{{OG_DESCRIPTION}}": seo_config.get("og_description", seo_config["description"]),
-        "{{OG_LOCALE}}": lang_config["locale"],
+        "OG_TITLE": seo_config.get("og_title", seo_config["title"]),
+        "OG_DESCRIPTION": seo_config.get("og_description", seo_config["description"]),
+        "OG_LOCALE": lang_config["locale"],
 
         # Twitter
-        "{{TWITTER_TITLE}}": seo_config.get("og_title", seo_config["title"]),
-        "{{TWITTER_DESCRIPTION}}": seo_config.get("og_description", seo_config["description"]),
+        "TWITTER_TITLE": seo_config.get("og_title", seo_config["title"]),
+        "TWITTER_DESCRIPTION": seo_config.get("og_description", seo_config["description"]),
 
         # Language & paths
-        "{{LANGUAGE_NAME}}": lang_config["name"],
-        "{{LANG_CODE}}": lang_code,
-        "{{PAGE_PATH}}": page_path,
-        "{{CSS_PATH_PREFIX}}": css_path_prefix,
+        "LANGUAGE_NAME": lang_config["name"],
+        "LANG_CODE": lang_code,
+        "PAGE_PATH": page_path,
+        "CSS_PATH_PREFIX": css_path_prefix,
 
         # Site info
-        "{{SITE_URL}}": lang_config["site"]["url"],
-        "{{SITE_DESCRIPTION}}": lang_config["site"]["description"],
+        "SITE_URL": lang_config["site"]["url"],
+        "SITE_DESCRIPTION": lang_config["site"]["description"],
     }
 
+    # Hreflang alternates, limited to translations that exist
+    if page_index is not None:
+        placeholders["HREFLANG_LINKS"] = build_hreflang_links(config, page_filename, page_index)
+
+    # Structured data dateModified: last content commit of the page
+    if lastmod is not None:
+        date_modified = lastmod.isoformat(get_language_path(lang_code) / page_filename)
+        if date_modified:
+            placeholders["ARTICLE_DATE_MODIFIED"] = date_modified
+
     return placeholders
 
 
-def replace_placeholders(content: str, placeholders: Dict[str, str]) -> str:
-    """Replace all placeholders in content with their values."""
-    for placeholder, value in placeholders.items():
-        content = content.replace(placeholder, value)
-    return content
+def replace_placeholders(content: str, placeholders: Dict[str, str]) -> Tuple[str, List[str]]:
+    """
+    Replace every placeholder in content in one pass.
+    Returns (content, names of placeholders without a value, in order of appearance).
+    """
+    unresolved = []
+
+    def substitute(match):
+        name = match.group(1)
+        if name in placeholders:
+            return placeholders[name]
+        if name not in unresolved:
+            unresolved.append(name)
+        return match.group(0)
+
+    return PLACEHOLDER_RE.sub(substitute, content), unresolved
 
 
-def update_html_file(file_path: Path, placeholders: Dict[str, str], dry_run: bool = False) -> bool:
-    """Update a single HTML file with SEO metadata."""
+def update_html_file(file_path: Path, placeholders: Dict[str, str],
+                     dry_run: bool = False) -> Tuple[bool, str, bool]:
+    """Update a single HTML file with SEO metadata. Returns (updated, message, error)."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
         # Replace placeholders
-        updated_content = replace_placeholders(content, placeholders)
+        updated_content, unresolved = replace_placeholders(content, placeholders)
+
+        if unresolved:
+            names = ", ".join(f"{{{{{name}}}}}" for name in unresolved)
+            return False, f"  ❌ Unresolved placeholders in {file_path.relative_to(ROOT_DIR)}: {names}", True
 
         # Check if anything changed
         if content == updated_content:
-            print(f"  ⏭️  No changes needed: {file_path.relative_to(ROOT_DIR)}")
-            return False
+            return False, f"  ⏭️  No changes needed: {file_path.relative_to(ROOT_DIR)}", False
 
         if not dry_run:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(updated_content)
-            print(f"  ✅ Updated: {file_path.relative_to(ROOT_DIR)}")
-        else:
-            print(f"  🔍 Would update: {file_path.relative_to(ROOT_DIR)}")
+            return True, f"  ✅ Updated: {file_path.relative_to(ROOT_DIR)}", False
 
-        return True
+        return True, f"  🔍 Would update: {file_path.relative_to(ROOT_DIR)}", False
     except Exception as e:
-        print(f"  ❌ Error updating {file_path.relative_to(ROOT_DIR)}: {e}")
-        return False
+        return False, f"  ❌ Error updating {file_path.relative_to(ROOT_DIR)}: {e}", True
+
+
+def update_page_task(task: Tuple[Path, Dict[str, str], bool]) -> Tuple[bool, str, bool]:
+    """Worker entry point for update_html_file (one picklable argument)."""
+    return update_html_file(*task)
 
 
 def update_all_pages(config: Dict, target_lang: Optional[str] = None,
-                     target_page: Optional[str] = None, dry_run: bool = False):
-    """Update all pages across all languages."""
+                     target_page: Optional[str] = None, dry_run: bool = False,
+                     jobs: int = 1) -> int:
+    """Update all pages across all languages. Returns the number of pages with errors."""
     languages = config["languages"]
     supported_pages = config["supported_pages"]
 
@@ -145,7 +235,7 @@ def update_all_pages(config: Dict, target_lang: Optional[str] = None,
     if target_lang:
         if target_lang not in languages:
             print(f"❌ Language '{target_lang}' not found in configuration")
-            return
+            return 1
         languages = {target_lang: languages[target_lang]}
 
     # Filter pages if target specified
@@ -153,66 +243,188 @@ def update_all_pages(config: Dict, target_lang: Optional[str] = None,
         page_filename = target_page if target_page.endswith('.html') else f"{target_page}.html"
         supported_pages = [page_filename.replace('.html', '')]
 
-    total_updated = 0
-    total_processed = 0
-
     print(f"\n{'='*70}")
     print(f"SEO Metadata Update - {'DRY RUN' if dry_run else 'LIVE'}")
     print(f"{'='*70}\n")
 
+    # Plan the report first: each line is either a message or a page task,
+    # so output keeps the same order however many jobs run the tasks
+    report = []
+    tasks = []
+    page_index = build_page_index(config)
+    lastmod = GitLastModified(ROOT_DIR)
+
     for lang_code, lang_config in languages.items():
-        print(f"📝 Processing language: {lang_config['name']} ({lang_code})")
+        report.append(f"📝 Processing language: {lang_config['name']} ({lang_code})")
         lang_dir = get_language_path(lang_code)
 
         if not lang_dir.exists():
-            print(f"  ⚠️  Directory not found: {lang_dir}")
+            report.append(f"  ⚠️  Directory not found: {lang_dir}")
             continue
 
         for page_name in supported_pages:
             page_filename = f"{page_name}.html"
             page_path = lang_dir / page_filename
 
-            if not page_path.exists():
-                print(f"  ⏭️  Page not found: {page_filename}")
+            if not page_index.has(lang_code, page_filename):
+                report.append(f"  ⏭️  Page not found: {page_filename}")
                 continue
 
             page_type = get_page_type(page_filename)
-            placeholders = build_placeholders(config, lang_code, page_type, page_filename)
+            placeholders = build_placeholders(config, lang_code, page_type, page_filename,
+                                              page_index, lastmod)
 
-            total_processed += 1
-            if update_html_file(page_path, placeholders, dry_run):
-                total_updated += 1
+            report.append(len(tasks))
+            tasks.append((page_path, placeholders, dry_run))
+
+        report.append("")  # Blank line between languages
+
+    # One task per (language, page) cell of the matrix, spread over the workers
+    results = map_files(update_page_task, tasks, jobs)
+    total_updated = 0
+    total_errors = 0
 
-        print()  # Blank line between languages
+    for line in report:
+        if isinstance(line, int):
+            updated, line, error = results[line]
+            total_updated += updated
+            total_errors += error
+        print(line)
 
     print(f"{'='*70}")
-    print(f"✨ Summary: {total_updated} files updated out of {total_processed} processed")
+    print(f"✨ Summary: {total_updated} files updated out of {len(tasks)} processed")
+    if total_errors:
+        print(f"❌ {total_errors} file(s) with errors (left unchanged)")
     if dry_run:
         print(f"   Run without --dry-run to apply changes")
     print(f"{'='*70}\n")
+    return total_errors
 
 
-def inject_includes_to_pages(config: Dict, dry_run: bool = False):
+_include_engine: Optional[IncludeEngine] = None
+
+
+def render_includes_file(task: Tuple[Path, str, str, Dict[str, str], bool]) -> Tuple[bool, str, List[str], Dict]:
+    """
+    Worker entry point: render the include directives of one page.
+    Returns (updated, message, errors, consumed); message is empty for pages
+    without includes, consumed lists the partials and placeholders used.
     """
-    Add include comments to pages for future template processing.
-    This prepares pages to use the centralized includes.
+    global _include_engine
+    file_path, lang_code, page, placeholders, dry_run = task
+    relative_path = file_path.relative_to(ROOT_DIR)
+    consumed = {"partials": [], "placeholders": []}
+
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        content = f.read()
+    if "{%" not in content:
+        return False, "", [], consumed
+
+    # Partials are parsed once per worker process
+    if _include_engine is None:
+        _include_engine = IncludeEngine(INCLUDES_DIR)
+
+    trace = RenderTrace()
+    lang_prefix = "../" * page.count("/") or "./"
+    rendered, errors = _include_engine.render_page(
+        content, placeholders, lang_code,
+        site_prefix=placeholders["CSS_PATH_PREFIX"], lang_prefix=lang_prefix, trace=trace
+    )
+    consumed = {"partials": sorted(str(path) for path in trace.partials),
+                "placeholders": sorted(trace.placeholders)}
+
+    if errors:
+        details = "".join(f"\n      {error}" for error in errors)
+        return False, f"  ❌ {relative_path}:{details}", errors, consumed
+    if rendered == content:
+        return False, f"  ⏭️  Up to date: {relative_path}", [], consumed
+
+    if not dry_run:
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(rendered)
+        return True, f"  ✅ Rendered: {relative_path}", [], consumed
+    return True, f"  🔍 Would render: {relative_path}", [], consumed
+
+
+def page_dependencies(consumed: Dict, config_reads: Dict[str, Optional[str]],
+                      placeholders: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """Value dependencies of a rendered page: config keys and derived placeholder values."""
+    values = {}
+    used = set(consumed["placeholders"])
+    if used - set(DERIVED_PLACEHOLDERS):
+        values.update((CONFIG_PREFIX + path, digest) for path, digest in config_reads.items())
+    for name in DERIVED_PLACEHOLDERS:
+        if name in used:
+            values[VALUE_PREFIX + name] = value_digest(placeholders.get(name))
+    return values
+
+
+def render_includes(config: Dict, target_lang: Optional[str] = None,
+                    dry_run: bool = False, jobs: int = 1, force: bool = False) -> int:
+    """
+    Render {% include %} directives in every page of every language from the
+    _includes partials, skipping pages whose recorded dependencies (page
+    content, partials, config keys, derived values) are unchanged.
+    Returns the number of pages with errors.
     """
     print(f"\n{'='*70}")
-    print(f"Injecting Include References - {'DRY RUN' if dry_run else 'LIVE'}")
+    print(f"Rendering Includes - {'DRY RUN' if dry_run else 'LIVE'}")
     print(f"{'='*70}\n")
 
-    # This is a preparation step - we'll add comments showing where includes should go
-    # In a real template system, these would be replaced during build
+    languages = config["languages"]
+    if target_lang:
+        if target_lang not in languages:
+            print(f"❌ Language '{target_lang}' not found in configuration")
+            return 1
+        languages = {target_lang: languages[target_lang]}
 
-    include_comment = """
-<!-- SEO Meta Tags - Centralized Configuration -->
-<!-- To use: Replace <head> content with: {%% include '_includes/meta-tags.html' %%} -->
-<!-- Configuration file: _config/languages.json -->
-""".strip()
+    page_index = build_page_index(config)
+    lastmod = GitLastModified(ROOT_DIR)
+    manifest = BuildManifest.load("render-includes", INCLUDES_VERSION, force=force, enabled=not dry_run)
+
+    tasks = []
+    pending = []
+    total_pages = 0
+    for lang_code in languages:
+        for page in page_index.pages_for(lang_code):
+            total_pages += 1
+            tracked = TrackedConfig(config)
+            placeholders = build_placeholders(tracked, lang_code, get_page_type(page), page,
+                                              page_index, lastmod)
+            file_path = page_index.path(lang_code, page)
+
+            def current_value(name, placeholders=placeholders):
+                if name.startswith(CONFIG_PREFIX):
+                    return config_digest(config, name[len(CONFIG_PREFIX):])
+                return value_digest(placeholders.get(name[len(VALUE_PREFIX):]))
+
+            if manifest.is_fresh(file_path, current_value):
+                continue
+            tasks.append((file_path, lang_code, page, placeholders, dry_run))
+            pending.append((file_path, tracked.reads, placeholders))
+
+    with_includes = total_updated = total_errors = 0
+    results = map_files(render_includes_file, tasks, jobs)
+    for (updated, message, errors, consumed), (file_path, reads, placeholders) in zip(results, pending):
+        if message:
+            with_includes += 1
+            total_updated += updated
+            total_errors += bool(errors)
+            print(message)
+        if not errors:
+            manifest.record(file_path, deps=consumed["partials"],
+                            values=page_dependencies(consumed, reads, placeholders))
+    manifest.save()
 
-    print("ℹ️  Include injection is a manual step for static HTML")
-    print("   Use the update-seo-metadata.py script to apply centralized metadata")
-    print("   Or migrate to a static site generator (Jekyll, Hugo, 11ty) for automatic includes\n")
+    print(f"\n{'='*70}")
+    print(f"✨ Summary: {len(tasks)} of {total_pages} pages checked, {with_includes} use includes, "
+          f"{total_updated} {'would change' if dry_run else 'updated'}")
+    if manifest.skipped:
+        print(f"   Unchanged (skipped): {manifest.skipped}")
+    if total_errors:
+        print(f"❌ {total_errors} page(s) with errors (left unchanged)")
+    print(f"{'='*70}\n")
+    return total_errors
 
 
 def main():
@@ -236,10 +448,16 @@ def main():
         action="store_true"
     )
     parser.add_argument(
-        "--inject-includes",
-        help="Add include comments to pages",
+        "--force",
+        help="With --render-includes: re-render every page, ignoring recorded dependencies",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--render-includes",
+        help="Render {%% include %%} directives from _includes into every page",
         action="store_true"
     )
+    add_jobs_argument(parser)
 
     args = parser.parse_args()
 
@@ -252,10 +470,11 @@ def main():
     config = load_config()
 
     # Execute requested action
-    if args.inject_includes:
-        inject_includes_to_pages(config, args.dry_run)
-    else:
-        update_all_pages(config, args.lang, args.page, args.dry_run)
+    if args.render_includes:
+        if render_includes(config, args.lang, args.dry_run, args.jobs, args.force):
+            sys.exit(1)
+    elif update_all_pages(config, args.lang, args.page, args.dry_run, args.jobs):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -3,26 +3,45 @@
 Structured Data Validator for TVMaster VIP
 Extracts and validates JSON-LD schema markup from HTML pages.
 
+Schema rules are declarative (SCHEMA_RULES) and compiled into validator
+closures at startup; @graph documents and list-valued @type are supported.
+Every page is also checked for the schema types REQUIRED_SCHEMAS expects of
+it, summarized as a page x language matrix.
+Pages are validated by a pool of worker processes. Each page yields a
+structured result (schemas found, issues per schema, JSON errors), which is
+printed in page order and can be written as a text, JSON or JUnit-XML report.
+validate_schema_structure is the rule set applied to every schema.
+
 Usage:
     python scripts/validate-structured-data.py
     python scripts/validate-structured-data.py --page blog/complete-iptv-guide-2025.html
     python scripts/validate-structured-data.py --lang de
     python scripts/validate-structured-data.py --report validation-report.txt
+    python scripts/validate-structured-data.py --json validation.json --junit validation.xml
+    python scripts/validate-structured-data.py --jobs 1
 """
 
 import os
 import sys
 import json
 import re
+import time
+from datetime import datetime
 from pathlib import Path
 import argparse
-from typing import List, Dict, Tuple
+import xml.etree.ElementTree as ET
+from typing import Callable, List, Dict, Optional, Tuple
+
+from page_index import PageIndex
+from parallel_jobs import add_jobs_argument, map_files
+from schema_rules import PageTypeIndex, compile_rules, describe_type, document_types, node_types
 
 # Configuration
 ROOT_DIR = Path(__file__).parent.parent
 LANGUAGES = ["en", "de", "fr", "it", "nl", "no", "sv", "th"]
 
 # Required schema types for different page types
+# (paths relative to the language root; * stays within a directory, ** spans them)
 REQUIRED_SCHEMAS = {
     "index.html": ["WebSite", "Organization"],
     "blog.html": ["Blog"],
@@ -30,17 +49,82 @@ REQUIRED_SCHEMAS = {
     "iptv-products.html": ["Product"],
     "blog/*.html": ["Article"],
 }
-
-# Schema.org required properties
-SCHEMA_REQUIREMENTS = {
-    "Article": ["headline", "author", "datePublished", "publisher"],
-    "Organization": ["name", "url"],
-    "WebSite": ["name", "url"],
-    "Product": ["name", "description"],
-    "FAQPage": ["mainEntity"],
-    "BreadcrumbList": ["itemListElement"],
+REQUIRED_SCHEMA_INDEX = PageTypeIndex(REQUIRED_SCHEMAS)
+
+# Schema.org rules per type, compiled into validators once at startup.
+# Adding a type is a data change; see schema_rules.py for the rule keys.
+SCHEMA_RULES = {
+    "Article": {
+        "required": ["headline", "author", "datePublished", "publisher"],
+        "properties": {
+            "author": {
+                "object": "Article author should be a Person or Organization object",
+                "typed": True,
+            },
+            "publisher": {
+                "object": "Publisher should be an Organization object",
+                "properties": {
+                    "logo": {"object": "Publisher logo should be an ImageObject", "typed": True},
+                },
+            },
+        },
+    },
+    "Organization": {"required": ["name", "url"]},
+    "WebSite": {"required": ["name", "url"]},
+    "Product": {
+        "required": ["name", "description"],
+        "properties": {
+            "offers": {
+                "object": "Product offers should be an Offer or AggregateOffer object",
+                "typed": True,
+                "many": True,
+                "by_type": {
+                    "Offer": {"required": ["price", "priceCurrency"]},
+                    "AggregateOffer": {"required": ["lowPrice", "priceCurrency"]},
+                },
+            },
+        },
+    },
+    "FAQPage": {
+        "required": ["mainEntity"],
+        "properties": {
+            "mainEntity": {
+                "array": "mainEntity should be an array",
+                "items": {
+                    "type": "Question",
+                    "wrong_type": "FAQ item {i} should be type 'Question'",
+                    "required": ["acceptedAnswer"],
+                    "missing": "FAQ question {i} missing '{prop}'",
+                },
+            },
+        },
+    },
+    "BreadcrumbList": {
+        "required": ["itemListElement"],
+        "properties": {
+            "itemListElement": {
+                "array": "itemListElement should be an array",
+                "items": {
+                    "required": ["position", "name"],
+                    "missing": "Breadcrumb item {i} missing '{prop}'",
+                },
+            },
+        },
+    },
+    "Event": {
+        "required": ["name", "startDate", "location"],
+        "properties": {
+            "location": {"object": "Event location should be a Place or VirtualLocation object", "typed": True},
+            "offers": {"object": "Event offers should be an Offer object", "typed": True, "many": True},
+        },
+    },
+    "SportsEvent": {"extends": "Event"},
+    "VideoObject": {
+        "required": ["name", "description", "thumbnailUrl", "uploadDate"],
+    },
 }
 
+SCHEMA_VALIDATORS = compile_rules(SCHEMA_RULES)
 
 def get_language_path(lang_code):
     """Get directory path for language."""
@@ -49,33 +133,52 @@ def get_language_path(lang_code):
     return ROOT_DIR / lang_code
 
 
-def extract_json_ld(html_content):
-    """Extract all JSON-LD script blocks from HTML."""
-    pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-    matches = re.findall(pattern, html_content, re.DOTALL | re.IGNORECASE)
+JSON_LD_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE
+)
 
+
+def extract_json_ld(html_content, errors=None):
+    """
+    Extract all JSON-LD script blocks from HTML.
+    JSON errors are appended to errors if given, otherwise printed.
+    """
     schemas = []
-    for match in matches:
+    for match in JSON_LD_RE.findall(html_content):
         try:
             schema = json.loads(match.strip())
             schemas.append(schema)
         except json.JSONDecodeError as e:
-            print(f"   ⚠️  JSON parsing error: {e}")
+            if errors is None:
+                print(f"   ⚠️  JSON parsing error: {e}")
+            else:
+                errors.append(f"JSON parsing error: {e}")
             continue
 
     return schemas
 
 
 def validate_schema_structure(schema, schema_type=None):
-    """Validate schema structure and required properties."""
+    """
+    Validate schema structure and required properties.
+    Handles @graph documents and list-valued @type; each node is checked by
+    the compiled validators for all of its types.
+    """
     issues = []
 
-    # Detect schema type
-    if "@type" not in schema:
-        issues.append("Missing '@type' property")
-        return issues
-
-    detected_type = schema["@type"]
+    if "@graph" in schema:
+        nodes = schema["@graph"]
+        if not isinstance(nodes, list):
+            return ["@graph should be an array"]
+        detected_type = "@graph"
+    else:
+        # Detect schema type
+        if "@type" not in schema:
+            issues.append("Missing '@type' property")
+            return issues
+        nodes = [schema]
+        detected_type = describe_type(schema)
 
     # Check context
     if "@context" not in schema:
@@ -83,153 +186,169 @@ def validate_schema_structure(schema, schema_type=None):
     elif schema["@context"] != "https://schema.org":
         issues.append(f"Invalid @context: {schema['@context']}")
 
-    # Validate required properties for this type
-    if detected_type in SCHEMA_REQUIREMENTS:
-        required_props = SCHEMA_REQUIREMENTS[detected_type]
-        for prop in required_props:
-            if prop not in schema:
-                issues.append(f"Missing required property '{prop}' for {detected_type}")
-
-    # Type-specific validations
-    if detected_type == "Article":
-        # Validate author
-        if "author" in schema:
-            if not isinstance(schema["author"], dict) or "@type" not in schema["author"]:
-                issues.append("Article author should be a Person or Organization object")
-
-        # Validate publisher
-        if "publisher" in schema:
-            if not isinstance(schema["publisher"], dict):
-                issues.append("Publisher should be an Organization object")
-            elif "logo" in schema["publisher"]:
-                logo = schema["publisher"]["logo"]
-                if not isinstance(logo, dict) or "@type" not in logo:
-                    issues.append("Publisher logo should be an ImageObject")
-
-    elif detected_type == "BreadcrumbList":
-        if "itemListElement" in schema:
-            items = schema["itemListElement"]
-            if not isinstance(items, list):
-                issues.append("itemListElement should be an array")
-            else:
-                for i, item in enumerate(items):
-                    if "position" not in item:
-                        issues.append(f"Breadcrumb item {i} missing 'position'")
-                    if "name" not in item:
-                        issues.append(f"Breadcrumb item {i} missing 'name'")
-
-    elif detected_type == "FAQPage":
-        if "mainEntity" in schema:
-            entities = schema["mainEntity"]
-            if not isinstance(entities, list):
-                issues.append("mainEntity should be an array")
-            else:
-                for i, entity in enumerate(entities):
-                    if entity.get("@type") != "Question":
-                        issues.append(f"FAQ item {i} should be type 'Question'")
-                    if "acceptedAnswer" not in entity:
-                        issues.append(f"FAQ question {i} missing 'acceptedAnswer'")
+    # Validate each node against the rules for each of its types
+    for i, node in enumerate(nodes):
+        if not isinstance(node, dict) or "@type" not in node:
+            issues.append(f"@graph node {i} missing '@type' property")
+            continue
+        for node_type in node_types(node):
+            validator = SCHEMA_VALIDATORS.get(node_type)
+            if validator:
+                validator(node, issues)
 
     return issues
 
 
-def validate_page(file_path, relative_path):
-    """Validate structured data for a single page."""
-    print(f"\n📄 Validating: {relative_path}")
+def validate_page(file_path, relative_path, lang="en",
+                  rules: Callable = validate_schema_structure) -> Dict:
+    """
+    Validate structured data for a single page.
+    Returns a result dict instead of printing, so pages can run in workers.
+    """
+    started = time.perf_counter()
+    result = {
+        "lang": lang,
+        "page": relative_path,
+        "file": Path(file_path).relative_to(ROOT_DIR).as_posix(),
+        "schemas": [],
+        "errors": [],
+        "issue_count": 0,
+        "required_types": sorted(REQUIRED_SCHEMA_INDEX.required_types(relative_path)),
+        "missing_types": [],
+    }
 
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             html_content = f.read()
     except Exception as e:
-        print(f"   ❌ Error reading file: {e}")
-        return []
+        result["errors"].append(f"Error reading file: {e}")
+        result["duration"] = time.perf_counter() - started
+        return result
 
-    # Extract schemas
-    schemas = extract_json_ld(html_content)
+    # Extract and validate each schema
+    found_types = set()
+    for schema in extract_json_ld(html_content, result["errors"]):
+        schema_type = ("@graph" if "@graph" in schema else describe_type(schema)) \
+            if isinstance(schema, dict) else "Unknown"
+        issues = rules(schema) if isinstance(schema, dict) else ["Top-level JSON-LD is not an object"]
+        result["schemas"].append({"type": schema_type, "issues": issues})
+        result["issue_count"] += len(issues)
+        found_types |= document_types(schema)
 
-    if not schemas:
-        print(f"   ⚠️  No structured data found")
-        return []
+    # Rich-result markup this page type is expected to carry
+    result["missing_types"] = [t for t in result["required_types"] if t not in found_types]
 
-    print(f"   ✅ Found {len(schemas)} schema(s)")
+    result["duration"] = time.perf_counter() - started
+    return result
 
-    all_issues = []
 
-    # Validate each schema
-    for i, schema in enumerate(schemas, 1):
-        schema_type = schema.get("@type", "Unknown")
-        print(f"   📋 Schema {i}: {schema_type}")
+def validate_page_task(task) -> Dict:
+    """Worker entry point: (lang, page, rules)."""
+    lang, page, rules = task
+    return validate_page(get_language_path(lang) / page, page, lang, rules)
 
-        issues = validate_schema_structure(schema)
 
-        if issues:
-            print(f"      ⚠️  {len(issues)} issue(s) found:")
-            for issue in issues:
+def print_page_result(result: Dict):
+    """Print one page's validation result."""
+    print(f"\n📄 Validating: {result['page']}")
+
+    for error in result["errors"]:
+        print(f"   ⚠️  {error}")
+
+    if result["missing_types"]:
+        print(f"   ❌ Missing required schema: {', '.join(result['missing_types'])}")
+
+    if not result["schemas"]:
+        if not result["errors"]:
+            print(f"   ⚠️  No structured data found")
+        return
+
+    print(f"   ✅ Found {len(result['schemas'])} schema(s)")
+
+    for i, schema in enumerate(result["schemas"], 1):
+        print(f"   📋 Schema {i}: {schema['type']}")
+        if schema["issues"]:
+            print(f"      ⚠️  {len(schema['issues'])} issue(s) found:")
+            for issue in schema["issues"]:
                 print(f"         • {issue}")
-                all_issues.append((relative_path, schema_type, issue))
         else:
             print(f"      ✅ Valid")
 
-    return all_issues
 
+def collect_issues(results: List[Dict]) -> List[Tuple[str, str, str]]:
+    """Flatten results into (file, schema type, issue) tuples."""
+    issues = []
+    for result in results:
+        for schema in result["schemas"]:
+            for issue in schema["issues"]:
+                issues.append((result["file"], str(schema["type"]), issue))
+    return issues
+
+
+def find_pages(page_index: PageIndex, lang: str) -> List[str]:
+    """All pages to validate in a language (backups excluded)."""
+    return [page for page in page_index.pages_for(lang)
+            if 'backup' not in page.rsplit("/", 1)[-1].lower()]
 
-def validate_all_pages(lang_code=None, specific_page=None):
-    """Validate all pages or specific pages."""
+
+def validate_all_pages(lang_code=None, specific_page=None, jobs=1,
+                       rules: Callable = validate_schema_structure) -> List[Dict]:
+    """Validate all pages or specific pages. Returns one result per page."""
     print(f"\n{'='*70}")
     print(f"Structured Data Validation")
     print(f"{'='*70}")
 
-    all_issues = []
-    pages_validated = 0
-    pages_with_issues = 0
+    started = time.perf_counter()
 
     # Determine which languages to process
     languages = [lang_code] if lang_code else LANGUAGES
 
+    # One walk over the site finds every language's pages
+    page_index = PageIndex.build(ROOT_DIR, LANGUAGES)
+
+    # Plan the run: per-language headers and the pages to validate
+    plan = []
+    tasks = []
     for lang in languages:
         lang_dir = get_language_path(lang)
 
         if not lang_dir.exists():
-            print(f"\n⚠️  Language directory not found: {lang}")
+            plan.append(f"\n⚠️  Language directory not found: {lang}")
             continue
 
-        print(f"\n🌍 Language: {lang.upper()}")
+        plan.append(f"\n🌍 Language: {lang.upper()}")
 
         # Determine which pages to validate
-        if specific_page:
-            pages = [specific_page]
-        else:
-            # Find all HTML files
-            pages = []
-            for root, dirs, files in os.walk(lang_dir):
-                dirs[:] = [d for d in dirs if not d.startswith('.')]
-                for file in files:
-                    if file.endswith('.html') and 'backup' not in file.lower():
-                        file_path = Path(root) / file
-                        relative_path = file_path.relative_to(lang_dir)
-                        pages.append(str(relative_path))
-
-        # Validate pages
+        pages = [specific_page] if specific_page else find_pages(page_index, lang)
+
         for page in pages:
-            file_path = lang_dir / page
-            if not file_path.exists():
-                print(f"\n⚠️  File not found: {page}")
+            if not page_index.has(lang, page):
+                plan.append(f"\n⚠️  File not found: {page}")
                 continue
+            plan.append(len(tasks))
+            tasks.append((lang, page, rules))
+
+    results = map_files(validate_page_task, tasks, jobs)
 
-            issues = validate_page(file_path, page)
-            pages_validated += 1
+    for step in plan:
+        if isinstance(step, int):
+            print_page_result(results[step])
+        else:
+            print(step)
 
-            if issues:
-                pages_with_issues += 1
-                all_issues.extend(issues)
+    all_issues = collect_issues(results)
+    pages_with_issues = sum(1 for result in results if result["issue_count"])
+    pages_missing = [result for result in results if result["missing_types"]]
 
     # Summary
     print(f"\n{'='*70}")
     print(f"Validation Summary")
     print(f"{'='*70}")
-    print(f"📊 Pages validated: {pages_validated}")
+    print(f"📊 Pages validated: {len(results)}")
     print(f"⚠️  Pages with issues: {pages_with_issues}")
     print(f"❌ Total issues: {len(all_issues)}")
+    print(f"🧩 Pages missing required schemas: {len(pages_missing)}")
+    print(f"⏱️  Time: {time.perf_counter() - started:.2f}s")
 
     if all_issues:
         print(f"\n📋 Issues by page:")
@@ -242,9 +361,152 @@ def validate_all_pages(lang_code=None, specific_page=None):
     else:
         print(f"\n✨ All structured data is valid!")
 
+    print_required_matrix(results)
+
     print(f"\n{'='*70}\n")
 
-    return all_issues
+    return results
+
+
+def required_schema_matrix(results: List[Dict]) -> Dict[str, Dict[str, Optional[List[str]]]]:
+    """
+    page -> {lang: missing types} for every page REQUIRED_SCHEMAS applies to.
+    An empty list means complete; a language without the page is left out.
+    """
+    matrix: Dict[str, Dict[str, Optional[List[str]]]] = {}
+    for result in results:
+        if result["required_types"]:
+            matrix.setdefault(result["page"], {})[result["lang"]] = result["missing_types"]
+    return dict(sorted(matrix.items()))
+
+
+def print_required_matrix(results: List[Dict]):
+    """Print required schema coverage as a page x language matrix."""
+    matrix = required_schema_matrix(results)
+    if not matrix:
+        return
+
+    languages = [lang for lang in LANGUAGES if any(lang in row for row in matrix.values())]
+    width = max(len(page) for page in matrix) + 2
+
+    print(f"\n📊 Required schemas by language (✓ present, ✗ missing, - no page)\n")
+    print("   " + "Page".ljust(width) + " ".join(lang.ljust(3) for lang in languages).rstrip())
+    for page, row in matrix.items():
+        cells = []
+        for lang in languages:
+            if lang not in row:
+                cells.append("-".ljust(3))
+            else:
+                cells.append(("✗" if row[lang] else "✓").ljust(3))
+        print("   " + page.ljust(width) + " ".join(cells).rstrip())
+
+    missing = [(page, lang, types) for page, row in matrix.items()
+               for lang, types in row.items() if types]
+    if missing:
+        print(f"\n   Missing:")
+        for page, lang, types in missing:
+            file = get_language_path(lang).joinpath(page).relative_to(ROOT_DIR).as_posix()
+            print(f"      {file}: {', '.join(types)}")
+
+
+def summarize(results: List[Dict]) -> Dict:
+    """Totals for machine-readable reports."""
+    return {
+        "pages_validated": len(results),
+        "pages_with_issues": sum(1 for r in results if r["issue_count"]),
+        "pages_without_schema": sum(1 for r in results if not r["schemas"]),
+        "schemas": sum(len(r["schemas"]) for r in results),
+        "total_issues": sum(r["issue_count"] for r in results),
+        "pages_missing_required": sum(1 for r in results if r["missing_types"]),
+        "errors": sum(len(r["errors"]) for r in results),
+    }
+
+
+def write_text_report(results: List[Dict], report_path: Path):
+    """Plain-text report (issues grouped by page)."""
+    issues = collect_issues(results)
+    with open(report_path, 'w') as f:
+        f.write("TVMaster VIP - Structured Data Validation Report\n")
+        f.write("=" * 70 + "\n\n")
+        f.write(f"Total issues found: {len(issues)}\n\n")
+
+        missing = [r for r in results if r["missing_types"]]
+        if missing:
+            f.write("Pages missing required schemas:\n")
+            for result in missing:
+                f.write(f"  {result['file']}: {', '.join(result['missing_types'])}\n")
+            f.write("\n")
+
+        if issues:
+            current_page = None
+            for page, schema_type, issue in issues:
+                if page != current_page:
+                    f.write(f"\n{page}\n")
+                    current_page = page
+                f.write(f"  [{schema_type}] {issue}\n")
+
+
+def write_json_report(results: List[Dict], report_path: Path):
+    """JSON report with a summary and every page result, for dashboards."""
+    report = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "summary": summarize(results),
+        "required_schemas": required_schema_matrix(results),
+        "pages": [
+            {key: value for key, value in result.items() if key != "duration"}
+            for result in results
+        ],
+    }
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def write_junit_report(results: List[Dict], report_path: Path):
+    """JUnit-XML report: one test suite per language, one test case per page."""
+    suites = ET.Element("testsuites", name="structured-data")
+    by_lang: Dict[str, ET.Element] = {}
+
+    for result in results:
+        lang = result["lang"]
+        if lang not in by_lang:
+            by_lang[lang] = ET.SubElement(suites, "testsuite", name=f"structured-data.{lang}")
+        suite = by_lang[lang]
+
+        case = ET.SubElement(suite, "testcase", classname=f"structured-data.{lang}",
+                             name=result["page"], time=f"{result['duration']:.4f}")
+        if result["errors"]:
+            error = ET.SubElement(case, "error", message=result["errors"][0])
+            error.text = "\n".join(result["errors"])
+        # One <failure> per test case: many consumers only read the first
+        messages, lines = [], []
+        if result["issue_count"]:
+            messages.append(f"{result['issue_count']} structured data issue(s)")
+            lines.extend(f"[{schema['type']}] {issue}"
+                         for schema in result["schemas"] for issue in schema["issues"])
+        if result["missing_types"]:
+            messages.append(f"Missing required schema: {', '.join(result['missing_types'])}")
+            lines.append(f"Required: {', '.join(result['required_types'])}")
+        if messages:
+            failure = ET.SubElement(case, "failure", message="; ".join(messages))
+            failure.text = "\n".join(lines)
+
+    total = {"tests": 0, "failures": 0, "errors": 0, "time": 0.0}
+    for suite in by_lang.values():
+        cases = suite.findall("testcase")
+        counts = {
+            "tests": len(cases),
+            "failures": sum(1 for c in cases if c.find("failure") is not None),
+            "errors": sum(1 for c in cases if c.find("error") is not None),
+            "time": sum(float(c.get("time")) for c in cases),
+        }
+        for key, value in counts.items():
+            suite.set(key, f"{value:.4f}" if key == "time" else str(value))
+            total[key] += value
+    for key, value in total.items():
+        suites.set(key, f"{value:.4f}" if key == "time" else str(value))
+
+    ET.indent(suites)
+    ET.ElementTree(suites).write(report_path, encoding="UTF-8", xml_declaration=True)
 
 
 def generate_test_urls(output_file="schema-test-urls.txt"):
@@ -304,12 +566,21 @@ def main():
         "-r",
         help="Save validation report to file"
     )
+    parser.add_argument(
+        "--json",
+        help="Save a JSON report (summary and per-page results) to file"
+    )
+    parser.add_argument(
+        "--junit",
+        help="Save a JUnit-XML report to file"
+    )
     parser.add_argument(
         "--generate-test-urls",
         "-g",
         action="store_true",
         help="Generate list of URLs for Google Rich Results Test"
     )
+    add_jobs_argument(parser, default=0)
 
     args = parser.parse_args()
 
@@ -319,28 +590,27 @@ def main():
         return
 
     # Run validation
-    issues = validate_all_pages(args.lang, args.page)
+    results = validate_all_pages(args.lang, args.page, args.jobs)
 
-    # Save report if requested
+    # Save reports if requested
     if args.report:
         report_path = ROOT_DIR / args.report
-        with open(report_path, 'w') as f:
-            f.write("TVMaster VIP - Structured Data Validation Report\n")
-            f.write("=" * 70 + "\n\n")
-            f.write(f"Total issues found: {len(issues)}\n\n")
-
-            if issues:
-                current_page = None
-                for page, schema_type, issue in issues:
-                    if page != current_page:
-                        f.write(f"\n{page}\n")
-                        current_page = page
-                    f.write(f"  [{schema_type}] {issue}\n")
-
+        write_text_report(results, report_path)
         print(f"📄 Report saved to: {report_path}")
 
+    if args.json:
+        report_path = ROOT_DIR / args.json
+        write_json_report(results, report_path)
+        print(f"📄 JSON report saved to: {report_path}")
+
+    if args.junit:
+        report_path = ROOT_DIR / args.junit
+        write_junit_report(results, report_path)
+        print(f"📄 JUnit report saved to: {report_path}")
+
     # Exit code
-    sys.exit(0 if not issues else 1)
+    failed = any(result["issue_count"] or result["missing_types"] for result in results)
+    sys.exit(0 if not failed else 1)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
-"""Test language page accessibility"""
-import requests
+"""Test language page accessibility
+
+Usage:
+    python test_lang_pages.py            # against GitHub Pages
+    python test_lang_pages.py --offline  # against the files on disk
+"""
+import sys
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -11,21 +16,31 @@ BASE_URL = "https://eleven11zz.github.io/thesitez2"
 # Test each language page
 languages = ['de', 'fr', 'it', 'nl', 'no', 'sv', 'th']
 
-print("Testing language pages on GitHub Pages:\n")
+offline = '--offline' in sys.argv
+
+if offline:
+    from offline_links import SiteIndex
+    index = SiteIndex().build()
+
+    def get_status(path):
+        mapped = index.to_site_path('index.html', path)
+        return 200 if mapped and index.resolve(mapped[0]) else 404
+else:
+    import requests
+
+    def get_status(path):
+        return requests.get(f"{BASE_URL}{path}", headers=HEADERS, timeout=10).status_code
+
+print(f"Testing language pages {'on disk' if offline else 'on GitHub Pages'}:\n")
 print("=" * 70)
 
 for lang in languages:
-    url = f"{BASE_URL}/{lang}/"
-    url_with_index = f"{BASE_URL}/{lang}/index.html"
-
     try:
         # Test directory URL
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        status1 = response.status_code
+        status1 = get_status(f"/{lang}/")
 
         # Test with explicit index.html
-        response2 = requests.get(url_with_index, headers=HEADERS, timeout=10)
-        status2 = response2.status_code
+        status2 = get_status(f"/{lang}/index.html")
 
         print(f"/{lang}/")
         print(f"  ├─ /{lang}/ → {status1} {'✅' if status1 == 200 else '❌'}")
@@ -0,0 +1,22 @@
+"""Make the root and scripts/ modules importable, including hyphenated script names."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+SCRIPTS_DIR = ROOT_DIR / "scripts"
+
+for path in (ROOT_DIR, SCRIPTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+def load_script(relative_path: str, name: str):
+    """Import a script such as scripts/fetch-events.py under a module name."""
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, ROOT_DIR / relative_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
@@ -0,0 +1,41 @@
+from audit_translations import TranslationAuditor, scan_tokens
+
+
+def test_scan_tokens_by_kind():
+    tokens = scan_tokens("Hi ${name}, <b>{count}</b> new %s")
+    assert tokens["template"] == ("${name}",)
+    assert tokens["brace"] == ("{count}",)
+    assert tokens["printf"] == ("%s",)
+    assert tokens["tag"] == ("<b>", "</b>")
+
+
+def test_placeholder_inside_tag_is_extracted():
+    tokens = scan_tokens('<a href="{url}">Link</a>')
+    assert tokens["tag"] == ('<a href="{url}">', "</a>")
+    assert tokens["brace"] == ("{url}",)
+
+
+def test_control_character_inside_tag_is_reported():
+    assert scan_tokens("<b\x01>text</b>")["control"] == ("\x01",)
+    assert scan_tokens("<br\n/>")["control"] == ("\n",)
+
+
+def test_separator_inside_braces_is_reported():
+    assert scan_tokens("{name }")["separator"] == (" ",)
+
+
+def test_placeholder_mismatch_inside_tag(tmp_path):
+    config = tmp_path / "languages.json"
+    config.write_text(
+        '{"default_language": "en", "languages": {'
+        '"en": {"link": "<a href=\\"{url}\\">Read</a>"},'
+        '"de": {"link": "<a href=\\"{link}\\">Lesen</a>"}}}',
+        encoding="utf-8",
+    )
+    auditor = TranslationAuditor(str(config))
+    assert auditor.load_data()
+    auditor.build_table()
+    auditor.audit_language("de")
+
+    mismatches = auditor.issues["de"]["placeholder_mismatch"]
+    assert mismatches == [{"key": "link", "expected": ["{url}"], "found": ["{link}"]}]
@@ -0,0 +1,37 @@
+from build_manifest import BuildManifest
+
+
+def test_recorded_file_is_fresh_until_changed(tmp_path):
+    manifest_file = tmp_path / "manifest.json"
+    page = tmp_path / "index.html"
+    page.write_text("<html></html>", encoding="utf-8")
+
+    manifest = BuildManifest.load("test", "1", path=manifest_file)
+    assert not manifest.is_fresh(page)
+    manifest.record(page)
+    manifest.save()
+
+    reloaded = BuildManifest.load("test", "1", path=manifest_file)
+    assert reloaded.is_fresh(page)
+    assert not BuildManifest.load("test", "2", path=manifest_file).is_fresh(page)
+    assert not BuildManifest.load("test", "1", path=manifest_file, force=True).is_fresh(page)
+
+    page.write_text("<html><body></body></html>", encoding="utf-8")
+    assert not reloaded.is_fresh(page)
+
+
+def test_dependencies_and_values(tmp_path):
+    page = tmp_path / "index.html"
+    image = tmp_path / "logo.png"
+    page.write_text("<img>", encoding="utf-8")
+    image.write_bytes(b"png")
+
+    manifest = BuildManifest("test", "1", path=tmp_path / "manifest.json")
+    manifest.record(page, deps=[image], values={"config:site.url": "abc"})
+
+    assert manifest.is_fresh(page, lambda name: "abc")
+    assert not manifest.is_fresh(page, lambda name: "def")
+    assert not manifest.is_fresh(page)
+
+    image.write_bytes(b"png, but larger")
+    assert not manifest.is_fresh(page, lambda name: "abc")
@@ -0,0 +1,25 @@
+from dependency_tracker import TrackedConfig, config_digest
+
+CONFIG = {"languages": {"fr": {"seo": {"faq": {"title": "FAQ"}}, "name": "Français"}}}
+
+
+def test_reads_are_recorded_by_dotted_path():
+    tracked = TrackedConfig(CONFIG)
+    assert tracked["languages"]["fr"]["seo"]["faq"]["title"] == "FAQ"
+    assert tracked["languages"]["fr"].get("missing", "default") == "default"
+
+    assert tracked.reads == {
+        "languages.fr.seo.faq.title": config_digest(CONFIG, "languages.fr.seo.faq.title"),
+        "languages.fr.missing": None,
+    }
+
+
+def test_digest_changes_with_value_and_key_list():
+    changed = {"languages": {"fr": {"seo": {"faq": {"title": "Questions"}}, "name": "Français"}}}
+    assert config_digest(CONFIG, "languages.fr.seo.faq.title") != config_digest(changed, "languages.fr.seo.faq.title")
+    assert config_digest(CONFIG, "languages.fr.name") == config_digest(changed, "languages.fr.name")
+
+    tracked = TrackedConfig(CONFIG)
+    list(tracked["languages"])
+    assert tracked.reads == {"languages": config_digest(CONFIG, "languages")}
+    assert config_digest({"languages": {"fr": {}, "de": {}}}, "languages") != tracked.reads["languages"]
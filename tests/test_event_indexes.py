@@ -0,0 +1,33 @@
+from event_indexes import build_indexes, index_key
+
+
+def event(event_id, date, home, away, stations=(), utc_time="19:00:00"):
+    return {"id": event_id, "start": {"utc": f"{date}T{utc_time}Z", "date": date},
+            "homeTeam": {"name": home}, "awayTeam": {"name": away}, "tvStations": list(stations)}
+
+
+def test_index_key():
+    assert index_key("Manchester United") == "manchester-united"
+    assert index_key("  Sky Sports / HD ") == "sky-sports-hd"
+    assert index_key("Bayern München") == "bayern-münchen"
+
+
+def test_build_indexes():
+    data = {"leagues": [
+        {"slug": "premier-league", "sport": "Soccer", "events": [
+            event("2", "2025-11-26", "Arsenal", "Chelsea", ["Sky Sports"]),
+            event("1", "2025-11-25", "Liverpool", "Arsenal", ["Sky Sports", "NBC"]),
+        ]},
+        {"slug": "uefa-champions-league", "sport": "Soccer", "events": [
+            event("1", "2025-11-25", "Liverpool", "Arsenal"),
+        ]},
+        {"slug": "nba", "sport": "Basketball", "events": []},
+    ]}
+
+    indexes = build_indexes(data)
+
+    assert indexes["teams"]["arsenal"] == ["1", "2"]
+    assert indexes["dates"] == {"2025-11-25": ["1"], "2025-11-26": ["2"]}
+    assert indexes["stations"] == {"nbc": ["1"], "sky-sports": ["1", "2"]}
+    assert indexes["sports"] == {"basketball": ["nba"], "soccer": ["premier-league", "uefa-champions-league"]}
+    assert indexes["events"]["1"] == ["2025-11-25", ["premier-league", "uefa-champions-league"]]
@@ -0,0 +1,61 @@
+import json
+
+from conftest import load_script
+from event_shards import check_day_shard, write_shards
+
+fetch_events = load_script("scripts/fetch-events.py", "fetch_events")
+
+
+def league(slug, events):
+    return {"leagueId": "1", "slug": slug, "label": slug.title(), "sport": "Soccer", "events": events}
+
+
+def event(event_id, date, time="19:45:00"):
+    return {"id": event_id, "start": {"utc": f"{date}T{time}Z", "date": date, "time": time}}
+
+
+def feed(*leagues):
+    return {"generatedAt": "2025-11-25T01:23:00Z", "source": "TheSportsDB", "leagues": list(leagues)}
+
+
+def test_shards_and_manifest(tmp_path):
+    data = feed(league("nba", [event("1", "2025-11-25"), event("2", "2025-11-26")]),
+                league("nfl", [event("3", "2025-11-25")]))
+
+    stats = write_shards(data, tmp_path)
+
+    assert stats["leagues"] == 2 and stats["days"] == 2
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert manifest["totalEvents"] == 3
+    assert manifest["days"]["2025-11-25"]["events"] == 2
+    assert manifest["days"]["2025-11-25"]["leagues"] == ["nba", "nfl"]
+    day = json.loads((tmp_path / "day" / "2025-11-25.json").read_text())
+    assert [e["id"] for lg in day["leagues"] for e in lg["events"]] == ["1", "3"]
+
+
+def test_unchanged_shards_are_not_rewritten_and_stale_ones_removed(tmp_path):
+    write_shards(feed(league("nba", [event("1", "2025-11-24"), event("2", "2025-11-25")])), tmp_path)
+
+    stats = write_shards(feed(league("nba", [event("2", "2025-11-25")])), tmp_path)
+
+    assert not (tmp_path / "day" / "2025-11-24.json").exists()
+    assert stats["removed"] == 1
+    again = write_shards(feed(league("nba", [event("2", "2025-11-25")])), tmp_path)
+    assert again["written"] == 0
+
+
+def test_todays_shard_exists_for_events_later_today(tmp_path):
+    now = fetch_events.datetime(2025, 11, 25, 1, 23)
+    results = {fetch_events.LEAGUES_CONFIG[0]["slug"]: [event("late", "2025-11-25", "23:59:00")]}
+    data = fetch_events.build_events_data(results, None, now)
+
+    write_shards(data, tmp_path)
+
+    assert (tmp_path / "day" / "2025-11-25.json").exists()
+    assert check_day_shard(data, tmp_path, "2025-11-25") is None
+
+
+def test_check_day_shard_reports_missing_shard(tmp_path):
+    data = feed(league("nba", [event("1", "2025-11-25")]))
+    assert "missing" in check_day_shard(data, tmp_path, "2025-11-25")
+    assert check_day_shard(data, tmp_path, "2025-11-26") is None
@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from conftest import load_script
+
+fetch_events = load_script("scripts/fetch-events.py", "fetch_events")
+
+NOW = datetime(2025, 11, 25, 1, 23)
+
+
+def event(event_id, date, time="19:45:00", title="Home vs Away"):
+    start = {"utc": f"{date}T{time or '00:00:00'}Z", "date": date, "time": time or fetch_events.NO_TIME}
+    return {"id": event_id, "title": title, "start": start}
+
+
+def counts():
+    return {"added": 0, "updated": 0, "expired": 0, "kept": 0}
+
+
+def test_event_later_today_is_upcoming():
+    events = [event("late", "2025-11-25", "23:59:00"), event("done", "2025-11-25", "01:00:00")]
+    assert [e["id"] for e in fetch_events.filter_upcoming_events(events, now=NOW)] == ["late"]
+
+
+def test_event_without_time_lasts_its_whole_day():
+    events = [event("today", "2025-11-25", None), event("yesterday", "2025-11-24", None)]
+    assert [e["id"] for e in fetch_events.filter_upcoming_events(events, now=NOW)] == ["today"]
+
+
+def test_cutoff_uses_start_time():
+    events = [event("in", "2025-12-10", "01:00:00"), event("out", "2025-12-10", "02:00:00")]
+    kept = fetch_events.filter_upcoming_events(events, days=15, now=NOW)
+    assert [e["id"] for e in kept] == ["in"]
+
+
+def test_merge_upserts_and_expires():
+    previous = [event("old", "2025-11-24"), event("same", "2025-11-26"),
+                event("changed", "2025-11-27"), event("only-before", "2025-11-28")]
+    fetched = [event("same", "2025-11-26"), event("changed", "2025-11-27", "20:00:00"),
+               event("new", "2025-11-25", "23:59:00")]
+    tally = counts()
+
+    merged = fetch_events.merge_league_events(previous, fetched, tally, NOW)
+
+    assert [e["id"] for e in merged] == ["new", "same", "changed", "only-before"]
+    assert merged[2]["start"]["time"] == "20:00:00"
+    assert tally == {"added": 1, "updated": 1, "expired": 1, "kept": 0}
+
+
+def test_failed_league_keeps_todays_last_known_good_events():
+    league = fetch_events.LEAGUES_CONFIG[0]
+    previous = {"leagues": [{"slug": league["slug"],
+                             "events": [event("tonight", "2025-11-25", "23:59:00"),
+                                        event("yesterday", "2025-11-24")]}]}
+
+    data = fetch_events.build_events_data({league["slug"]: None}, previous, NOW)
+
+    assert [lg["slug"] for lg in data["leagues"]] == [league["slug"]]
+    assert [e["id"] for e in data["leagues"][0]["events"]] == ["tonight"]
@@ -0,0 +1,55 @@
+import subprocess
+
+from git_lastmod import GitLastModified, read_history
+
+
+def git(root, *args, date="2025-01-01T00:00:00+00:00"):
+    env = {
+        "GIT_AUTHOR_NAME": "Test", "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test", "GIT_COMMITTER_EMAIL": "test@example.com",
+        "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date,
+        "GIT_CONFIG_GLOBAL": "/dev/null", "PATH": "/usr/bin:/bin:/usr/local/bin",
+    }
+    subprocess.run(["git", *args], cwd=root, env=env, check=True, capture_output=True)
+
+
+def page(body, modified):
+    return (f'<html>\n<meta property="article:modified_time" content="{modified}">\n'
+            f'<body>{body}</body>\n</html>\n')
+
+
+def test_date_only_commits_do_not_count(tmp_path):
+    git(tmp_path, "init", "-q")
+    (tmp_path / "index.html").write_text(page("Hello", "2025-01-01"), encoding="utf-8")
+    (tmp_path / "about.html").write_text(page("About", "2025-01-01"), encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("notes", encoding="utf-8")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "add", date="2025-01-01T00:00:00+00:00")
+
+    (tmp_path / "about.html").write_text(page("About us", "2025-02-01"), encoding="utf-8")
+    git(tmp_path, "commit", "-q", "-am", "content", date="2025-02-01T00:00:00+00:00")
+
+    for name in ("index.html", "about.html"):
+        (tmp_path / name).write_text(
+            (tmp_path / name).read_text(encoding="utf-8").replace("2025-0", "2025-1"),
+            encoding="utf-8")
+    git(tmp_path, "commit", "-q", "-am", "dates", date="2025-03-01T00:00:00+00:00")
+
+    assert read_history(tmp_path) == {
+        "index.html": "2025-01-01T00:00:00+00:00",
+        "about.html": "2025-02-01T00:00:00+00:00",
+    }
+
+
+def test_renamed_file_is_dirty(tmp_path):
+    git(tmp_path, "init", "-q")
+    (tmp_path / "old.html").write_text(page("Page", "2025-01-01"), encoding="utf-8")
+    (tmp_path / "other.html").write_text(page("Other", "2025-01-01"), encoding="utf-8")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "add")
+    git(tmp_path, "mv", "old.html", "new.html")
+
+    lastmod = GitLastModified(tmp_path, cache_file=None)
+    lastmod.load()
+    assert lastmod._dirty == {"new.html", "old.html"}
+    assert lastmod.isoformat("other.html") == "2025-01-01T00:00:00+00:00"
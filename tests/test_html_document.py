@@ -0,0 +1,35 @@
+from html_document import HtmlDocument
+
+
+def test_index_skips_comments_and_raw_text(tmp_path):
+    doc = HtmlDocument(tmp_path / "index.html",
+                       '<head><!-- <img src="old.png"> --></head>'
+                       '<body><script>var s = "<img src=x>";</script><img src="a.png"></body>')
+
+    assert [tag.get("src") for tag in doc.tags("img")] == ["a.png"]
+    assert doc.first("script").close_start is not None
+    assert doc.head_close == doc.content.index("</head>")
+
+
+def test_with_attrs_keeps_original_tag_text(tmp_path):
+    content = '<img src="a.png" /><img src="b.png"/><img src="c.png"><img src="d.png" loading="eager" />'
+    doc = HtmlDocument(tmp_path / "index.html", content)
+
+    count = doc.rewrite_tags("img", lambda tag: None if tag.has("loading")
+                             else tag.with_attrs('loading="lazy"'))
+
+    assert count == 3
+    assert doc.content == ('<img src="a.png" loading="lazy" /><img src="b.png" loading="lazy"/>'
+                           '<img src="c.png" loading="lazy"><img src="d.png" loading="eager" />')
+    assert doc.tags("img")[0].with_attrs("") == '<img src="a.png" loading="lazy" />'
+
+
+def test_save_writes_only_when_changed(tmp_path):
+    path = tmp_path / "index.html"
+    path.write_bytes(b'<body>\r\n<img src="a.png">\r\n</body>')
+    doc = HtmlDocument.load(path)
+    assert not doc.save()
+
+    doc.insert(doc.body_close, "<p></p>\r\n")
+    assert doc.save()
+    assert path.read_bytes() == b'<body>\r\n<img src="a.png">\r\n<p></p>\r\n</body>'
@@ -0,0 +1,89 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from http_fetch import FetchError, HttpClient, TokenBucket
+from response_cache import ResponseCache
+
+ETAG = '"v1"'
+
+
+class MockApi(BaseHTTPRequestHandler):
+    """/ok: JSON with an ETag, /flaky: 503 twice then 200, /down: always 503."""
+    protocol_version = "HTTP/1.1"
+    hits = {}
+    ports = set()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        hits = MockApi.hits[self.path] = MockApi.hits.get(self.path, 0) + 1
+        MockApi.ports.add(self.client_address[1])
+        if self.path == "/ok" and self.headers.get("If-None-Match") == ETAG:
+            self.reply(304, b"")
+        elif self.path == "/down" or (self.path == "/flaky" and hits <= 2):
+            self.reply(503, b"busy")
+        else:
+            self.reply(200, json.dumps({"path": self.path}).encode())
+
+    def reply(self, status, body):
+        self.send_response(status)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def api():
+    MockApi.hits, MockApi.ports = {}, set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockApi)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_token_bucket_spaces_requests():
+    bucket = TokenBucket(rate=20)
+    started = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    assert time.monotonic() - started >= 0.14
+
+
+def test_keep_alive_and_retries(api):
+    with HttpClient(rate=0, backoff=0.01) as client:
+        assert client.get_json(f"{api}/ok") == {"path": "/ok"}
+        assert client.get_json(f"{api}/flaky") == {"path": "/flaky"}
+
+    assert MockApi.hits["/flaky"] == 3
+    assert client.stats["retries"] == 2
+    assert len(MockApi.ports) == 1
+
+
+def test_retries_are_exhausted(api):
+    with HttpClient(rate=0, retries=1, backoff=0.01) as client:
+        with pytest.raises(FetchError, match="HTTP Error 503"):
+            client.get_json(f"{api}/down")
+    assert MockApi.hits["/down"] == 2
+
+
+def test_cache_serves_fresh_and_revalidates_stale(api, tmp_path):
+    url = f"{api}/ok"
+    with HttpClient(rate=0, cache=ResponseCache(tmp_path, max_age=60)) as client:
+        client.get_json(url)
+        fresh = client.get(url)
+    assert fresh.cache == "fresh"
+    assert MockApi.hits["/ok"] == 1
+
+    with HttpClient(rate=0, cache=ResponseCache(tmp_path, max_age=0)) as client:
+        revalidated = client.get(url)
+    assert revalidated.cache == "revalidated"
+    assert json.loads(revalidated.body) == {"path": "/ok"}
+    assert MockApi.hits["/ok"] == 2
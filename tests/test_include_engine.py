@@ -0,0 +1,59 @@
+from include_engine import END_MARKER, IncludeEngine, RenderTrace
+
+
+def engine(tmp_path, partials):
+    for name, text in partials.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return IncludeEngine(tmp_path)
+
+
+def test_bare_directive_becomes_region_and_rerenders(tmp_path):
+    includes = engine(tmp_path, {"header.html": "<h1>{{TITLE}}</h1>"})
+    page = "<body>{% include 'header.html' %}</body>"
+
+    rendered, errors = includes.render_page(page, {"TITLE": "Home"})
+    assert errors == []
+    assert rendered == f"<body><!-- {{% include 'header.html' %}} -->\n<h1>Home</h1>\n{END_MARKER}</body>"
+
+    (tmp_path / "header.html").write_text("<h2>{{TITLE}}</h2>", encoding="utf-8")
+    rerendered, _ = IncludeEngine(tmp_path).render_page(rendered, {"TITLE": "Start"})
+    assert "<h2>Start</h2>" in rerendered and "<h1>" not in rerendered
+    assert IncludeEngine(tmp_path).render_page(rerendered, {"TITLE": "Start"})[0] == rerendered
+
+
+def test_params_nested_includes_and_language_override(tmp_path):
+    includes = engine(tmp_path, {
+        "card.html": "<div>{% include 'label.html' TEXT='{{NAME}}' %}</div>",
+        "label.html": "<span>{{NAME}}</span>",
+        "de/label.html": "<em>{{NAME}}</em>",
+    })
+    trace = RenderTrace()
+    page = "{% include 'card.html' NAME=\"Sport\" %}"
+
+    english, _ = includes.render_page(page, {})
+    german, _ = includes.render_page(page, {}, lang="de", trace=trace)
+
+    assert "<span>Sport</span>" in english
+    assert "<em>Sport</em>" in german
+    assert tmp_path / "de" / "label.html" in trace.partials
+    assert trace.placeholders == {"NAME"}
+
+
+def test_missing_partial_and_cycle_are_errors(tmp_path):
+    includes = engine(tmp_path, {"a.html": "{% include 'b.html' %}", "b.html": "{% include 'a.html' %}"})
+    page = "{% include 'missing.html' %}{% include 'a.html' %}"
+
+    rendered, errors = includes.render_page(page, {})
+
+    assert rendered == page
+    assert "Partial not found: missing.html" in errors
+    assert any(error.startswith("Circular include: a.html -> b.html -> a.html") for error in errors)
+
+
+def test_relative_links_follow_page_depth(tmp_path):
+    includes = engine(tmp_path, {"nav.html": '<a href="./faq.html"><img src="./assets/logo.png"></a>'})
+    rendered, _ = includes.render_page("{% include 'nav.html' %}", {}, site_prefix="../",
+                                       lang_prefix="./")
+    assert '<a href="./faq.html"><img src="../assets/logo.png"></a>' in rendered
@@ -0,0 +1,86 @@
+import pytest
+
+from schema_rules import PageTypeIndex, compile_rules, document_types, node_types
+
+
+def test_literal_and_wildcard_patterns():
+    index = PageTypeIndex({"index.html": ["Organization"], "blog/*.html": ["BlogPosting"]})
+    assert index.required_types("index.html") == {"Organization"}
+    assert index.required_types("blog/post.html") == {"BlogPosting"}
+    assert index.required_types("blog/2025/post.html") == set()
+    assert index.required_types("faq.html") == set()
+
+
+def test_overlapping_globs_union_their_types():
+    index = PageTypeIndex({
+        "blog/*.html": ["BlogPosting"],
+        "**/*.html": ["WebPage"],
+        "blog/complete-*.html": ["HowTo"],
+    })
+    assert index.required_types("blog/complete-guide.html") == {"BlogPosting", "WebPage", "HowTo"}
+    assert index.required_types("blog/news.html") == {"BlogPosting", "WebPage"}
+    assert index.required_types("de/index.html") == {"WebPage"}
+
+
+def test_literal_and_wildcard_overlap():
+    index = PageTypeIndex({"faq.html": ["FAQPage"], "*.html": ["WebPage"]})
+    assert index.required_types("faq.html") == {"FAQPage", "WebPage"}
+
+
+def validate(rules, node):
+    validators = compile_rules(rules)
+    issues = []
+    for schema_type in node_types(node):
+        if schema_type in validators:
+            validators[schema_type](node, issues)
+    return issues
+
+
+def test_required_properties():
+    rules = {"Event": {"required": ["name", "startDate"]}}
+    assert validate(rules, {"@type": "Event", "name": "Final"}) == [
+        "Missing required property 'startDate' for Event"
+    ]
+    assert validate(rules, {"@type": "Event", "name": "Final", "startDate": "2025-11-25"}) == []
+
+
+def test_extends_inherits_required_and_properties():
+    rules = {
+        "Thing": {"required": ["name"],
+                  "properties": {"image": {"object": "{type}: {prop} must be an object"}}},
+        "Product": {"extends": "Thing", "required": ["offers"]},
+    }
+    issues = validate(rules, {"@type": "Product", "image": "logo.png"})
+    assert issues == [
+        "Missing required property 'name' for Product",
+        "Missing required property 'offers' for Product",
+        "Product: image must be an object",
+    ]
+
+
+def test_nested_items_and_by_type():
+    rules = {"BreadcrumbList": {"properties": {"itemListElement": {
+        "array": "{prop} must be an array",
+        "items": {"required": ["position"], "missing": "Item {i} missing {prop}"},
+    }}}}
+    node = {"@type": "BreadcrumbList", "itemListElement": [{"position": 1}, {}]}
+    assert validate(rules, node) == ["Item 1 missing position"]
+    assert validate(rules, {"@type": "BreadcrumbList", "itemListElement": {}}) == [
+        "itemListElement must be an array"
+    ]
+
+    by_type = {"Event": {"by_type": {"SportsEvent": {"required": ["competitor"]}}}}
+    assert validate(by_type, {"@type": ["Event", "SportsEvent"]}) == [
+        "Missing required property 'competitor' for SportsEvent"
+    ]
+
+
+def test_circular_extends_is_rejected():
+    with pytest.raises(ValueError):
+        compile_rules({"A": {"extends": "B"}, "B": {"extends": "A"}})
+
+
+def test_document_types_reads_graph():
+    assert document_types({"@graph": [{"@type": "Organization"}, {"@type": ["WebSite", "Thing"]}]}) == {
+        "Organization", "WebSite", "Thing"
+    }
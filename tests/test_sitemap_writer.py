@@ -0,0 +1,82 @@
+import gzip
+
+import pytest
+
+from conftest import load_script
+from sitemap_writer import SitemapWriter
+
+sitemap_script = load_script("scripts/generate-comprehensive-sitemap.py", "generate_comprehensive_sitemap")
+
+BASE_URL = "https://web.tvmaster.vip"
+
+
+def write(path, count, **options):
+    with SitemapWriter(path, BASE_URL, **options) as writer:
+        for n in range(count):
+            writer.add(f"{BASE_URL}/page-{n}.html", lastmod="2025-11-10")
+    return writer
+
+
+def names(directory):
+    return sorted(path.name for path in directory.iterdir())
+
+
+def test_single_file(tmp_path):
+    writer = write(tmp_path / "sitemap.xml", 3)
+    assert names(tmp_path) == ["sitemap.xml"]
+    assert writer.index_file is None
+    assert (tmp_path / "sitemap.xml").read_text().count("<url>") == 3
+
+
+def test_shards_and_index(tmp_path):
+    writer = write(tmp_path / "sitemap.xml", 5, max_urls=2)
+    assert names(tmp_path) == ["sitemap-1.xml", "sitemap-2.xml", "sitemap-3.xml", "sitemap_index.xml"]
+    assert writer.urls_written == 5
+    index = (tmp_path / "sitemap_index.xml").read_text()
+    assert index.count("<sitemap>") == 3
+    assert f"{BASE_URL}/sitemap-3.xml" in index
+
+
+def test_other_layouts_are_kept_unless_clean(tmp_path):
+    write(tmp_path / "sitemap.xml", 3)
+    writer = write(tmp_path / "sitemap.xml", 3, max_urls=2)
+    assert names(tmp_path) == ["sitemap-1.xml", "sitemap-2.xml", "sitemap.xml", "sitemap_index.xml"]
+    assert writer.stale == [tmp_path / "sitemap.xml"]
+    assert writer.entry_point == tmp_path / "sitemap_index.xml"
+
+
+def test_clean_switch_to_sharded_removes_single_sitemap(tmp_path):
+    write(tmp_path / "sitemap.xml", 3)
+    write(tmp_path / "sitemap.xml", 3, max_urls=2, clean=True)
+    assert names(tmp_path) == ["sitemap-1.xml", "sitemap-2.xml", "sitemap_index.xml"]
+
+
+def test_clean_switch_to_single_removes_shards_and_index(tmp_path):
+    write(tmp_path / "sitemap.xml", 5, max_urls=2)
+    write(tmp_path / "sitemap.xml", 5, clean=True)
+    assert names(tmp_path) == ["sitemap.xml"]
+
+
+def test_clean_switch_to_gzip_removes_plain_sitemap(tmp_path):
+    (tmp_path / "sitemap-images.xml").write_text("<urlset/>")
+    write(tmp_path / "sitemap.xml", 3)
+    write(tmp_path / "sitemap.xml", 3, gzip_output=True, clean=True)
+    assert names(tmp_path) == ["sitemap-images.xml", "sitemap.xml.gz"]
+    with gzip.open(tmp_path / "sitemap.xml.gz", "rt", encoding="utf-8") as f:
+        assert f.read().count("<url>") == 3
+
+
+def test_robots_txt_follows_the_entry_point(tmp_path):
+    robots = tmp_path / "robots.txt"
+    robots.write_text(f"User-agent: *\nSitemap: {BASE_URL}/sitemap.xml\n"
+                      f"Sitemap: {BASE_URL}/sitemap-images.xml\n")
+
+    assert sitemap_script.update_robots_txt(write(tmp_path / "sitemap.xml", 3, max_urls=2))
+    assert robots.read_text() == (f"User-agent: *\nSitemap: {BASE_URL}/sitemap_index.xml\n"
+                                  f"Sitemap: {BASE_URL}/sitemap-images.xml\n")
+    assert not sitemap_script.update_robots_txt(write(tmp_path / "sitemap.xml", 3, max_urls=2))
+
+
+def test_rejects_non_positive_limits(tmp_path):
+    with pytest.raises(ValueError):
+        SitemapWriter(tmp_path / "sitemap.xml", BASE_URL, max_urls=0)
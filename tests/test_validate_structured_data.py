@@ -0,0 +1,44 @@
+import xml.etree.ElementTree as ET
+
+from conftest import load_script
+
+validate = load_script("scripts/validate-structured-data.py", "validate_structured_data")
+
+
+def result(**overrides):
+    base = {"lang": "en", "page": "index.html", "duration": 0.01, "errors": [],
+            "issue_count": 0, "schemas": [], "missing_types": [], "required_types": []}
+    return dict(base, **overrides)
+
+
+def test_junit_one_failure_per_page(tmp_path):
+    report = tmp_path / "junit.xml"
+    validate.write_junit_report([
+        result(issue_count=2, schemas=[{"type": "Event", "issues": ["Missing startDate"]},
+                                       {"type": "FAQPage", "issues": ["Missing mainEntity"]}]),
+        result(page="faq.html"),
+    ], report)
+
+    suites = ET.parse(report).getroot()
+    failures = suites.find("testsuite/testcase[@name='index.html']").findall("failure")
+    assert len(failures) == 1
+    assert failures[0].get("message") == "2 structured data issue(s)"
+    assert failures[0].text == "[Event] Missing startDate\n[FAQPage] Missing mainEntity"
+    assert suites.get("tests") == "2" and suites.get("failures") == "1"
+
+
+def test_junit_single_failure_covers_issues_and_missing_types(tmp_path):
+    report = tmp_path / "junit.xml"
+    validate.write_junit_report([
+        result(issue_count=1, schemas=[{"type": "Event", "issues": ["Missing startDate"]}],
+               missing_types=["FAQPage"], required_types=["FAQPage", "Organization"]),
+        result(page="faq.html"),
+    ], report)
+
+    suites = ET.parse(report).getroot()
+    failures = suites.find("testsuite/testcase[@name='index.html']").findall("failure")
+    assert len(failures) == 1
+    assert "1 structured data issue(s)" in failures[0].get("message")
+    assert "Missing required schema: FAQPage" in failures[0].get("message")
+    assert failures[0].text == "[Event] Missing startDate\nRequired: FAQPage, Organization"
+    assert suites.get("tests") == "2" and suites.get("failures") == "1"